@@ -0,0 +1 @@
+# Benchmarks for the SpokeAgent SDK against a local stand-in server
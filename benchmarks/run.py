@@ -0,0 +1,308 @@
+# Throughput and latency benchmarks for the sync, threaded and async clients
+"""
+Usage:
+
+    python -m benchmarks.run --requests 500 --concurrency 1,8,32 --latency 0.002 \\
+        --output results.json --baseline previous.json
+
+Each operation is measured per mode and concurrency level and reported as
+requests per second plus p50/p95/p99 latency in milliseconds. Results are
+written as JSON so runs can be compared across SDK versions (--baseline).
+"""
+import argparse
+import asyncio
+import json
+import math
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.async_client import AsyncSpokeAgentClient
+from spokeagent_sdk.errors import SpokeAgentError
+
+from .server import StubServer
+
+MODES = ("sync", "threaded", "async")
+OPERATIONS = ("register_agent", "get_token", "get_token_cached", "call_api")
+SCOPES = ["read:data"]
+ENDPOINT = "/api/bench/data"
+# The setup calls are retried so injected errors (--error-rate) only land on measured requests.
+SETUP_ATTEMPTS = 20
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(
+    mode: str,
+    operation: str,
+    concurrency: int,
+    latencies: List[float],
+    errors: int,
+    elapsed: float
+) -> Dict:
+    """Builds one result row; latencies are in seconds, reported in milliseconds."""
+    ordered = sorted(latencies)
+    total = len(latencies) + errors
+    return {
+        "mode": mode,
+        "operation": operation,
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 6),
+        "rps": round(total / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3)
+    }
+
+
+def _make_config(base_url: str, concurrency: int) -> SpokeAgentConfig:
+    size = max(10, concurrency)
+    return SpokeAgentConfig(base_url=base_url, api_key="benchmark", pool_maxsize=size)
+
+
+def _setup_sync(client: SpokeAgentClient) -> str:
+    """Registers the benchmark agent and primes its token, retrying transient failures."""
+    for attempt in range(1, SETUP_ATTEMPTS + 1):
+        try:
+            agent_id = client.register_agent("bench-setup")["id"]
+            client.get_token(agent_id, SCOPES)
+            return agent_id
+        except SpokeAgentError:
+            if attempt == SETUP_ATTEMPTS:
+                raise
+
+
+async def _setup_async(client: AsyncSpokeAgentClient) -> str:
+    """Async counterpart of _setup_sync()."""
+    for attempt in range(1, SETUP_ATTEMPTS + 1):
+        try:
+            agent_id = (await client.register_agent("bench-setup"))["id"]
+            await client.get_token(agent_id, SCOPES)
+            return agent_id
+        except SpokeAgentError:
+            if attempt == SETUP_ATTEMPTS:
+                raise
+
+
+def _sync_operation(client: SpokeAgentClient, operation: str, agent_id: str) -> Callable[[int], object]:
+    if operation == "register_agent":
+        return lambda i: client.register_agent(f"bench-{i}")
+    if operation == "get_token":
+        return lambda i: client.get_token(agent_id, SCOPES, force_refresh=True)
+    if operation == "get_token_cached":
+        return lambda i: client.get_token(agent_id, SCOPES)
+    if operation == "call_api":
+        return lambda i: client.call_api(ENDPOINT, agent_id=agent_id)
+    raise ValueError(f"Unknown operation: {operation}")
+
+
+def _async_operation(client: AsyncSpokeAgentClient, operation: str, agent_id: str):
+    if operation == "register_agent":
+        return lambda i: client.register_agent(f"bench-{i}")
+    if operation == "get_token":
+        return lambda i: client.get_token(agent_id, SCOPES, force_refresh=True)
+    if operation == "get_token_cached":
+        return lambda i: client.get_token(agent_id, SCOPES)
+    if operation == "call_api":
+        return lambda i: client.call_api(ENDPOINT, agent_id=agent_id)
+    raise ValueError(f"Unknown operation: {operation}")
+
+
+def bench_sync(base_url: str, operation: str, requests: int, concurrency: int, threaded: bool) -> Dict:
+    """Runs one operation on a shared SpokeAgentClient, sequentially or from a thread pool."""
+    with SpokeAgentClient(_make_config(base_url, concurrency)) as client:
+        agent_id = _setup_sync(client)
+        call = _sync_operation(client, operation, agent_id)
+        latencies: List[float] = []
+        errors = 0
+
+        def timed(i: int) -> Optional[float]:
+            started = time.perf_counter()
+            try:
+                call(i)
+            except Exception:
+                return None
+            return time.perf_counter() - started
+
+        started = time.perf_counter()
+        if threaded:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                outcomes = list(pool.map(timed, range(requests)))
+        else:
+            outcomes = [timed(i) for i in range(requests)]
+        elapsed = time.perf_counter() - started
+
+    for outcome in outcomes:
+        if outcome is None:
+            errors += 1
+        else:
+            latencies.append(outcome)
+    return summarize("threaded" if threaded else "sync", operation, concurrency if threaded else 1,
+                     latencies, errors, elapsed)
+
+
+async def _bench_async(base_url: str, operation: str, requests: int, concurrency: int) -> Dict:
+    async with AsyncSpokeAgentClient(_make_config(base_url, concurrency)) as client:
+        agent_id = await _setup_async(client)
+        call = _async_operation(client, operation, agent_id)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def timed(i: int) -> Optional[float]:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    await call(i)
+                except Exception:
+                    return None
+                return time.perf_counter() - started
+
+        started = time.perf_counter()
+        outcomes = await asyncio.gather(*(timed(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies = [outcome for outcome in outcomes if outcome is not None]
+    return summarize("async", operation, concurrency, latencies, len(outcomes) - len(latencies), elapsed)
+
+
+def bench_async(base_url: str, operation: str, requests: int, concurrency: int) -> Dict:
+    """Runs one operation on an AsyncSpokeAgentClient with at most concurrency requests in flight."""
+    return asyncio.run(_bench_async(base_url, operation, requests, concurrency))
+
+
+def run_suite(
+    base_url: str,
+    requests: int = 200,
+    concurrency_levels: Sequence[int] = (1, 8, 32),
+    modes: Sequence[str] = MODES,
+    operations: Sequence[str] = OPERATIONS
+) -> List[Dict]:
+    """
+    Runs every operation for every mode and concurrency level.
+
+    The "sync" mode is always sequential, so it runs once per operation
+    regardless of concurrency_levels.
+    """
+    results = []
+    for mode in modes:
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode}")
+        for operation in operations:
+            if operation not in OPERATIONS:
+                raise ValueError(f"Unknown operation: {operation}")
+            if mode == "sync":
+                results.append(bench_sync(base_url, operation, requests, 1, threaded=False))
+                continue
+            for concurrency in concurrency_levels:
+                if mode == "threaded":
+                    results.append(bench_sync(base_url, operation, requests, concurrency, threaded=True))
+                else:
+                    results.append(bench_async(base_url, operation, requests, concurrency))
+    return results
+
+
+def compare(baseline: List[Dict], current: List[Dict]) -> List[Dict]:
+    """
+    Matches rows by (mode, operation, concurrency) and reports relative
+    changes in rps and p95 (positive rps / negative p95 is an improvement).
+    """
+    index = {(row["mode"], row["operation"], row["concurrency"]): row for row in baseline}
+    changes = []
+    for row in current:
+        before = index.get((row["mode"], row["operation"], row["concurrency"]))
+        if before is None:
+            continue
+        changes.append({
+            "mode": row["mode"],
+            "operation": row["operation"],
+            "concurrency": row["concurrency"],
+            "rps_change": round(row["rps"] / before["rps"] - 1, 4) if before["rps"] else None,
+            "p95_change": round(row["p95_ms"] / before["p95_ms"] - 1, 4) if before["p95_ms"] else None
+        })
+    return changes
+
+
+def format_table(results: List[Dict]) -> str:
+    header = f"{'mode':<9}{'operation':<18}{'conc':>5}{'reqs':>7}{'errs':>6}{'rps':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    lines = [header, "-" * len(header)]
+    for row in results:
+        lines.append(
+            f"{row['mode']:<9}{row['operation']:<18}{row['concurrency']:>5}{row['requests']:>7}{row['errors']:>6}"
+            f"{row['rps']:>10.1f}{row['p50_ms']:>9.2f}{row['p95_ms']:>9.2f}{row['p99_ms']:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+def _csv(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the SpokeAgent SDK against a local stand-in server.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per operation and concurrency level.")
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated concurrency levels.")
+    parser.add_argument("--modes", default=",".join(MODES), help="Comma-separated modes: sync, threaded, async.")
+    parser.add_argument("--operations", default=",".join(OPERATIONS), help="Comma-separated operations.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Injected server latency in seconds.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random server latency in seconds.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of an injected 503.")
+    parser.add_argument("--base-url", help="Benchmark an existing server instead of the stand-in.")
+    parser.add_argument("--output", help="Write results as JSON to this file.")
+    parser.add_argument("--baseline", help="Compare against a previous JSON results file.")
+    args = parser.parse_args(argv)
+
+    settings = {
+        "requests": args.requests,
+        "concurrency": [int(level) for level in _csv(args.concurrency)],
+        "modes": _csv(args.modes),
+        "operations": _csv(args.operations),
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "error_rate": args.error_rate
+    }
+
+    def run(base_url: str) -> List[Dict]:
+        return run_suite(base_url, settings["requests"], settings["concurrency"],
+                         settings["modes"], settings["operations"])
+
+    if args.base_url:
+        results = run(args.base_url)
+    else:
+        with StubServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate) as server:
+            results = run(server.base_url)
+
+    print(format_table(results))
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": settings,
+        "results": results
+    }
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["comparison"] = compare(json.load(f)["results"], results)
+        for change in report["comparison"]:
+            print(f"{change['mode']:<9}{change['operation']:<18}{change['concurrency']:>5}"
+                  f"  rps {change['rps_change']:+.1%}  p95 {change['p95_change']:+.1%}"
+                  if change["rps_change"] is not None and change["p95_change"] is not None
+                  else f"{change['mode']:<9}{change['operation']:<18}{change['concurrency']:>5}  n/a")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
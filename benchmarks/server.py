@@ -0,0 +1,167 @@
+# Local, in-process stand-in for the SpokeAgent API
+import base64
+import itertools
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+
+def _b64(data: Dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode("utf-8")).decode("utf-8").rstrip("=")
+
+
+def make_token(agent_id: str, scopes, ttl: float) -> str:
+    """Builds an unsigned JWT with sub, scope, iat and exp claims."""
+    now = int(time.time())
+    payload = {"sub": agent_id, "scope": " ".join(scopes), "iat": now, "exp": now + int(ttl)}
+    return f"{_b64({'alg': 'none', 'typ': 'JWT'})}.{_b64(payload)}.benchmark"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY every
+    # response would stall on delayed ACKs and dominate the measurements.
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _read_json(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+
+    def _reply(self, status: int, body: Dict) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self, method: str) -> None:
+        stub = self.server.stub
+        body = self._read_json() if method == "POST" else {}
+        stub.count()
+        if stub.latency or stub.jitter:
+            time.sleep(stub.latency + random.random() * stub.jitter)
+        if stub.error_rate and random.random() < stub.error_rate:
+            self._reply(503, {"error": "injected failure"})
+            return
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            self._reply(401, {"error": "missing bearer"})
+            return
+
+        path = self.path.split("?", 1)[0]
+        if method == "POST" and path == "/api/agents/register":
+            self._reply(200, stub.new_agent(body.get("name"), body.get("metadata")))
+        elif method == "POST" and path == "/api/agents/register/batch":
+            agents = [stub.new_agent(spec.get("name"), spec.get("metadata")) for spec in body.get("agents", [])]
+            self._reply(200, {"agents": agents})
+        elif method == "POST" and path == "/api/agents/token":
+            self._reply(200, {"token": make_token(body.get("agent_id", ""), body.get("scopes") or [], stub.token_ttl)})
+        else:
+            self._reply(200, {"ok": True, "method": method, "path": path})
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+    stub: "StubServer"
+
+
+class StubServer:
+    """
+    Threaded HTTP server implementing the SpokeAgent endpoints the SDK uses.
+
+    - POST /api/agents/register and /api/agents/register/batch return new agent IDs.
+    - POST /api/agents/token returns an unsigned JWT valid for token_ttl seconds.
+    - Any other GET or POST path requires a bearer and echoes the method and path.
+
+    Every request first sleeps for latency (+ up to jitter) seconds and then
+    fails with 503 with probability error_rate.
+
+    Example usage:
+
+        with StubServer(latency=0.005) as server:
+            client = SpokeAgentClient(SpokeAgentConfig(base_url=server.base_url, api_key="bench"))
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        token_ttl: float = 3600,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """
+        Args:
+            latency (float): Seconds added to every response.
+            jitter (float): Extra random delay of up to this many seconds.
+            error_rate (float): Probability in [0, 1] of answering 503.
+            token_ttl (float): Lifetime of issued tokens in seconds.
+            host (str): Interface to bind.
+            port (int): Port to bind (0 picks a free port).
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.token_ttl = token_ttl
+        self.requests = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._address = (host, port)
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("StubServer is not running.")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def new_agent(self, name: Optional[str], metadata: Optional[Dict]) -> Dict:
+        with self._lock:
+            agent_id = f"agent-{next(self._ids)}"
+        return {"id": agent_id, "name": name, "metadata": metadata or {}}
+
+    def start(self) -> "StubServer":
+        self._server = _Server(self._address, _Handler)
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name="spokeagent-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
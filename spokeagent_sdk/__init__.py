@@ -17,13 +17,33 @@ Usage:
 """
 
 from .client import SpokeAgentClient
+from .async_client import AsyncSpokeAgentClient
 from .auth import AgentToken
 from .config import SpokeAgentConfig
-from .errors import SpokeAgentError
+from .errors import (
+    SpokeAgentError,
+    AgentRegistrationError,
+    TokenRequestError,
+    APIRequestError,
+    TokenVerificationError,
+    CircuitOpenError,
+    RateLimitExceededError,
+    RequestTimeoutError,
+    DeadlineExceededError
+)
 
 __all__ = [
     "SpokeAgentClient",
+    "AsyncSpokeAgentClient",
     "SpokeAgentConfig",
     "AgentToken",
-    "SpokeAgentError"
+    "SpokeAgentError",
+    "AgentRegistrationError",
+    "TokenRequestError",
+    "APIRequestError",
+    "TokenVerificationError",
+    "CircuitOpenError",
+    "RateLimitExceededError",
+    "RequestTimeoutError",
+    "DeadlineExceededError"
 ]
@@ -0,0 +1,881 @@
+# Asyncio client: register_agent, get_token, call_api as coroutines
+import asyncio
+import contextlib
+import httpx
+import json
+import time
+import weakref
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional, Dict, Tuple, Type
+
+from .auth import AgentToken
+from .bulk import (
+    BATCH_REGISTER_PATH,
+    BATCH_UNSUPPORTED_STATUSES,
+    AgentSpec,
+    CallResult,
+    CallSpec,
+    ProgressCallback,
+    RegistrationResult,
+    chunked,
+    normalize_agent_spec,
+    normalize_call_spec,
+    parse_batch_results
+)
+from .config import SpokeAgentConfig
+from .metrics import Sample, request_outcome
+from .pagination import DEFAULT_PREFETCH, CursorPaginator, Paginator, aprefetch_pages, awalk_pages, with_query
+from .projection import Projector, can_project_incrementally, is_large_body, validate_paths
+from .refresh import TokenRefresher
+from .registry import TokenRegistry
+from .singleflight import AsyncSingleFlight
+from .store import LOCK_MAX_POLL_INTERVAL, LOCK_POLL_INTERVAL, TokenStore, scopes_key
+from .streaming import DEFAULT_CHUNK_SIZE, parse_ndjson_line, validate_stream_mode
+from .timeouts import Deadline, DeadlineSpec, TimeoutSpec, resolve_timeout
+from .token_cache import TokenCache
+from .utils import project
+from .errors import (
+    SpokeAgentError,
+    AgentRegistrationError,
+    TokenRequestError,
+    APIRequestError,
+    DeadlineExceededError,
+    RequestTimeoutError
+)
+
+
+class AsyncSpokeAgentClient:
+    """
+    Asyncio counterpart of SpokeAgentClient.
+
+    Example usage:
+
+        async with AsyncSpokeAgentClient(config) as client:
+            agent = await client.register_agent("my-agent")
+            await client.get_token(agent["id"], scopes=["read:data"])
+            response = await client.call_api("/secure/data", method="GET")
+    """
+
+    def __init__(self, config: SpokeAgentConfig, transport: Optional[httpx.AsyncBaseTransport] = None):
+        """
+        Initialize the async SpokeAgent client.
+
+        The client owns a pooled httpx.AsyncClient sized from the same config
+        fields as the sync client. Call aclose() (or use the client as an
+        async context manager) to release its connections.
+
+        Args:
+            config (SpokeAgentConfig): Configuration object with base_url and API key.
+            transport (httpx.AsyncBaseTransport): Optional custom transport (e.g. for tests).
+        """
+        self.config = config
+        self.base_url = config.base_url.rstrip("/")
+        self.api_key = config.api_key
+        self.token: Optional[str] = None
+        self.tokens = TokenRegistry()
+        self.token_cache: Optional[TokenCache] = None
+        if config.token_cache_size > 0:
+            self.token_cache = TokenCache(config.token_cache_size, config.token_expiry_skew)
+        self._token_flight = AsyncSingleFlight()
+        self._agent_flight = AsyncSingleFlight()
+        self.refresher: Optional[TokenRefresher] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        if config.proactive_refresh:
+            self.refresher = TokenRefresher(self._refresh_token_threadsafe, config.refresh_fraction)
+        self._batch_register_supported: Optional[bool] = None
+        self.session = self._build_session(transport)
+        self._metrics_collector: Optional[weakref.WeakMethod] = None
+        if config.metrics is not None:
+            self._metrics_collector = weakref.WeakMethod(self._collect_metrics)
+            config.metrics.add_collector(self._metrics_collector)
+
+    def _build_session(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> httpx.AsyncClient:
+        """
+        Creates the pooled async HTTP client used for every request.
+
+        httpx has no per-host pool, so the total pool is sized as
+        pool_connections * pool_maxsize; it is only a hard cap when
+        pool_block is set.
+        """
+        pool_size = self.config.pool_connections * self.config.pool_maxsize
+        limits = httpx.Limits(
+            max_connections=pool_size if self.config.pool_block else None,
+            max_keepalive_connections=pool_size if self.config.keep_alive else 0
+        )
+        return httpx.AsyncClient(limits=limits, transport=transport)
+
+    async def aclose(self) -> None:
+        """Stops background refresh and closes the client and all pooled connections."""
+        if self.refresher is not None:
+            self.refresher.stop(wait=False)
+        if self._metrics_collector is not None:
+            self.config.metrics.remove_collector(self._metrics_collector)
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncSpokeAgentClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    def _collect_metrics(self) -> List[Sample]:
+        """
+        Reports connection pool usage per host and token cache counters to
+        config.metrics. Pool gauges are only available with httpx's default
+        transport.
+        """
+        samples: List[Sample] = []
+        pool = getattr(getattr(self.session, "_transport", None), "_pool", None)
+        per_host: Dict[str, List[int]] = {}
+        for connection in getattr(pool, "connections", ()):
+            origin = getattr(connection, "_origin", None)
+            host = f"{origin.host.decode('ascii')}:{origin.port}" if origin is not None else ""
+            counts = per_host.setdefault(host, [0, 0])
+            counts[0 if connection.is_idle() else 1] += 1
+        for host, (idle, in_use) in per_host.items():
+            samples.append(("pool_connections_idle", {"host": host}, idle))
+            samples.append(("pool_connections_in_use", {"host": host}, in_use))
+        if self.token_cache is not None:
+            stats = self.token_cache.stats()
+            for name in ("hits", "misses", "evictions", "size"):
+                samples.append((f"token_cache_{name}", {}, stats[name]))
+        return samples
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        error_cls: Type[SpokeAgentError],
+        error_message: str,
+        operation: str = "request",
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Sends one logical request (see _send_attempts()) and, when
+        config.metrics is set, records its outcome and total latency under
+        `operation`.
+        """
+        metrics = self.config.metrics
+        if metrics is None:
+            return await self._send_attempts(method, url, error_cls, error_message, operation, **kwargs)
+        started = time.monotonic()
+        try:
+            response = await self._send_attempts(method, url, error_cls, error_message, operation, **kwargs)
+        except SpokeAgentError as e:
+            metrics.observe_request(operation, httpx.URL(url).path, method, request_outcome(e), time.monotonic() - started)
+            raise
+        metrics.observe_request(operation, httpx.URL(url).path, method, response.status_code, time.monotonic() - started)
+        return response
+
+    async def _send_attempts(
+        self,
+        method: str,
+        url: str,
+        error_cls: Type[SpokeAgentError],
+        error_message: str,
+        operation: str,
+        idempotent: Optional[bool] = None,
+        circuit_key: Optional[str] = None,
+        rate_key: Optional[Tuple[str, str]] = None,
+        timeout: TimeoutSpec = None,
+        deadline: Optional[Deadline] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Sends a request, retrying transient failures according to
+        config.retry_policy. Mirrors SpokeAgentClient._send_attempts(); pass
+        stream=True to get a response whose body has not been read yet.
+
+        Raises:
+            error_cls: If the request fails or returns an error status.
+            CircuitOpenError: If the circuit for circuit_key is open.
+            RateLimitExceededError: If config.rate_limiter refuses an attempt for rate_key.
+            RequestTimeoutError: If the last attempt timed out.
+            DeadlineExceededError: If the deadline ran out.
+        """
+        base_timeout = resolve_timeout(timeout, self.config.connect_timeout, self.config.read_timeout)
+        stream = kwargs.pop("stream", False)
+        policy = self.config.retry_policy
+        breaker = self.config.circuit_breaker if circuit_key else None
+        limiter = self.config.rate_limiter if rate_key else None
+        retryable = policy is not None and (idempotent if idempotent is not None else policy.allows_method(method))
+        max_attempts = policy.max_attempts if retryable else 1
+        metrics = self.config.metrics
+        attempt = 0
+
+        while True:
+            attempt += 1
+            attempt_timeout = base_timeout
+            if deadline is not None:
+                deadline.check(error_message, attempts=max(1, attempt - 1))
+                attempt_timeout = deadline.clamp(base_timeout, error_message)
+            if limiter is not None:
+                await limiter.acquire_async(*rate_key, max_wait=deadline.remaining() if deadline is not None else None)
+                if deadline is not None:
+                    deadline.check(error_message, attempts=max(1, attempt - 1))
+                    attempt_timeout = deadline.clamp(base_timeout, error_message)
+            if breaker is not None:
+                breaker.before_call(circuit_key)
+            started = time.monotonic()
+            try:
+                request = self.session.build_request(
+                    method, url,
+                    timeout=httpx.Timeout(attempt_timeout[1], connect=attempt_timeout[0]),
+                    **kwargs
+                )
+                response = await self.session.send(request, stream=stream)
+            except (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError) as e:
+                if breaker is not None:
+                    breaker.record(circuit_key, False, time.monotonic() - started)
+                delay = policy.compute_delay(attempt) if attempt < max_attempts else None
+                if delay is None or (deadline is not None and delay >= deadline.remaining()):
+                    if isinstance(e, httpx.TimeoutException):
+                        expired = deadline is not None and deadline.expired
+                        timeout_cls = DeadlineExceededError if expired else RequestTimeoutError
+                        raise timeout_cls(f"{error_message}: {str(e)}", attempts=attempt) from e
+                    raise error_cls(f"{error_message}: {str(e)}", attempts=attempt) from e
+                if metrics is not None:
+                    metrics.inc("retries_total", {"operation": operation})
+                await asyncio.sleep(delay)
+                continue
+            except httpx.HTTPError as e:
+                if breaker is not None:
+                    breaker.record(circuit_key, False, time.monotonic() - started)
+                raise error_cls(f"{error_message}: {str(e)}", attempts=attempt) from e
+            except BaseException:
+                # Cancelled or interrupted: no outcome to record, but a half-open trial slot must be freed.
+                if breaker is not None:
+                    breaker.release(circuit_key)
+                raise
+
+            if breaker is not None:
+                breaker.record(circuit_key, response.status_code < 500, time.monotonic() - started)
+            if limiter is not None:
+                limiter.record(*rate_key, response.status_code, response.headers.get("Retry-After"))
+
+            if attempt < max_attempts and policy.allows_status(response.status_code):
+                delay = policy.compute_delay(attempt, response.headers.get("Retry-After"))
+                if delay is not None and (deadline is None or delay < deadline.remaining()):
+                    await response.aclose()
+                    if metrics is not None:
+                        metrics.inc("retries_total", {"operation": operation})
+                    await asyncio.sleep(delay)
+                    continue
+
+            # Unlike requests, httpx also raises for 1xx/3xx; only treat 4xx/5xx as errors
+            # (a 304 Not Modified is a valid answer to a conditional request).
+            try:
+                if response.is_error:
+                    response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                await response.aclose()
+                raise error_cls(
+                    f"{error_message}: {str(e)}",
+                    status_code=response.status_code,
+                    attempts=attempt
+                ) from e
+            return response
+
+    async def register_agent(
+        self,
+        agent_name: str,
+        metadata: Optional[Dict] = None,
+        timeout: TimeoutSpec = None,
+        deadline: DeadlineSpec = None
+    ) -> Dict:
+        """
+        Registers an AI agent and returns its identity.
+
+        With config.token_store set, an identity stored for the same name
+        and metadata (by any process) is returned without a network call.
+        Store access runs in the default executor so the event loop never
+        blocks on disk or on another process's lock.
+
+        Args:
+            agent_name (str): Name of the agent.
+            metadata (dict): Optional metadata describing the agent.
+            timeout (float or tuple): Per-attempt timeout, or (connect, read);
+                defaults to config.connect_timeout / config.read_timeout.
+            deadline (float or Deadline): End-to-end budget in seconds.
+
+        Returns:
+            dict: Agent details from the API.
+
+        Raises:
+            AgentRegistrationError: If registration fails.
+            RequestTimeoutError: If the request times out or the deadline runs out.
+        """
+        deadline = Deadline.coerce(deadline)
+        store = self.config.token_store
+        if store is None:
+            return await self._register_agent(agent_name, metadata, timeout, deadline)
+
+        # Same-name registrations on this loop share one store lookup, so only
+        # one task per name ever waits on the cross-process lock.
+        key = (agent_name, json.dumps(metadata or {}, sort_keys=True, default=str))
+        try:
+            return await self._agent_flight.do(
+                key,
+                lambda: self._register_agent_stored(store, agent_name, metadata, timeout, deadline),
+                timeout=deadline.remaining() if deadline is not None else None
+            )
+        except TimeoutError as e:
+            raise DeadlineExceededError("Agent registration failed: deadline exceeded.") from e
+
+    async def _register_agent_stored(
+        self,
+        store: TokenStore,
+        agent_name: str,
+        metadata: Optional[Dict],
+        timeout: TimeoutSpec = None,
+        deadline: Optional[Deadline] = None
+    ) -> Dict:
+        """Registers an agent once across processes, reusing a stored identity if one exists."""
+        agent = await self._in_thread(store.get_agent, agent_name, metadata)
+        if agent is None:
+            async with self._store_lock(store, f"agent:{agent_name}", deadline):
+                agent = await self._in_thread(store.get_agent, agent_name, metadata)
+                if agent is None:
+                    agent = await self._register_agent(agent_name, metadata, timeout, deadline)
+                    await self._in_thread(store.put_agent, agent_name, metadata, agent)
+        return agent
+
+    async def _register_agent(
+        self,
+        agent_name: str,
+        metadata: Optional[Dict],
+        timeout: TimeoutSpec = None,
+        deadline: Optional[Deadline] = None
+    ) -> Dict:
+        """Registers an agent with /api/agents/register, bypassing the token store."""
+        url = f"{self.base_url}/api/agents/register"
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        payload = {
+            "name": agent_name,
+            "metadata": metadata or {}
+        }
+
+        response = await self._send("POST", url, AgentRegistrationError, "Agent registration failed", "register_agent",
+                                    timeout=timeout, deadline=deadline, json=payload, headers=headers)
+        try:
+            return response.json()
+        except ValueError as e:
+            raise AgentRegistrationError(f"Agent registration failed: {str(e)}") from e
+
+    async def register_agents(
+        self,
+        specs: Iterable[AgentSpec],
+        max_concurrency: int = 8,
+        batch_size: int = 100,
+        progress: Optional[ProgressCallback] = None
+    ) -> List[RegistrationResult]:
+        """
+        Registers many agents and returns their identities in input order.
+
+        Same semantics as SpokeAgentClient.register_agents(); the fan-out
+        runs as tasks bounded by a semaphore instead of a thread pool.
+
+        Args:
+            specs (iterable): Agent names, (name, metadata) tuples, or
+                {"name": ..., "metadata": ...} dicts.
+            max_concurrency (int): Maximum concurrent registrations for the fan-out.
+            batch_size (int): Agents per batch request.
+            progress (callable): Optional progress(done, total).
+
+        Returns:
+            list: Agent dicts, or the error (e.g. AgentRegistrationError or
+                RequestTimeoutError) for each agent that failed.
+        """
+        payloads = [normalize_agent_spec(spec) for spec in specs]
+        total = len(payloads)
+        results: List[Optional[RegistrationResult]] = [None] * total
+        done = 0
+
+        if self._batch_register_supported is not False:
+            for start, chunk in chunked(payloads, batch_size):
+                chunk_results = await self._register_batch(chunk)
+                if chunk_results is None:
+                    break
+                results[start:start + len(chunk)] = chunk_results
+                done += len(chunk)
+                if progress:
+                    progress(done, total)
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def register_one(index: int) -> None:
+            nonlocal done
+            async with semaphore:
+                try:
+                    results[index] = await self.register_agent(payloads[index]["name"], payloads[index]["metadata"])
+                except SpokeAgentError as e:
+                    results[index] = e
+            done += 1
+            if progress:
+                progress(done, total)
+
+        await asyncio.gather(*(register_one(i) for i in range(done, total)))
+        return results
+
+    async def _register_batch(self, chunk: List[Dict]) -> Optional[List[RegistrationResult]]:
+        """
+        Registers a chunk through the batch endpoint.
+
+        Returns:
+            list or None: Per-agent results, or None if the server has no batch endpoint.
+        """
+        url = f"{self.base_url}{BATCH_REGISTER_PATH}"
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+
+        try:
+            response = await self._send("POST", url, AgentRegistrationError, "Agent registration failed",
+                                        "register_agents", json={"agents": chunk}, headers=headers)
+            results = parse_batch_results(response.json(), len(chunk))
+        except SpokeAgentError as e:
+            if e.status_code in BATCH_UNSUPPORTED_STATUSES:
+                self._batch_register_supported = False
+                return None
+            return [e] * len(chunk)
+        except ValueError as e:
+            return [AgentRegistrationError(f"Agent registration failed: {str(e)}")] * len(chunk)
+        self._batch_register_supported = True
+        return results
+
+    async def get_token(
+        self,
+        agent_id: str,
+        scopes: List[str],
+        force_refresh: bool = False,
+        timeout: TimeoutSpec = None,
+        deadline: DeadlineSpec = None
+    ) -> str:
+        """
+        Retrieves a scoped token for the agent.
+
+        Tokens are served from the in-process cache while they remain valid,
+        then from config.token_store if set; a network round trip only
+        happens when both miss or when force_refresh is set. Concurrent
+        callers asking for the same agent and scopes share a single
+        in-flight request.
+
+        Args:
+            agent_id (str): Registered agent ID.
+            scopes (list of str): List of permission scopes.
+            force_refresh (bool): Bypass the cache and fetch a new token.
+            timeout (float or tuple): Per-attempt timeout, or (connect, read).
+            deadline (float or Deadline): End-to-end budget in seconds, including
+                time spent waiting on a coalesced fetch.
+
+        Returns:
+            str: JWT or token string.
+
+        Raises:
+            TokenRequestError: If token cannot be fetched.
+            RequestTimeoutError: If the request times out or the deadline runs out.
+        """
+        if self.token_cache is not None and not force_refresh:
+            cached = self.token_cache.get(agent_id, scopes)
+            if cached:
+                self.tokens.set(agent_id, cached, scopes)
+                self.token = cached
+                return cached
+
+        deadline = Deadline.coerce(deadline)
+        # A forced refresh must not join a normal fetch, which may return the very token it replaces.
+        key = (TokenCache.make_key(agent_id, scopes), force_refresh)
+        try:
+            token = await self._token_flight.do(
+                key,
+                lambda: self._fetch_and_store_token(agent_id, scopes, timeout, deadline, force_refresh),
+                timeout=deadline.remaining() if deadline is not None else None
+            )
+        except TimeoutError as e:
+            raise DeadlineExceededError("Failed to fetch token: deadline exceeded.") from e
+        self.tokens.set(agent_id, token, scopes)
+        self.token = token
+        return token
+
+    async def _fetch_and_store_token(
+        self,
+        agent_id: str,
+        scopes: List[str],
+        timeout: TimeoutSpec = None,
+        deadline: Optional[Deadline] = None,
+        force_refresh: bool = False
+    ) -> str:
+        """Fetches a token once on behalf of every coalesced caller and caches it."""
+        store = self.config.token_store
+        if store is None:
+            token = await self._fetch_token(agent_id, scopes, timeout, deadline)
+        else:
+            token = None if force_refresh else await self._in_thread(store.get_token, agent_id, scopes)
+            if token is None:
+                async with self._store_lock(store, f"token:{agent_id}:{scopes_key(scopes)}", deadline):
+                    token = None if force_refresh else await self._in_thread(store.get_token, agent_id, scopes)
+                    if token is None:
+                        token = await self._fetch_token(agent_id, scopes, timeout, deadline)
+                        await self._in_thread(store.put_token, agent_id, scopes, token)
+        if self.token_cache is not None:
+            self.token_cache.put(agent_id, scopes, token)
+        if self.refresher is not None:
+            self._loop = asyncio.get_running_loop()
+            self.refresher.schedule(agent_id, scopes, token)
+        return token
+
+    @staticmethod
+    @contextlib.asynccontextmanager
+    async def _store_lock(store: TokenStore, key: str, deadline: Optional[Deadline] = None) -> AsyncIterator[None]:
+        """
+        Holds the store's cross-process lock for key.
+
+        The lock is polled with try_acquire() rather than waited on in an
+        executor thread: blocked waiters would otherwise occupy every thread
+        the holder needs to finish and release, and a cancelled wait could
+        leave the lock taken with no one to release it.
+        """
+        delay = LOCK_POLL_INTERVAL
+        while not store.try_acquire(key):
+            if deadline is not None:
+                deadline.check("Waiting for the token store lock")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, LOCK_MAX_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            store.release(key)
+
+    @staticmethod
+    async def _in_thread(fn: Callable[..., Any], *args) -> Any:
+        """Runs a blocking call (e.g. on the token store) in the default executor."""
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    async def _refresh_token(self, agent_id: str, scopes: List[str], old_token: str) -> str:
+        """Renews a token ahead of expiry on the client's event loop."""
+        token = await self._fetch_token(agent_id, scopes)
+        if self.config.token_store is not None:
+            await self._in_thread(self.config.token_store.put_token, agent_id, scopes, token)
+        if self.token_cache is not None:
+            self.token_cache.put(agent_id, scopes, token)
+        self.tokens.replace(agent_id, old_token, token)
+        if self.token == old_token:
+            self.token = token
+        return token
+
+    def _refresh_token_threadsafe(self, agent_id: str, scopes: List[str], old_token: str) -> str:
+        """Bridges the refresher's timer thread onto the event loop that fetched the token."""
+        future = asyncio.run_coroutine_threadsafe(self._refresh_token(agent_id, scopes, old_token), self._loop)
+        return future.result(timeout=60)
+
+    async def _fetch_token(
+        self,
+        agent_id: str,
+        scopes: List[str],
+        timeout: TimeoutSpec = None,
+        deadline: Optional[Deadline] = None
+    ) -> str:
+        """Requests a new token from /api/agents/token, bypassing the cache."""
+        url = f"{self.base_url}/api/agents/token"
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        payload = {
+            "agent_id": agent_id,
+            "scopes": scopes
+        }
+
+        # Issuing a token has no side effects, so it is retried like an idempotent request.
+        response = await self._send("POST", url, TokenRequestError, "Failed to fetch token", "get_token",
+                                    idempotent=True, timeout=timeout, deadline=deadline, json=payload, headers=headers)
+        try:
+            token = response.json().get("token")
+        except (ValueError, AttributeError) as e:
+            raise TokenRequestError(f"Failed to fetch token: {str(e)}") from e
+        if not token:
+            raise TokenRequestError("Token not found in response.")
+        return token
+
+    async def call_api(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: Optional[Dict] = None,
+        agent_id: Optional[str] = None,
+        timeout: TimeoutSpec = None,
+        deadline: DeadlineSpec = None,
+        select: Optional[Iterable[str]] = None
+    ) -> Dict:
+        """
+        Makes an authenticated API call on behalf of the agent.
+
+        Without agent_id the most recently fetched token (self.token) is
+        used. With agent_id the bearer comes from that agent's entry in the
+        token registry, and is re-fetched first if it is about to expire.
+
+        With config.response_cache set, GET responses are cached per agent,
+        scopes and URL (see ResponseCache).
+
+        With select, only the given paths are returned as {path: value}; see
+        SpokeAgentClient.call_api().
+
+        Args:
+            endpoint (str): API endpoint path (e.g., /secure/data).
+            method (str): HTTP method ('GET', 'POST').
+            data (dict): Optional request body.
+            agent_id (str): Optional agent to act for; must have called get_token() before.
+            timeout (float or tuple): Per-attempt timeout, or (connect, read).
+            deadline (float or Deadline): End-to-end budget in seconds covering
+                token renewal, retries and backoff.
+            select (list of str): Optional paths to project the response onto.
+
+        Returns:
+            dict: API response, or {path: value} with select.
+
+        Raises:
+            ValueError: If a select path is malformed.
+            APIRequestError: If request fails.
+            CircuitOpenError: If the circuit breaker for the endpoint is open.
+            RateLimitExceededError: If config.rate_limiter has no capacity for the call.
+            TokenRequestError: If the agent's expiring token cannot be renewed.
+            RequestTimeoutError: If the request times out or the deadline runs out.
+        """
+        deadline = Deadline.coerce(deadline)
+        select = validate_paths(select) if select is not None else None
+        if self.config.response_cache is not None and method.upper() == "GET":
+            value = await self._call_api_cached(endpoint, agent_id, timeout=timeout, deadline=deadline)
+            return project(value, select) if select is not None else value
+
+        incremental = select is not None and can_project_incrementally(select)
+        if incremental:
+            response = await self._send_api(endpoint, method, data, agent_id, timeout=timeout, deadline=deadline,
+                                            stream=True)
+        else:
+            response = await self._send_api(endpoint, method, data, agent_id, timeout=timeout, deadline=deadline)
+        try:
+            if incremental and is_large_body(response.headers.get("Content-Length")):
+                projector = Projector(select)
+                async for chunk in response.aiter_bytes(DEFAULT_CHUNK_SIZE):
+                    projector.feed(chunk)
+                    if projector.done:
+                        break
+                return projector.close()
+            if incremental:
+                await response.aread()
+            value = response.json()
+        except ValueError as e:
+            raise APIRequestError(f"API call failed: {str(e)}") from e
+        except httpx.HTTPError as e:
+            raise APIRequestError(f"API call failed: {str(e)}") from e
+        finally:
+            await response.aclose()
+        return project(value, select) if select is not None else value
+
+    async def _call_api_cached(self, endpoint: str, agent_id: Optional[str], **kwargs) -> Dict:
+        """Serves a GET from config.response_cache, revalidating stale entries with If-None-Match."""
+        cache = self.config.response_cache
+        bearer = await self._resolve_bearer(agent_id, kwargs.get("deadline"))
+        key = cache.make_key(bearer, f"{self.base_url}{endpoint}")
+        entry, fresh = cache.lookup(key)
+        if fresh:
+            return entry.value
+
+        headers = {"If-None-Match": entry.etag} if entry is not None else None
+        response = await self._send_api(endpoint, "GET", None, agent_id, extra_headers=headers, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            cache.revalidated(key, response.headers)
+            return entry.value
+        try:
+            value = response.json()
+        except ValueError as e:
+            raise APIRequestError(f"API call failed: {str(e)}") from e
+        if response.status_code == 200:
+            cache.store(key, value, len(response.content), response.headers)
+        return value
+
+    async def call_many(
+        self,
+        requests: Iterable[CallSpec],
+        max_concurrency: int = 8,
+        deadline: DeadlineSpec = None,
+        fail_fast: bool = False,
+        timeout: TimeoutSpec = None
+    ) -> List[CallResult]:
+        """
+        Runs many call_api() requests concurrently and returns their results
+        in input order. Mirrors SpokeAgentClient.call_many(), with at most
+        max_concurrency requests in flight on this event loop.
+
+        Args:
+            requests (iterable): Endpoints, (endpoint, method, data, agent_id) tuples,
+                or {"endpoint": ..., "method": ..., "data": ..., "agent_id": ...} dicts.
+            max_concurrency (int): Maximum requests in flight.
+            deadline (float or Deadline): End-to-end budget for the whole batch.
+            fail_fast (bool): Raise the first error and cancel the remaining
+                requests, instead of collecting every result.
+            timeout (float or tuple): Per-attempt timeout, or (connect, read).
+
+        Returns:
+            list: Response dicts, or the SpokeAgentError raised for each failed request.
+
+        Raises:
+            ValueError: If a request spec is malformed.
+            SpokeAgentError: With fail_fast, the first error encountered.
+        """
+        calls = [normalize_call_spec(spec) for spec in requests]
+        deadline = Deadline.coerce(deadline)
+        results: List[Optional[CallResult]] = [None] * len(calls)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def call_one(index: int) -> None:
+            async with semaphore:
+                try:
+                    results[index] = await self.call_api(timeout=timeout, deadline=deadline, **calls[index])
+                except SpokeAgentError as e:
+                    if fail_fast:
+                        raise
+                    results[index] = e
+
+        tasks = [asyncio.ensure_future(call_one(i)) for i in range(len(calls))]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return results
+
+    def iter_pages(
+        self,
+        endpoint: str,
+        paginator: Optional[Paginator] = None,
+        agent_id: Optional[str] = None,
+        prefetch: int = DEFAULT_PREFETCH,
+        max_pages: Optional[int] = None,
+        timeout: TimeoutSpec = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Iterates asynchronously over the pages of a paginated GET endpoint.
+        Mirrors SpokeAgentClient.iter_pages(); the prefetching runs as a
+        task on the current event loop.
+
+        Example usage:
+
+            async for page in client.iter_pages("/api/documents", CursorPaginator()):
+                handle(page["items"])
+        """
+        paginator = paginator or CursorPaginator()
+        pages = awalk_pages(
+            lambda params: self.call_api(with_query(endpoint, params), agent_id=agent_id, timeout=timeout),
+            paginator,
+            max_pages
+        )
+        return aprefetch_pages(pages, prefetch)
+
+    async def iter_items(
+        self,
+        endpoint: str,
+        paginator: Optional[Paginator] = None,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Iterates asynchronously over the items of every page of a paginated
+        GET endpoint (see iter_pages() for the arguments).
+        """
+        paginator = paginator or CursorPaginator()
+        async for page in self.iter_pages(endpoint, paginator, **kwargs):
+            for item in paginator.items(page):
+                yield item
+
+    async def stream_api(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: Optional[Dict] = None,
+        agent_id: Optional[str] = None,
+        mode: str = "chunks",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        timeout: TimeoutSpec = None,
+        deadline: DeadlineSpec = None
+    ) -> AsyncIterator[Any]:
+        """
+        Streams a protected endpoint's response instead of buffering it.
+
+        Async generator counterpart of SpokeAgentClient.stream_api(); the
+        connection is released when the generator is exhausted or closed.
+
+        Example usage:
+
+            async for record in client.stream_api("/api/reports/export", mode="ndjson"):
+                handle(record)
+
+        Raises:
+            ValueError: If mode is not supported.
+            APIRequestError: If the request or the stream fails.
+        """
+        validate_stream_mode(mode)
+        response = await self._send_api(endpoint, method, data, agent_id, operation="stream_api", stream=True,
+                                        timeout=timeout, deadline=Deadline.coerce(deadline))
+        try:
+            if mode == "chunks":
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
+            else:
+                async for line in response.aiter_lines():
+                    line = line.rstrip("\r\n")
+                    if mode == "lines":
+                        yield line
+                    elif line.strip():
+                        yield parse_ndjson_line(line)
+        except httpx.HTTPError as e:
+            raise APIRequestError(f"API stream failed: {str(e)}") from e
+        finally:
+            await response.aclose()
+
+    async def _send_api(
+        self,
+        endpoint: str,
+        method: str,
+        data: Optional[Dict],
+        agent_id: Optional[str],
+        operation: str = "call_api",
+        extra_headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """Sends an authenticated request to a protected endpoint and returns the raw response."""
+        bearer = await self._resolve_bearer(agent_id, kwargs.get("deadline"))
+        headers = {
+            "Authorization": f"Bearer {bearer}",
+            "Content-Type": "application/json"
+        }
+        if extra_headers:
+            headers.update(extra_headers)
+
+        url = f"{self.base_url}{endpoint}"
+        breaker = self.config.circuit_breaker
+        circuit_key = breaker.key_for(url) if breaker is not None else None
+        if self.config.rate_limiter is not None:
+            kwargs["rate_key"] = (agent_id or AgentToken(bearer).sub or "", endpoint.split("?", 1)[0])
+
+        if method.upper() == "GET":
+            return await self._send("GET", url, APIRequestError, "API call failed", operation,
+                                    circuit_key=circuit_key, headers=headers, **kwargs)
+        if method.upper() == "POST":
+            return await self._send("POST", url, APIRequestError, "API call failed", operation,
+                                    circuit_key=circuit_key, json=data or {}, headers=headers, **kwargs)
+        raise APIRequestError(f"Unsupported HTTP method: {method}")
+
+    async def _resolve_bearer(self, agent_id: Optional[str], deadline: Optional[Deadline] = None) -> str:
+        """
+        Returns the bearer for a protected call: the agent's token, or self.token without agent_id.
+
+        Raises:
+            APIRequestError: If no token is available.
+        """
+        bearer = await self._bearer_for(agent_id, deadline) if agent_id is not None else self.token
+        if not bearer:
+            raise APIRequestError("Token not available. Call get_token() first.")
+        return bearer
+
+    async def _bearer_for(self, agent_id: str, deadline: Optional[Deadline] = None) -> Optional[str]:
+        """Returns the agent's registered token, renewing it if it is within the expiry skew."""
+        entry = self.tokens.get_entry(agent_id)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at - self.config.token_expiry_skew <= time.time():
+            return await self.get_token(agent_id, list(entry.scopes), deadline=deadline)
+        return entry.token
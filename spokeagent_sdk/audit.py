@@ -0,0 +1,331 @@
+# Streaming bulk inspection of agent tokens for security audits
+"""
+Usage:
+
+    python -m spokeagent_sdk.audit tokens.txt --workers 4
+    python -m spokeagent_sdk.audit app.log --extract --json > report.json
+
+Tokens are read one per line (or extracted from arbitrary log lines with
+--extract), decoded in batches across a process pool, and folded into a
+single AuditReport. Token values only ever appear redacted.
+"""
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO
+
+from .auth import AgentToken
+from .utils import redact_token
+
+# Upper bounds (seconds until expiry) of the expiry histogram buckets.
+EXPIRY_BUCKETS = (
+    (0.0, "expired"),
+    (3600.0, "<1h"),
+    (86400.0, "<24h"),
+    (7 * 86400.0, "<7d"),
+    (30 * 86400.0, "<30d"),
+    (math.inf, ">=30d"),
+)
+NO_EXPIRY = "no_exp"
+OTHER = "<other>"
+NO_AGENT = "<none>"
+
+JWT_PATTERN = re.compile(r"eyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]*")
+
+
+def _expiry_bucket(remaining: float) -> str:
+    if remaining <= 0:
+        return EXPIRY_BUCKETS[0][1]
+    return next(label for bound, label in EXPIRY_BUCKETS[1:] if remaining < bound)
+
+
+class AuditReport:
+    """
+    Aggregate statistics over a stream of tokens.
+
+    Counters are capped at max_keys distinct agents and scopes (the rest
+    are folded into "<other>") and only sample_size redacted examples are
+    kept per finding, so a report's size does not grow with the input.
+
+    Attributes:
+        total (int): Tokens inspected.
+        malformed (int): Tokens whose payload could not be decoded or whose scopes are not strings.
+        expired (int): Tokens past `exp`.
+        expiring (int): Tokens expiring within the audit's expiring_within.
+        over_scoped (int): Tokens with more than max_scopes scopes or a wildcard scope.
+        expiry_histogram (Counter): Tokens per time-to-expiry bucket (see EXPIRY_BUCKETS).
+        scope_frequency (Counter): Tokens carrying each scope.
+        per_agent (Counter): Tokens per `sub` claim.
+        samples (dict): Finding -> list of {"index", "token", "agent"} with redacted tokens.
+    """
+
+    FINDINGS = ("malformed", "expired", "expiring", "over_scoped")
+
+    def __init__(self, max_keys: int = 10000, sample_size: int = 5):
+        self.max_keys = max_keys
+        self.sample_size = sample_size
+        self.total = 0
+        self.malformed = 0
+        self.expired = 0
+        self.expiring = 0
+        self.over_scoped = 0
+        self.expiry_histogram: Counter = Counter()
+        self.scope_frequency: Counter = Counter()
+        self.per_agent: Counter = Counter()
+        self.samples: Dict[str, List[Dict]] = {finding: [] for finding in self.FINDINGS}
+
+    def _count(self, counter: Counter, key: str, amount: int = 1) -> None:
+        if key in counter or len(counter) < self.max_keys:
+            counter[key] += amount
+        else:
+            counter[OTHER] += amount
+
+    def _sample(self, finding: str, index: int, token: str, agent: Optional[str]) -> None:
+        samples = self.samples[finding]
+        if len(samples) < self.sample_size:
+            samples.append({"index": index, "token": redact_token(token), "agent": agent})
+
+    def add(self, index: int, token: str, now: float, expiring_within: float, max_scopes: int) -> None:
+        """Inspects one token (its position in the input is `index`)."""
+        self.total += 1
+        parsed = AgentToken(token)
+        scopes = parsed.scopes or ()
+        if parsed.decode_jwt_payload() is None or not all(isinstance(scope, str) for scope in scopes):
+            self.malformed += 1
+            self._sample("malformed", index, token, parsed.sub)
+            return
+
+        agent = parsed.sub
+        self._count(self.per_agent, agent or NO_AGENT)
+
+        expiry = parsed.exp
+        if expiry is None:
+            self.expiry_histogram[NO_EXPIRY] += 1
+        else:
+            remaining = expiry - now
+            self.expiry_histogram[_expiry_bucket(remaining)] += 1
+            if remaining <= 0:
+                self.expired += 1
+                self._sample("expired", index, token, agent)
+            elif remaining <= expiring_within:
+                self.expiring += 1
+                self._sample("expiring", index, token, agent)
+
+        for scope in set(scopes):
+            self._count(self.scope_frequency, scope)
+        if len(scopes) > max_scopes or any("*" in scope for scope in scopes):
+            self.over_scoped += 1
+            self._sample("over_scoped", index, token, agent)
+
+    def merge(self, other: "AuditReport") -> "AuditReport":
+        """Folds another (partial) report into this one and returns self."""
+        self.total += other.total
+        self.malformed += other.malformed
+        self.expired += other.expired
+        self.expiring += other.expiring
+        self.over_scoped += other.over_scoped
+        self.expiry_histogram.update(other.expiry_histogram)
+        for key, amount in other.scope_frequency.items():
+            self._count(self.scope_frequency, key, amount)
+        for key, amount in other.per_agent.items():
+            self._count(self.per_agent, key, amount)
+        for finding, samples in other.samples.items():
+            merged = self.samples[finding] + samples
+            self.samples[finding] = sorted(merged, key=lambda sample: sample["index"])[:self.sample_size]
+        return self
+
+    def to_dict(self, top: Optional[int] = None) -> Dict:
+        """
+        Returns the report as plain JSON-serializable data.
+
+        Args:
+            top (int): Only include the most common `top` scopes and agents.
+        """
+        return {
+            "total": self.total,
+            "malformed": self.malformed,
+            "expired": self.expired,
+            "expiring": self.expiring,
+            "over_scoped": self.over_scoped,
+            "expiry_histogram": {label: self.expiry_histogram.get(label, 0)
+                                 for label in [label for _, label in EXPIRY_BUCKETS] + [NO_EXPIRY]},
+            "scope_frequency": dict(self.scope_frequency.most_common(top)),
+            "per_agent": dict(self.per_agent.most_common(top)),
+            "samples": self.samples,
+        }
+
+
+def _inspect_batch(
+    start: int,
+    tokens: List[str],
+    now: float,
+    expiring_within: float,
+    max_scopes: int,
+    max_keys: int,
+    sample_size: int
+) -> AuditReport:
+    """Builds a partial report for one batch (runs in a worker process)."""
+    report = AuditReport(max_keys=max_keys, sample_size=sample_size)
+    for offset, token in enumerate(tokens):
+        report.add(start + offset, token, now, expiring_within, max_scopes)
+    return report
+
+
+def iter_tokens(lines: Iterable[str], extract: bool = False) -> Iterator[str]:
+    """
+    Yields tokens from lines of text.
+
+    Args:
+        lines (iterable of str): One token per line, or arbitrary log lines with extract=True.
+        extract (bool): Pull JWT-shaped tokens out of each line instead of taking the whole line.
+    """
+    for line in lines:
+        if extract:
+            yield from JWT_PATTERN.findall(line)
+            continue
+        token = line.strip()
+        if token:
+            yield token
+
+
+def audit_tokens(
+    tokens: Iterable[str],
+    workers: Optional[int] = None,
+    batch_size: int = 5000,
+    max_in_flight: Optional[int] = None,
+    now: Optional[float] = None,
+    expiring_within: float = 86400.0,
+    max_scopes: int = 20,
+    max_keys: int = 10000,
+    sample_size: int = 5,
+    executor: Optional[Executor] = None
+) -> AuditReport:
+    """
+    Inspects a stream of tokens and returns the aggregate report.
+
+    The input is consumed lazily in batches of batch_size. At most
+    max_in_flight batches are queued at once, so memory stays flat however
+    many tokens the input holds.
+
+    Example usage:
+
+        with open("tokens.txt") as f:
+            report = audit_tokens(iter_tokens(f), workers=4)
+        print(report.to_dict(top=20))
+
+    Args:
+        tokens (iterable of str): Raw tokens.
+        workers (int): Worker processes (default: CPU count; 0 inspects inline).
+        batch_size (int): Tokens per batch sent to a worker.
+        max_in_flight (int): Batches queued at once (default: 2 per worker).
+        now (float): Unix time expiry is measured against (default: current time).
+        expiring_within (float): Seconds before expiry at which a token counts as expiring.
+        max_scopes (int): Scope count above which a token counts as over-scoped.
+        max_keys (int): Distinct agents and scopes tracked before folding into "<other>".
+        sample_size (int): Redacted examples kept per finding.
+        executor (Executor): Optional executor to use instead of a new process pool.
+
+    Returns:
+        AuditReport: Aggregated statistics.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+    now = time.time() if now is None else now
+    options = (now, expiring_within, max_scopes, max_keys, sample_size)
+    report = AuditReport(max_keys=max_keys, sample_size=sample_size)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if executor is None and workers == 0:
+        for start, batch in _batches(tokens, batch_size):
+            report.merge(_inspect_batch(start, batch, *options))
+        return report
+
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    limit = max_in_flight or 2 * max(1, workers)
+    pending: Set[Future] = set()
+    try:
+        for start, batch in _batches(tokens, batch_size):
+            if len(pending) >= limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    report.merge(future.result())
+            pending.add(pool.submit(_inspect_batch, start, batch, *options))
+        for future in wait(pending).done:
+            report.merge(future.result())
+    finally:
+        if executor is None:
+            pool.shutdown(wait=True)
+    return report
+
+
+def audit_file(path: str, extract: bool = False, encoding: str = "utf-8", **kwargs) -> AuditReport:
+    """Audits the tokens in a text file (see iter_tokens() and audit_tokens())."""
+    with open(path, encoding=encoding, errors="replace") as f:
+        return audit_tokens(iter_tokens(f, extract=extract), **kwargs)
+
+
+def _batches(tokens: Iterable[str], size: int) -> Iterator:
+    batch: List[str] = []
+    start = 0
+    for token in tokens:
+        batch.append(token)
+        if len(batch) == size:
+            yield start, batch
+            start += size
+            batch = []
+    if batch:
+        yield start, batch
+
+
+def format_report(report: AuditReport, top: int = 10, out: Optional[TextIO] = None) -> None:
+    """Writes a human-readable summary of a report (to stdout by default)."""
+    out = out or sys.stdout
+    data = report.to_dict(top=top)
+    print(f"tokens: {data['total']}  malformed: {data['malformed']}  expired: {data['expired']}  "
+          f"expiring: {data['expiring']}  over-scoped: {data['over_scoped']}", file=out)
+    print("expiry: " + "  ".join(f"{label}={count}" for label, count in data["expiry_histogram"].items()), file=out)
+    for title, key in (("scopes", "scope_frequency"), ("agents", "per_agent")):
+        print(f"top {title}:", file=out)
+        for name, count in data[key].items():
+            print(f"  {count:>10}  {name}", file=out)
+    for finding, samples in data["samples"].items():
+        for sample in samples:
+            print(f"{finding}: #{sample['index']} {sample['token']} agent={sample['agent']}", file=out)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Audit agent tokens in bulk.")
+    parser.add_argument("path", help="File with one token per line ('-' for stdin).")
+    parser.add_argument("--extract", action="store_true", help="Extract JWTs from arbitrary log lines.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (0 = inline).")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--expiring-within", type=float, default=86400.0, help="Seconds.")
+    parser.add_argument("--max-scopes", type=int, default=20)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    args = parser.parse_args(argv)
+
+    options = dict(workers=args.workers, batch_size=args.batch_size,
+                   expiring_within=args.expiring_within, max_scopes=args.max_scopes)
+    if args.path == "-":
+        report = audit_tokens(iter_tokens(sys.stdin, extract=args.extract), **options)
+    else:
+        report = audit_file(args.path, extract=args.extract, **options)
+
+    if args.json:
+        json.dump(report.to_dict(top=args.top), sys.stdout, indent=2)
+        print()
+    else:
+        format_report(report, top=args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
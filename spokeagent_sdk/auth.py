@@ -1,34 +1,77 @@
 # Token management (AgentToken)
 import base64
 import json
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
+
+from .scopes import ScopeSet
+
+Number = Union[int, float]
+
+_UNPARSED = object()
+
+_SCOPE_SET_CACHE_SIZE = 4096
+_scope_sets: "OrderedDict[str, ScopeSet]" = OrderedDict()
+_scope_sets_lock = threading.Lock()
+
+
+def _numeric_claim(payload: Optional[dict], name: str) -> Optional[Number]:
+    value = payload.get(name) if payload else None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return value
 
 
 class AgentToken:
     """
     Wrapper class for agent tokens (e.g., JWTs or opaque tokens).
     Includes helper methods for decoding and inspection.
+
+    The payload is decoded lazily on first access and cached, so repeated
+    scope and expiry checks are O(1). Instances use __slots__ to stay small
+    when many tokens are held at once.
     """
 
+    __slots__ = ("_token", "_payload", "_scopes", "_scope_set")
+
     def __init__(self, token: str):
         self.token = token.strip()
 
+    @property
+    def token(self) -> str:
+        return self._token
+
+    @token.setter
+    def token(self, value: str) -> None:
+        self._token = value
+        self._payload = _UNPARSED
+        self._scopes = _UNPARSED
+        self._scope_set = None
+
     def __str__(self):
-        return self.token
+        return self._token
 
     def get_raw(self) -> str:
         """Return the raw token string."""
-        return self.token
+        return self._token
 
     def decode_jwt_payload(self) -> Optional[dict]:
         """
         Decodes the payload part of a JWT token (non-validated).
 
+        The result is cached on the instance; treat it as read-only.
+
         Returns:
             dict or None: Decoded payload or None if not a JWT.
         """
+        if self._payload is _UNPARSED:
+            self._payload = self._parse_payload()
+        return self._payload
+
+    def _parse_payload(self) -> Optional[dict]:
         try:
-            parts = self.token.split(".")
+            parts = self._token.split(".")
             if len(parts) != 3:
                 return None
             payload_encoded = parts[1]
@@ -36,10 +79,52 @@ class AgentToken:
             padding = '=' * (4 - len(payload_encoded) % 4)
             payload_encoded += padding
             decoded_bytes = base64.urlsafe_b64decode(payload_encoded.encode("utf-8"))
-            return json.loads(decoded_bytes)
+            payload = json.loads(decoded_bytes)
+            return payload if isinstance(payload, dict) else None
         except Exception:
             return None
 
+    @property
+    def scopes(self) -> Optional[Tuple[str, ...]]:
+        """Scopes from the `scope` claim as an immutable tuple, or None if absent."""
+        if self._scopes is _UNPARSED:
+            payload = self.decode_jwt_payload()
+            scopes = None
+            if payload and "scope" in payload:
+                if isinstance(payload["scope"], str):
+                    scopes = tuple(payload["scope"].split(" "))
+                elif isinstance(payload["scope"], list):
+                    scopes = tuple(payload["scope"])
+            self._scopes = scopes
+        return self._scopes
+
+    @property
+    def scope_set(self) -> ScopeSet:
+        """
+        Scopes compiled into a ScopeSet for fast exact, wildcard and
+        all/any checks (empty if the token carries no scopes).
+        """
+        if self._scope_set is None:
+            self._scope_set = ScopeSet.compile(self.scopes)
+        return self._scope_set
+
+    @property
+    def exp(self) -> Optional[Number]:
+        """Expiry (`exp`) as a Unix timestamp, or None."""
+        return _numeric_claim(self.decode_jwt_payload(), "exp")
+
+    @property
+    def iat(self) -> Optional[Number]:
+        """Issued-at (`iat`) as a Unix timestamp, or None."""
+        return _numeric_claim(self.decode_jwt_payload(), "iat")
+
+    @property
+    def sub(self) -> Optional[str]:
+        """Subject (`sub`) claim, or None."""
+        payload = self.decode_jwt_payload()
+        value = payload.get("sub") if payload else None
+        return value if isinstance(value, str) else None
+
     def get_scope(self) -> Optional[list]:
         """
         Attempts to extract scopes from JWT payload.
@@ -47,13 +132,8 @@ class AgentToken:
         Returns:
             list or None: List of scopes or None if not found.
         """
-        payload = self.decode_jwt_payload()
-        if payload and "scope" in payload:
-            if isinstance(payload["scope"], str):
-                return payload["scope"].split(" ")
-            elif isinstance(payload["scope"], list):
-                return payload["scope"]
-        return None
+        scopes = self.scopes
+        return list(scopes) if scopes is not None else None
 
     def get_expiry(self) -> Optional[int]:
         """
@@ -62,5 +142,27 @@ class AgentToken:
         Returns:
             int or None
         """
-        payload = self.decode_jwt_payload()
-        return payload.get("exp") if payload else None
+        return self.exp
+
+
+def scope_set_for(token: str) -> ScopeSet:
+    """
+    Returns the compiled ScopeSet of a raw token, caching it per token so
+    middleware that sees the same bearer on every request decodes it once.
+
+    Example usage:
+
+        if not scope_set_for(bearer).allows("read:documents"):
+            return 403
+    """
+    with _scope_sets_lock:
+        scope_set = _scope_sets.get(token)
+        if scope_set is not None:
+            _scope_sets.move_to_end(token)
+            return scope_set
+    scope_set = AgentToken(token).scope_set
+    with _scope_sets_lock:
+        _scope_sets[token] = scope_set
+        if len(_scope_sets) > _SCOPE_SET_CACHE_SIZE:
+            _scope_sets.popitem(last=False)
+    return scope_set
@@ -0,0 +1,103 @@
+# Helpers for bulk agent registration and batched API calls (shared by the sync and async clients)
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .errors import AgentRegistrationError, SpokeAgentError
+
+AgentSpec = Union[str, Tuple[str, Optional[Dict]], Dict]
+RegistrationResult = Union[Dict, SpokeAgentError]
+ProgressCallback = Callable[[int, int], None]
+
+CallSpec = Union[str, Tuple, Dict]
+CallResult = Union[Dict, SpokeAgentError]
+
+BATCH_REGISTER_PATH = "/api/agents/register/batch"
+
+# Statuses meaning "this server has no batch endpoint"; anything else is a real failure.
+BATCH_UNSUPPORTED_STATUSES = (404, 405, 501)
+
+
+def normalize_agent_spec(spec: AgentSpec) -> Dict:
+    """
+    Turns an agent spec into a registration payload.
+
+    Accepts a bare name, a (name, metadata) tuple, or a dict with "name" and
+    optional "metadata" keys.
+
+    Returns:
+        dict: {"name": ..., "metadata": {...}}
+
+    Raises:
+        ValueError: If the spec has no name.
+    """
+    if isinstance(spec, str):
+        name, metadata = spec, None
+    elif isinstance(spec, tuple):
+        name, metadata = spec[0], spec[1] if len(spec) > 1 else None
+    elif isinstance(spec, dict):
+        name, metadata = spec.get("name"), spec.get("metadata")
+    else:
+        raise ValueError(f"Unsupported agent spec: {spec!r}")
+
+    if not name:
+        raise ValueError(f"Agent spec is missing a name: {spec!r}")
+    return {"name": name, "metadata": metadata or {}}
+
+
+def chunked(items: Sequence, size: int) -> Iterable[Tuple[int, Sequence]]:
+    """Yields (start_index, chunk) pairs of at most `size` items."""
+    for start in range(0, len(items), size):
+        yield start, items[start:start + size]
+
+
+def parse_batch_results(body: Dict, expected: int) -> List[RegistrationResult]:
+    """
+    Maps a batch registration response onto per-agent results.
+
+    The response is expected to look like {"agents": [...]} in request
+    order; entries carrying an "error" key become AgentRegistrationError.
+
+    Raises:
+        AgentRegistrationError: If the response does not match the request.
+    """
+    agents = body.get("agents") if isinstance(body, dict) else None
+    if not isinstance(agents, list) or len(agents) != expected:
+        raise AgentRegistrationError("Batch registration returned an unexpected response.")
+
+    results: List[RegistrationResult] = []
+    for agent in agents:
+        if isinstance(agent, dict) and agent.get("error"):
+            results.append(AgentRegistrationError(f"Agent registration failed: {agent['error']}"))
+        else:
+            results.append(agent)
+    return results
+
+
+def normalize_call_spec(spec: CallSpec) -> Dict:
+    """
+    Turns a call_many() request into call_api() keyword arguments.
+
+    Accepts a bare endpoint, an (endpoint, method, data, agent_id) tuple
+    (trailing items optional), or a dict with an "endpoint" key and optional
+    "method", "data" and "agent_id" keys.
+
+    Returns:
+        dict: {"endpoint": ..., "method": ..., "data": ..., "agent_id": ...}
+
+    Raises:
+        ValueError: If the spec has no endpoint or too many items.
+    """
+    if isinstance(spec, str):
+        fields = (spec,)
+    elif isinstance(spec, tuple):
+        if len(spec) > 4:
+            raise ValueError(f"Call spec has too many items: {spec!r}")
+        fields = spec
+    elif isinstance(spec, dict):
+        fields = (spec.get("endpoint"), spec.get("method"), spec.get("data"), spec.get("agent_id"))
+    else:
+        raise ValueError(f"Unsupported call spec: {spec!r}")
+
+    endpoint, method, data, agent_id = tuple(fields) + (None,) * (4 - len(fields))
+    if not endpoint:
+        raise ValueError(f"Call spec is missing an endpoint: {spec!r}")
+    return {"endpoint": endpoint, "method": method or "GET", "data": data, "agent_id": agent_id}
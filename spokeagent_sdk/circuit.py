@@ -0,0 +1,191 @@
+# Circuit breaker per host and endpoint prefix
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .errors import CircuitOpenError
+from .metrics import endpoint_label
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    __slots__ = ("state", "outcomes", "opened_at", "trial_calls", "trial_successes")
+
+    def __init__(self, window_size: int):
+        self.state = CLOSED
+        self.outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self.opened_at = 0.0
+        self.trial_calls = 0
+        self.trial_successes = 0
+
+
+class CircuitBreaker:
+    """
+    Fails fast on upstreams that are failing or too slow.
+
+    Circuits are tracked per host and endpoint prefix (the first
+    `prefix_depth` path segments), so one degraded API does not block calls
+    to healthy ones on the same host. ID-like segments are normalized to
+    ":id" (as in metrics labels), so /api/123/reports and /api/456/reports
+    share a circuit. At most `max_circuits` circuits are tracked; the least
+    recently used closed ones are forgotten first. Each circuit keeps a
+    sliding window of the last `window_size` outcomes:
+
+    - closed: calls flow; once at least `minimum_calls` are recorded and the
+      failure rate or slow-call rate reaches its threshold, the circuit opens.
+    - open: calls raise CircuitOpenError immediately for `open_duration` seconds.
+    - half_open: up to `half_open_max_calls` trial calls are let through;
+      if they all succeed the circuit closes, any failure re-opens it.
+
+    Failures are connection errors, timeouts and 5xx responses.
+
+    Example usage:
+
+        config = SpokeAgentConfig(..., circuit_breaker=CircuitBreaker(failure_rate_threshold=0.5))
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: Optional[float] = None,
+        slow_call_rate_threshold: float = 1.0,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 1,
+        prefix_depth: int = 2,
+        max_circuits: int = 1024,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            failure_rate_threshold (float): Failure ratio in (0, 1] in the window that opens the circuit.
+            slow_call_threshold (float): Seconds above which a call counts as slow (None disables).
+            slow_call_rate_threshold (float): Slow-call ratio in (0, 1] in the window that opens the circuit.
+            window_size (int): Number of recent calls considered.
+            minimum_calls (int): Calls needed in the window before the circuit may open.
+            open_duration (float): Seconds to stay open before allowing trial calls.
+            half_open_max_calls (int): Trial calls allowed while half-open.
+            prefix_depth (int): Path segments used to group endpoints into circuits.
+            max_circuits (int): Circuits tracked before closed ones are evicted.
+            clock (callable): Monotonic time source (overridable for tests).
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = min(minimum_calls, window_size)
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        self.prefix_depth = prefix_depth
+        self.max_circuits = max_circuits
+        self._clock = clock
+        self._circuits: "OrderedDict[str, _Circuit]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key_for(self, url: str) -> str:
+        """Returns the circuit key ("host/prefix") for a request URL."""
+        parts = urlsplit(url)
+        segments = [segment for segment in endpoint_label(parts.path).split("/") if segment][:self.prefix_depth]
+        return parts.netloc + "/" + "/".join(segments)
+
+    def before_call(self, key: str) -> None:
+        """
+        Admits a call or fails fast.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all trial slots taken.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                self._evict()
+                circuit = self._circuits[key] = _Circuit(self.window_size)
+            else:
+                self._circuits.move_to_end(key)
+            if circuit.state == CLOSED:
+                return
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.open_duration - self._clock()
+                if remaining > 0:
+                    raise CircuitOpenError(key, remaining)
+                circuit.state = HALF_OPEN
+                circuit.trial_calls = 0
+                circuit.trial_successes = 0
+            if circuit.trial_calls >= self.half_open_max_calls:
+                raise CircuitOpenError(key, 0.0)
+            circuit.trial_calls += 1
+
+    def record(self, key: str, success: bool, latency: float) -> None:
+        """Records the outcome of a call admitted by before_call() (see also release())."""
+        slow = self.slow_call_threshold is not None and latency >= self.slow_call_threshold
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return
+            if circuit.state == HALF_OPEN:
+                if not success or slow:
+                    self._open(circuit)
+                    return
+                circuit.trial_successes += 1
+                if circuit.trial_successes >= self.half_open_max_calls:
+                    circuit.state = CLOSED
+                    circuit.outcomes.clear()
+                return
+            if circuit.state == OPEN:
+                return
+
+            circuit.outcomes.append((success, slow))
+            calls = len(circuit.outcomes)
+            if calls < self.minimum_calls:
+                return
+            failure_rate = sum(1 for ok, _ in circuit.outcomes if not ok) / calls
+            slow_rate = sum(1 for _, was_slow in circuit.outcomes if was_slow) / calls
+            if failure_rate >= self.failure_rate_threshold or slow_rate >= self.slow_call_rate_threshold:
+                self._open(circuit)
+
+    def release(self, key: str) -> None:
+        """
+        Gives back the admission of a call that ended without an outcome
+        (e.g. it was cancelled), freeing its half-open trial slot.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None and circuit.state == HALF_OPEN and circuit.trial_calls > 0:
+                circuit.trial_calls -= 1
+
+    def _evict(self) -> None:
+        # Open and half-open circuits are kept, so eviction never silently closes one.
+        excess = len(self._circuits) + 1 - self.max_circuits
+        if excess <= 0:
+            return
+        for key in [key for key, circuit in self._circuits.items() if circuit.state == CLOSED][:excess]:
+            del self._circuits[key]
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = self._clock()
+        circuit.outcomes.clear()
+
+    def state(self, key: str) -> str:
+        """Returns the state of a circuit ("closed", "open" or "half_open")."""
+        circuit = self._circuits.get(key)
+        return circuit.state if circuit else CLOSED
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Closes one circuit, or all of them."""
+        with self._lock:
+            if key is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(key, None)
+
+    def states(self) -> Dict[str, str]:
+        """Returns the state of every tracked circuit."""
+        with self._lock:
+            return {key: circuit.state for key, circuit in self._circuits.items()}
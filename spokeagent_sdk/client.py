@@ -1,13 +1,45 @@
 # Core client class: register_agent, get_token, call_api
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
 import requests
-from typing import List, Optional, Dict
+from requests.adapters import HTTPAdapter
+from typing import Any, Iterable, Iterator, List, Optional, Dict, Tuple, Type
 
+from .auth import AgentToken
+from .bulk import (
+    BATCH_REGISTER_PATH,
+    BATCH_UNSUPPORTED_STATUSES,
+    AgentSpec,
+    CallResult,
+    CallSpec,
+    ProgressCallback,
+    RegistrationResult,
+    chunked,
+    normalize_agent_spec,
+    normalize_call_spec,
+    parse_batch_results
+)
 from .config import SpokeAgentConfig
+from .metrics import Sample, request_outcome
+from .pagination import DEFAULT_PREFETCH, CursorPaginator, Paginator, prefetch_pages, walk_pages, with_query
+from .projection import can_project_incrementally, is_large_body, project_chunks, validate_paths
+from .refresh import TokenRefresher
+from .registry import TokenRegistry
+from .singleflight import SingleFlight
+from .store import scopes_key
+from .streaming import DEFAULT_CHUNK_SIZE, iter_ndjson, validate_stream_mode
+from .timeouts import Deadline, DeadlineSpec, TimeoutSpec, resolve_timeout
+from .token_cache import TokenCache
+from .utils import project
 from .errors import (
     SpokeAgentError,
     AgentRegistrationError,
     TokenRequestError,
-    APIRequestError
+    APIRequestError,
+    DeadlineExceededError,
+    RequestTimeoutError
 )
 
 
@@ -16,6 +48,11 @@ class SpokeAgentClient:
         """
         Initialize the SpokeAgent client.
 
+        The client owns a pooled, keep-alive HTTP session sized from the
+        config. A single client can be shared by many worker threads; call
+        close() (or use the client as a context manager) to release its
+        connections.
+
         Args:
             config (SpokeAgentConfig): Configuration object with base_url and API key.
         """
@@ -23,21 +60,263 @@ class SpokeAgentClient:
         self.base_url = config.base_url.rstrip("/")
         self.api_key = config.api_key
         self.token: Optional[str] = None
+        self.tokens = TokenRegistry()
+        self.token_cache: Optional[TokenCache] = None
+        if config.token_cache_size > 0:
+            self.token_cache = TokenCache(config.token_cache_size, config.token_expiry_skew)
+        self._token_flight = SingleFlight()
+        self.refresher: Optional[TokenRefresher] = None
+        if config.proactive_refresh:
+            self.refresher = TokenRefresher(self._refresh_token, config.refresh_fraction)
+        self._batch_register_supported: Optional[bool] = None
+        self.session = self._build_session()
+        self._metrics_collector: Optional[weakref.WeakMethod] = None
+        if config.metrics is not None:
+            self._metrics_collector = weakref.WeakMethod(self._collect_metrics)
+            config.metrics.add_collector(self._metrics_collector)
+
+    def _build_session(self) -> requests.Session:
+        """
+        Creates the pooled HTTP session used for every request.
+
+        Per-request headers are always passed explicitly, so the session is
+        never mutated after construction and can be shared across threads.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.config.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self) -> None:
+        """Stops background refresh and closes the session and all pooled connections."""
+        if self.refresher is not None:
+            self.refresher.stop()
+        if self._metrics_collector is not None:
+            self.config.metrics.remove_collector(self._metrics_collector)
+        self.session.close()
+
+    def __enter__(self) -> "SpokeAgentClient":
+        return self
 
-    def register_agent(self, agent_name: str, metadata: Optional[Dict] = None) -> Dict:
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _collect_metrics(self) -> List[Sample]:
+        """Reports connection pool usage per host and token cache counters to config.metrics."""
+        samples: List[Sample] = []
+        for adapter in set(self.session.adapters.values()):
+            pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+            if pools is None:
+                continue
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                labels = {"host": f"{pool.host}:{pool.port}"}
+                idle = sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool else 0
+                in_use = pool.pool.maxsize - pool.pool.qsize() if pool.pool else 0
+                samples.append(("pool_connections_idle", labels, idle))
+                samples.append(("pool_connections_in_use", labels, in_use))
+                samples.append(("pool_connections_created", labels, pool.num_connections))
+                samples.append(("pool_maxsize", labels, pool.pool.maxsize if pool.pool else 0))
+        if self.token_cache is not None:
+            stats = self.token_cache.stats()
+            for name in ("hits", "misses", "evictions", "size"):
+                samples.append((f"token_cache_{name}", {}, stats[name]))
+        return samples
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        error_cls: Type[SpokeAgentError],
+        error_message: str,
+        operation: str = "request",
+        **kwargs
+    ) -> requests.Response:
+        """
+        Sends one logical request (see _send_attempts()) and, when
+        config.metrics is set, records its outcome and total latency,
+        retries and backoff included, under `operation`.
+        """
+        metrics = self.config.metrics
+        if metrics is None:
+            return self._send_attempts(method, url, error_cls, error_message, operation, **kwargs)
+        started = time.monotonic()
+        try:
+            response = self._send_attempts(method, url, error_cls, error_message, operation, **kwargs)
+        except SpokeAgentError as e:
+            metrics.observe_request(operation, urlsplit(url).path, method, request_outcome(e), time.monotonic() - started)
+            raise
+        metrics.observe_request(operation, urlsplit(url).path, method, response.status_code, time.monotonic() - started)
+        return response
+
+    def _send_attempts(
+        self,
+        method: str,
+        url: str,
+        error_cls: Type[SpokeAgentError],
+        error_message: str,
+        operation: str,
+        idempotent: Optional[bool] = None,
+        circuit_key: Optional[str] = None,
+        rate_key: Optional[Tuple[str, str]] = None,
+        timeout: TimeoutSpec = None,
+        deadline: Optional[Deadline] = None,
+        **kwargs
+    ) -> requests.Response:
+        """
+        Sends a request through the pooled session, retrying transient
+        failures according to config.retry_policy.
+
+        Connection errors, timeouts and retryable statuses are retried when
+        the method is idempotent (or idempotent=True). The raised error
+        carries the final status code and the number of attempts made.
+        With a circuit_key, each attempt is admitted and recorded by
+        config.circuit_breaker; with a rate_key ((agent, endpoint)), each
+        attempt first takes a token from config.rate_limiter.
+
+        Each attempt gets the (connect, read) timeout, shrunk to what is left
+        of the deadline. A retry is only made if its backoff fits in the
+        remaining budget; otherwise the last failure is raised.
+
+        Raises:
+            error_cls: If the request fails or returns an error status.
+            CircuitOpenError: If the circuit for circuit_key is open.
+            RateLimitExceededError: If config.rate_limiter refuses an attempt for rate_key.
+            RequestTimeoutError: If the last attempt timed out.
+            DeadlineExceededError: If the deadline ran out.
+        """
+        base_timeout = resolve_timeout(timeout, self.config.connect_timeout, self.config.read_timeout)
+        policy = self.config.retry_policy
+        breaker = self.config.circuit_breaker if circuit_key else None
+        limiter = self.config.rate_limiter if rate_key else None
+        retryable = policy is not None and (idempotent if idempotent is not None else policy.allows_method(method))
+        max_attempts = policy.max_attempts if retryable else 1
+        metrics = self.config.metrics
+        attempt = 0
+
+        while True:
+            attempt += 1
+            attempt_timeout = base_timeout
+            if deadline is not None:
+                deadline.check(error_message, attempts=max(1, attempt - 1))
+                attempt_timeout = deadline.clamp(base_timeout, error_message)
+            if limiter is not None:
+                limiter.acquire(*rate_key, max_wait=deadline.remaining() if deadline is not None else None)
+                if deadline is not None:
+                    deadline.check(error_message, attempts=max(1, attempt - 1))
+                    attempt_timeout = deadline.clamp(base_timeout, error_message)
+            if breaker is not None:
+                breaker.before_call(circuit_key)
+            started = time.monotonic()
+            try:
+                response = self.session.request(method, url, timeout=attempt_timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if breaker is not None:
+                    breaker.record(circuit_key, False, time.monotonic() - started)
+                delay = policy.compute_delay(attempt) if attempt < max_attempts else None
+                if delay is None or (deadline is not None and delay >= deadline.remaining()):
+                    if isinstance(e, requests.Timeout):
+                        expired = deadline is not None and deadline.expired
+                        timeout_cls = DeadlineExceededError if expired else RequestTimeoutError
+                        raise timeout_cls(f"{error_message}: {str(e)}", attempts=attempt) from e
+                    raise error_cls(f"{error_message}: {str(e)}", attempts=attempt) from e
+                if metrics is not None:
+                    metrics.inc("retries_total", {"operation": operation})
+                time.sleep(delay)
+                continue
+            except requests.RequestException as e:
+                if breaker is not None:
+                    breaker.record(circuit_key, False, time.monotonic() - started)
+                raise error_cls(f"{error_message}: {str(e)}", attempts=attempt) from e
+            except BaseException:
+                # Cancelled or interrupted: no outcome to record, but a half-open trial slot must be freed.
+                if breaker is not None:
+                    breaker.release(circuit_key)
+                raise
+
+            if breaker is not None:
+                breaker.record(circuit_key, response.status_code < 500, time.monotonic() - started)
+            if limiter is not None:
+                limiter.record(*rate_key, response.status_code, response.headers.get("Retry-After"))
+
+            if attempt < max_attempts and policy.allows_status(response.status_code):
+                delay = policy.compute_delay(attempt, response.headers.get("Retry-After"))
+                if delay is not None and (deadline is None or delay < deadline.remaining()):
+                    response.close()
+                    if metrics is not None:
+                        metrics.inc("retries_total", {"operation": operation})
+                    time.sleep(delay)
+                    continue
+
+            try:
+                response.raise_for_status()
+            except requests.HTTPError as e:
+                response.close()
+                raise error_cls(
+                    f"{error_message}: {str(e)}",
+                    status_code=response.status_code,
+                    attempts=attempt
+                ) from e
+            return response
+
+    def register_agent(
+        self,
+        agent_name: str,
+        metadata: Optional[Dict] = None,
+        timeout: TimeoutSpec = None,
+        deadline: DeadlineSpec = None
+    ) -> Dict:
         """
         Registers an AI agent and returns its identity.
 
+        With config.token_store set, an identity stored for the same name
+        and metadata (by any process) is returned without a network call.
+
         Args:
             agent_name (str): Name of the agent.
             metadata (dict): Optional metadata describing the agent.
+            timeout (float or tuple): Per-attempt timeout, or (connect, read);
+                defaults to config.connect_timeout / config.read_timeout.
+            deadline (float or Deadline): End-to-end budget in seconds.
 
         Returns:
             dict: Agent details from the API.
 
         Raises:
             AgentRegistrationError: If registration fails.
+            RequestTimeoutError: If the request times out or the deadline runs out.
         """
+        deadline = Deadline.coerce(deadline)
+        store = self.config.token_store
+        if store is None:
+            return self._register_agent(agent_name, metadata, timeout, deadline)
+
+        agent = store.get_agent(agent_name, metadata)
+        if agent is None:
+            with store.lock(f"agent:{agent_name}", deadline):
+                agent = store.get_agent(agent_name, metadata)
+                if agent is None:
+                    agent = self._register_agent(agent_name, metadata, timeout, deadline)
+                    store.put_agent(agent_name, metadata, agent)
+        return agent
+
+    def _register_agent(
+        self,
+        agent_name: str,
+        metadata: Optional[Dict],
+        timeout: TimeoutSpec = None,
+        deadline: Optional[Deadline] = None
+    ) -> Dict:
+        """Registers an agent with /api/agents/register, bypassing the token store."""
         url = f"{self.base_url}/api/agents/register"
         headers = {"Authorization": f"Bearer {self.api_key}"}
         payload = {
@@ -45,27 +324,197 @@ class SpokeAgentClient:
             "metadata": metadata or {}
         }
 
+        response = self._send("POST", url, AgentRegistrationError, "Agent registration failed", "register_agent",
+                              timeout=timeout, deadline=deadline, json=payload, headers=headers)
         try:
-            response = requests.post(url, json=payload, headers=headers)
-            response.raise_for_status()
             return response.json()
-        except requests.RequestException as e:
+        except ValueError as e:
             raise AgentRegistrationError(f"Agent registration failed: {str(e)}") from e
 
-    def get_token(self, agent_id: str, scopes: List[str]) -> str:
+    def register_agents(
+        self,
+        specs: Iterable[AgentSpec],
+        max_concurrency: int = 8,
+        batch_size: int = 100,
+        progress: Optional[ProgressCallback] = None
+    ) -> List[RegistrationResult]:
+        """
+        Registers many agents and returns their identities in input order.
+
+        The batch endpoint is tried first, batch_size agents per request. If
+        the server does not expose it, registrations fan out over a thread
+        pool of at most max_concurrency workers sharing the pooled session.
+        Keep max_concurrency at or below config.pool_maxsize to reuse
+        connections.
+
+        Args:
+            specs (iterable): Agent names, (name, metadata) tuples, or
+                {"name": ..., "metadata": ...} dicts.
+            max_concurrency (int): Maximum concurrent registrations for the fan-out.
+            batch_size (int): Agents per batch request.
+            progress (callable): Optional progress(done, total), called from this thread.
+
+        Returns:
+            list: Agent dicts, or the error (e.g. AgentRegistrationError or
+                RequestTimeoutError) for each agent that failed.
+        """
+        payloads = [normalize_agent_spec(spec) for spec in specs]
+        total = len(payloads)
+        results: List[Optional[RegistrationResult]] = [None] * total
+        done = 0
+
+        if self._batch_register_supported is not False:
+            for start, chunk in chunked(payloads, batch_size):
+                chunk_results = self._register_batch(chunk)
+                if chunk_results is None:
+                    break
+                results[start:start + len(chunk)] = chunk_results
+                done += len(chunk)
+                if progress:
+                    progress(done, total)
+
+        pending = list(range(done, total))
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(pending)))) as pool:
+                futures = {
+                    pool.submit(self.register_agent, payloads[i]["name"], payloads[i]["metadata"]): i
+                    for i in pending
+                }
+                for future in as_completed(futures):
+                    try:
+                        results[futures[future]] = future.result()
+                    except SpokeAgentError as e:
+                        results[futures[future]] = e
+                    done += 1
+                    if progress:
+                        progress(done, total)
+
+        return results
+
+    def _register_batch(self, chunk: List[Dict]) -> Optional[List[RegistrationResult]]:
+        """
+        Registers a chunk through the batch endpoint.
+
+        Returns:
+            list or None: Per-agent results, or None if the server has no batch endpoint.
+        """
+        url = f"{self.base_url}{BATCH_REGISTER_PATH}"
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+
+        try:
+            response = self._send("POST", url, AgentRegistrationError, "Agent registration failed", "register_agents",
+                                  json={"agents": chunk}, headers=headers)
+            results = parse_batch_results(response.json(), len(chunk))
+        except SpokeAgentError as e:
+            if e.status_code in BATCH_UNSUPPORTED_STATUSES:
+                self._batch_register_supported = False
+                return None
+            return [e] * len(chunk)
+        except ValueError as e:
+            return [AgentRegistrationError(f"Agent registration failed: {str(e)}")] * len(chunk)
+        self._batch_register_supported = True
+        return results
+
+    def get_token(
+        self,
+        agent_id: str,
+        scopes: List[str],
+        force_refresh: bool = False,
+        timeout: TimeoutSpec = None,
+        deadline: DeadlineSpec = None
+    ) -> str:
         """
         Retrieves a scoped token for the agent.
 
+        Tokens are served from the in-process cache while they remain valid,
+        then from config.token_store if set; a network round trip only
+        happens when both miss or when force_refresh is set. Concurrent
+        callers asking for the same agent and scopes share a single
+        in-flight request.
+
         Args:
             agent_id (str): Registered agent ID.
             scopes (list of str): List of permission scopes.
+            force_refresh (bool): Bypass the cache and store and fetch a new token.
+            timeout (float or tuple): Per-attempt timeout, or (connect, read).
+            deadline (float or Deadline): End-to-end budget in seconds, including
+                time spent waiting on a coalesced fetch.
 
         Returns:
             str: JWT or token string.
 
         Raises:
             TokenRequestError: If token cannot be fetched.
+            RequestTimeoutError: If the request times out or the deadline runs out.
         """
+        if self.token_cache is not None and not force_refresh:
+            cached = self.token_cache.get(agent_id, scopes)
+            if cached:
+                self.tokens.set(agent_id, cached, scopes)
+                self.token = cached
+                return cached
+
+        deadline = Deadline.coerce(deadline)
+        # A forced refresh must not join a normal fetch, which may return the very token it replaces.
+        key = (TokenCache.make_key(agent_id, scopes), force_refresh)
+        try:
+            token = self._token_flight.do(
+                key,
+                lambda: self._fetch_and_store_token(agent_id, scopes, timeout, deadline, force_refresh),
+                timeout=deadline.remaining() if deadline is not None else None
+            )
+        except TimeoutError as e:
+            raise DeadlineExceededError("Failed to fetch token: deadline exceeded.") from e
+        self.tokens.set(agent_id, token, scopes)
+        self.token = token
+        return token
+
+    def _fetch_and_store_token(
+        self,
+        agent_id: str,
+        scopes: List[str],
+        timeout: TimeoutSpec = None,
+        deadline: Optional[Deadline] = None,
+        force_refresh: bool = False
+    ) -> str:
+        """Fetches a token once on behalf of every coalesced caller and caches it."""
+        store = self.config.token_store
+        if store is None:
+            token = self._fetch_token(agent_id, scopes, timeout, deadline)
+        else:
+            token = None if force_refresh else store.get_token(agent_id, scopes)
+            if token is None:
+                with store.lock(f"token:{agent_id}:{scopes_key(scopes)}", deadline):
+                    token = None if force_refresh else store.get_token(agent_id, scopes)
+                    if token is None:
+                        token = self._fetch_token(agent_id, scopes, timeout, deadline)
+                        store.put_token(agent_id, scopes, token)
+        if self.token_cache is not None:
+            self.token_cache.put(agent_id, scopes, token)
+        if self.refresher is not None:
+            self.refresher.schedule(agent_id, scopes, token)
+        return token
+
+    def _refresh_token(self, agent_id: str, scopes: List[str], old_token: str) -> str:
+        """Called from the refresher thread to renew a token ahead of expiry."""
+        token = self._fetch_token(agent_id, scopes)
+        if self.config.token_store is not None:
+            self.config.token_store.put_token(agent_id, scopes, token)
+        if self.token_cache is not None:
+            self.token_cache.put(agent_id, scopes, token)
+        self.tokens.replace(agent_id, old_token, token)
+        if self.token == old_token:
+            self.token = token
+        return token
+
+    def _fetch_token(
+        self,
+        agent_id: str,
+        scopes: List[str],
+        timeout: TimeoutSpec = None,
+        deadline: Optional[Deadline] = None
+    ) -> str:
+        """Requests a new token from /api/agents/token, bypassing the cache."""
         url = f"{self.base_url}/api/agents/token"
         headers = {"Authorization": f"Bearer {self.api_key}"}
         payload = {
@@ -73,50 +522,346 @@ class SpokeAgentClient:
             "scopes": scopes
         }
 
+        # Issuing a token has no side effects, so it is retried like an idempotent request.
+        response = self._send("POST", url, TokenRequestError, "Failed to fetch token", "get_token",
+                              idempotent=True, timeout=timeout, deadline=deadline, json=payload, headers=headers)
         try:
-            response = requests.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            self.token = response.json().get("token")
-            if not self.token:
-                raise TokenRequestError("Token not found in response.")
-            return self.token
-        except requests.RequestException as e:
+            token = response.json().get("token")
+        except (ValueError, AttributeError) as e:
             raise TokenRequestError(f"Failed to fetch token: {str(e)}") from e
+        if not token:
+            raise TokenRequestError("Token not found in response.")
+        return token
 
-    def call_api(self, endpoint: str, method: str = "GET", data: Optional[Dict] = None) -> Dict:
+    def call_api(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: Optional[Dict] = None,
+        agent_id: Optional[str] = None,
+        timeout: TimeoutSpec = None,
+        deadline: DeadlineSpec = None,
+        select: Optional[Iterable[str]] = None
+    ) -> Dict:
         """
         Makes an authenticated API call on behalf of the agent.
 
+        Without agent_id the most recently fetched token (self.token) is
+        used. With agent_id the bearer comes from that agent's entry in the
+        token registry, and is re-fetched first if it is about to expire.
+
+        With config.response_cache set, GET responses are cached per agent,
+        scopes and URL (see ResponseCache).
+
+        With select, only the given paths (see utils.compile_path(), e.g.
+        "items[*].id") are returned as {path: value}. If the optional 'ijson'
+        package is installed, large or unsized bodies are projected while
+        they are parsed, so the rest of the document is never built.
+
         Args:
             endpoint (str): API endpoint path (e.g., /secure/data).
             method (str): HTTP method ('GET', 'POST').
             data (dict): Optional request body.
+            agent_id (str): Optional agent to act for; must have called get_token() before.
+            timeout (float or tuple): Per-attempt timeout, or (connect, read).
+            deadline (float or Deadline): End-to-end budget in seconds covering
+                token renewal, retries and backoff.
+            select (list of str): Optional paths to project the response onto.
 
         Returns:
-            dict: API response.
+            dict: API response, or {path: value} with select.
 
         Raises:
+            ValueError: If a select path is malformed.
             APIRequestError: If request fails.
+            CircuitOpenError: If the circuit breaker for the endpoint is open.
+            RateLimitExceededError: If config.rate_limiter has no capacity for the call.
+            TokenRequestError: If the agent's expiring token cannot be renewed.
+            RequestTimeoutError: If the request times out or the deadline runs out.
         """
-        if not self.token:
-            raise APIRequestError("Token not available. Call get_token() first.")
+        deadline = Deadline.coerce(deadline)
+        select = validate_paths(select) if select is not None else None
+        if self.config.response_cache is not None and method.upper() == "GET":
+            value = self._call_api_cached(endpoint, agent_id, timeout=timeout, deadline=deadline)
+            return project(value, select) if select is not None else value
 
+        incremental = select is not None and can_project_incrementally(select)
+        if incremental:
+            response = self._send_api(endpoint, method, data, agent_id, timeout=timeout, deadline=deadline,
+                                      stream=True)
+        else:
+            response = self._send_api(endpoint, method, data, agent_id, timeout=timeout, deadline=deadline)
+        try:
+            if incremental and is_large_body(response.headers.get("Content-Length")):
+                return project_chunks(response.iter_content(chunk_size=DEFAULT_CHUNK_SIZE), select)
+            value = response.json()
+        except ValueError as e:
+            raise APIRequestError(f"API call failed: {str(e)}") from e
+        except requests.RequestException as e:
+            raise APIRequestError(f"API call failed: {str(e)}") from e
+        finally:
+            response.close()
+        return project(value, select) if select is not None else value
+
+    def _call_api_cached(self, endpoint: str, agent_id: Optional[str], **kwargs) -> Dict:
+        """Serves a GET from config.response_cache, revalidating stale entries with If-None-Match."""
+        cache = self.config.response_cache
+        key = cache.make_key(self._resolve_bearer(agent_id, kwargs.get("deadline")), f"{self.base_url}{endpoint}")
+        entry, fresh = cache.lookup(key)
+        if fresh:
+            return entry.value
+
+        headers = {"If-None-Match": entry.etag} if entry is not None else None
+        response = self._send_api(endpoint, "GET", None, agent_id, extra_headers=headers, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            cache.revalidated(key, response.headers)
+            return entry.value
+        try:
+            value = response.json()
+        except ValueError as e:
+            raise APIRequestError(f"API call failed: {str(e)}") from e
+        if response.status_code == 200:
+            cache.store(key, value, len(response.content), response.headers)
+        return value
+
+    def call_many(
+        self,
+        requests: Iterable[CallSpec],
+        max_concurrency: int = 8,
+        deadline: DeadlineSpec = None,
+        fail_fast: bool = False,
+        timeout: TimeoutSpec = None
+    ) -> List[CallResult]:
+        """
+        Runs many call_api() requests concurrently and returns their results in input order.
+
+        Requests fan out over a thread pool of at most max_concurrency
+        workers sharing the pooled session; keep it at or below
+        config.pool_maxsize to reuse connections. All requests share one
+        deadline, so the batch as a whole finishes within it.
+
+        Example usage:
+
+            results = client.call_many([f"/api/documents/{i}" for i in ids], max_concurrency=8, deadline=5)
+
+        Args:
+            requests (iterable): Endpoints, (endpoint, method, data, agent_id) tuples,
+                or {"endpoint": ..., "method": ..., "data": ..., "agent_id": ...} dicts.
+            max_concurrency (int): Maximum requests in flight.
+            deadline (float or Deadline): End-to-end budget for the whole batch.
+            fail_fast (bool): Raise the first error and skip requests not yet
+                started, instead of collecting every result.
+            timeout (float or tuple): Per-attempt timeout, or (connect, read).
+
+        Returns:
+            list: Response dicts, or the SpokeAgentError raised for each failed request.
+
+        Raises:
+            ValueError: If a request spec is malformed.
+            SpokeAgentError: With fail_fast, the first error encountered.
+        """
+        calls = [normalize_call_spec(spec) for spec in requests]
+        deadline = Deadline.coerce(deadline)
+        results: List[Optional[CallResult]] = [None] * len(calls)
+        if not calls:
+            return results
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(calls)))) as pool:
+            futures = {
+                pool.submit(self.call_api, timeout=timeout, deadline=deadline, **call): i
+                for i, call in enumerate(calls)
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except SpokeAgentError as e:
+                    if fail_fast:
+                        for pending in futures:
+                            pending.cancel()
+                        raise
+                    results[futures[future]] = e
+        return results
+
+    def iter_pages(
+        self,
+        endpoint: str,
+        paginator: Optional[Paginator] = None,
+        agent_id: Optional[str] = None,
+        prefetch: int = DEFAULT_PREFETCH,
+        max_pages: Optional[int] = None,
+        timeout: TimeoutSpec = None
+    ) -> Iterator[Dict]:
+        """
+        Iterates over the pages of a paginated GET endpoint.
+
+        Pages are fetched with call_api() on a background thread that stays
+        up to `prefetch` pages ahead of the caller, so the next request is
+        in flight while the current page is processed; at most `prefetch`
+        pages are buffered. Errors surface from next() in page order.
+
+        Example usage:
+
+            for page in client.iter_pages("/api/documents", OffsetPaginator(page_size=100)):
+                handle(page["items"])
+
+        Args:
+            endpoint (str): API endpoint path, optionally with a query string.
+            paginator (Paginator): CursorPaginator (default), OffsetPaginator or a subclass.
+            agent_id (str): Optional agent to act for (see call_api()).
+            prefetch (int): Pages fetched ahead in the background (0 fetches inline).
+            max_pages (int): Optional cap on the number of pages fetched.
+            timeout (float or tuple): Per-attempt timeout, or (connect, read).
+
+        Returns:
+            iterator: Decoded pages.
+        """
+        paginator = paginator or CursorPaginator()
+        pages = walk_pages(
+            lambda params: self.call_api(with_query(endpoint, params), agent_id=agent_id, timeout=timeout),
+            paginator,
+            max_pages
+        )
+        return prefetch_pages(pages, prefetch)
+
+    def iter_items(
+        self,
+        endpoint: str,
+        paginator: Optional[Paginator] = None,
+        **kwargs
+    ) -> Iterator[Any]:
+        """
+        Iterates over the items of every page of a paginated GET endpoint
+        (see iter_pages() for the arguments).
+        """
+        paginator = paginator or CursorPaginator()
+        for page in self.iter_pages(endpoint, paginator, **kwargs):
+            yield from paginator.items(page)
+
+    def stream_api(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: Optional[Dict] = None,
+        agent_id: Optional[str] = None,
+        mode: str = "chunks",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        timeout: TimeoutSpec = None,
+        deadline: DeadlineSpec = None
+    ) -> Iterator[Any]:
+        """
+        Streams a protected endpoint's response instead of buffering it.
+
+        The request is sent when iteration starts, so errors surface on the
+        first next(). The connection goes back to the pool once the stream
+        is exhausted, closed, or garbage collected, so memory stays flat
+        regardless of response size.
+
+        Example usage:
+
+            for record in client.stream_api("/api/reports/export", mode="ndjson"):
+                handle(record)
+
+        Args:
+            endpoint (str): API endpoint path (e.g., /api/reports/export).
+            method (str): HTTP method ('GET', 'POST').
+            data (dict): Optional request body.
+            agent_id (str): Optional agent to act for (see call_api()).
+            mode (str): "chunks" (raw bytes), "lines" (decoded text lines) or
+                "ndjson" (one decoded JSON record per line).
+            chunk_size (int): Bytes read from the socket at a time.
+            timeout (float or tuple): Per-attempt timeout, or (connect, read); the
+                read timeout applies to each socket read while streaming.
+            deadline (float or Deadline): Budget for getting the response headers.
+
+        Returns:
+            iterator: bytes, str or decoded records depending on mode.
+
+        Raises:
+            ValueError: If mode is not supported.
+            APIRequestError: If the request or the stream fails.
+        """
+        validate_stream_mode(mode)
+        return self._iter_stream(endpoint, method, data, agent_id, mode, chunk_size,
+                                 timeout=timeout, deadline=Deadline.coerce(deadline))
+
+    def _iter_stream(
+        self,
+        endpoint: str,
+        method: str,
+        data: Optional[Dict],
+        agent_id: Optional[str],
+        mode: str,
+        chunk_size: int,
+        **kwargs
+    ) -> Iterator[Any]:
+        response = self._send_api(endpoint, method, data, agent_id, operation="stream_api", stream=True, **kwargs)
+        try:
+            if mode == "chunks":
+                yield from response.iter_content(chunk_size=chunk_size)
+                return
+            if response.encoding is None:
+                response.encoding = "utf-8"
+            lines = response.iter_lines(chunk_size=chunk_size, decode_unicode=True)
+            if mode == "lines":
+                yield from lines
+            else:
+                yield from iter_ndjson(lines)
+        except requests.RequestException as e:
+            raise APIRequestError(f"API stream failed: {str(e)}") from e
+        finally:
+            response.close()
+
+    def _send_api(
+        self,
+        endpoint: str,
+        method: str,
+        data: Optional[Dict],
+        agent_id: Optional[str],
+        operation: str = "call_api",
+        extra_headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> requests.Response:
+        """Sends an authenticated request to a protected endpoint and returns the raw response."""
+        bearer = self._resolve_bearer(agent_id, kwargs.get("deadline"))
         headers = {
-            "Authorization": f"Bearer {self.token}",
+            "Authorization": f"Bearer {bearer}",
             "Content-Type": "application/json"
         }
+        if extra_headers:
+            headers.update(extra_headers)
 
         url = f"{self.base_url}{endpoint}"
+        breaker = self.config.circuit_breaker
+        circuit_key = breaker.key_for(url) if breaker is not None else None
+        if self.config.rate_limiter is not None:
+            kwargs["rate_key"] = (agent_id or AgentToken(bearer).sub or "", endpoint.split("?", 1)[0])
 
-        try:
-            if method.upper() == "GET":
-                response = requests.get(url, headers=headers)
-            elif method.upper() == "POST":
-                response = requests.post(url, json=data or {}, headers=headers)
-            else:
-                raise APIRequestError(f"Unsupported HTTP method: {method}")
+        if method.upper() == "GET":
+            return self._send("GET", url, APIRequestError, "API call failed", operation,
+                              circuit_key=circuit_key, headers=headers, **kwargs)
+        if method.upper() == "POST":
+            return self._send("POST", url, APIRequestError, "API call failed", operation,
+                              circuit_key=circuit_key, json=data or {}, headers=headers, **kwargs)
+        raise APIRequestError(f"Unsupported HTTP method: {method}")
 
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            raise APIRequestError(f"API call failed: {str(e)}") from e
+    def _resolve_bearer(self, agent_id: Optional[str], deadline: Optional[Deadline] = None) -> str:
+        """
+        Returns the bearer for a protected call: the agent's token, or self.token without agent_id.
+
+        Raises:
+            APIRequestError: If no token is available.
+        """
+        bearer = self._bearer_for(agent_id, deadline) if agent_id is not None else self.token
+        if not bearer:
+            raise APIRequestError("Token not available. Call get_token() first.")
+        return bearer
+
+    def _bearer_for(self, agent_id: str, deadline: Optional[Deadline] = None) -> Optional[str]:
+        """Returns the agent's registered token, renewing it if it is within the expiry skew."""
+        entry = self.tokens.get_entry(agent_id)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at - self.config.token_expiry_skew <= time.time():
+            return self.get_token(agent_id, list(entry.scopes), deadline=deadline)
+        return entry.token
@@ -1,5 +1,13 @@
 # Handles API base URL, API keys
 import os
+from typing import Optional
+
+from .circuit import CircuitBreaker
+from .metrics import Metrics
+from .ratelimit import RateLimiter
+from .response_cache import ResponseCache
+from .store import TokenStore
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy
 
 
 class SpokeAgentConfig:
@@ -12,9 +20,62 @@ class SpokeAgentConfig:
             base_url="https://api.spokeagent.com",
             api_key="your_api_key"
         )
+
+    Connection pooling:
+
+        pool_connections (int): Number of per-host connection pools to keep.
+        pool_maxsize (int): Maximum number of connections kept open per host.
+        pool_block (bool): Block when all connections to a host are in use
+            instead of opening extra, non-pooled connections.
+        keep_alive (bool): Reuse TCP/TLS connections between requests.
+        connect_timeout (float): Seconds to wait for a connection (per attempt).
+        read_timeout (float): Seconds to wait for the server between bytes (per attempt).
+
+    Caching:
+
+        token_cache_size (int): Maximum number of cached tokens (0 disables the cache).
+        token_expiry_skew (float): Seconds before `exp` at which a cached token is dropped.
+        proactive_refresh (bool): Renew tokens in the background before they expire.
+        refresh_fraction (float): Portion of a token's lifetime after which it is renewed.
+        response_cache (ResponseCache): Optional cache for GET call_api() responses,
+            revalidated with ETags (None disables).
+        token_store (TokenStore): Optional store of agent identities and tokens shared
+            between processes, consulted before registering or fetching (None disables).
+
+    Resilience:
+
+        retry_policy (RetryPolicy): Retry policy for transient failures (None disables retries).
+        circuit_breaker (CircuitBreaker): Optional breaker applied to call_api() per host and endpoint prefix.
+        rate_limiter (RateLimiter): Optional token-bucket limiter applied to call_api() and
+            stream_api() per agent and endpoint pattern (None disables).
+
+    Observability:
+
+        metrics (Metrics): Optional registry receiving request counters, latency
+            histograms, connection pool and token cache gauges (None disables).
     """
 
-    def __init__(self, base_url: str = None, api_key: str = None):
+    def __init__(
+        self,
+        base_url: str = None,
+        api_key: str = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        token_cache_size: int = 1024,
+        token_expiry_skew: float = 30.0,
+        proactive_refresh: bool = False,
+        refresh_fraction: float = 0.8,
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        metrics: Optional[Metrics] = None,
+        response_cache: Optional[ResponseCache] = None,
+        token_store: Optional[TokenStore] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
         self.base_url = base_url or os.getenv("SPOKEAGENT_BASE_URL")
         self.api_key = api_key or os.getenv("SPOKEAGENT_API_KEY")
 
@@ -24,5 +85,25 @@ class SpokeAgentConfig:
         if not self.api_key:
             raise ValueError("Missing api_key. Provide it directly or set SPOKEAGENT_API_KEY env variable.")
 
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be at least 1.")
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.token_cache_size = token_cache_size
+        self.token_expiry_skew = token_expiry_skew
+        self.proactive_refresh = proactive_refresh
+        self.refresh_fraction = refresh_fraction
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.metrics = metrics
+        self.response_cache = response_cache
+        self.token_store = token_store
+        self.rate_limiter = rate_limiter
+
     def __repr__(self):
         return f"SpokeAgentConfig(base_url='{self.base_url}', api_key='***')"
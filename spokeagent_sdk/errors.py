@@ -1,31 +1,100 @@
 # Custom exceptions for clarity
+from typing import Optional
+
+
 class SpokeAgentError(Exception):
     """
     Base exception for all SpokeAgent SDK errors.
+
+    Attributes:
+        status_code (int or None): HTTP status of the final response, if any.
+        attempts (int): Number of attempts made before giving up.
     """
-    def __init__(self, message: str):
+    def __init__(self, message: str, status_code: Optional[int] = None, attempts: int = 1):
         super().__init__(message)
+        self.status_code = status_code
+        self.attempts = attempts
+
+    @property
+    def retries(self) -> int:
+        """Number of retries made after the first attempt."""
+        return max(0, self.attempts - 1)
 
 
 class AgentRegistrationError(SpokeAgentError):
     """
     Raised when agent registration fails.
     """
-    def __init__(self, message: str = "Failed to register agent."):
-        super().__init__(message)
+    def __init__(self, message: str = "Failed to register agent.", **kwargs):
+        super().__init__(message, **kwargs)
 
 
 class TokenRequestError(SpokeAgentError):
     """
     Raised when token request or parsing fails.
     """
-    def __init__(self, message: str = "Failed to retrieve or parse token."):
-        super().__init__(message)
+    def __init__(self, message: str = "Failed to retrieve or parse token.", **kwargs):
+        super().__init__(message, **kwargs)
 
 
 class APIRequestError(SpokeAgentError):
     """
     Raised for general API call failures.
     """
-    def __init__(self, message: str = "API call failed."):
-        super().__init__(message)
+    def __init__(self, message: str = "API call failed.", **kwargs):
+        super().__init__(message, **kwargs)
+
+
+class TokenVerificationError(SpokeAgentError):
+    """
+    Raised when a token fails offline verification (bad signature, unknown
+    key, expired, or wrong audience/issuer).
+    """
+    def __init__(self, message: str = "Token verification failed.", **kwargs):
+        super().__init__(message, **kwargs)
+
+
+class CircuitOpenError(APIRequestError):
+    """
+    Raised without contacting the server while a circuit breaker is open.
+
+    Attributes:
+        circuit (str): Circuit key ("host/endpoint-prefix").
+        retry_after (float): Seconds until the circuit lets a trial call through.
+    """
+    def __init__(self, circuit: str, retry_after: float = 0.0, **kwargs):
+        super().__init__(f"Circuit open for {circuit}; failing fast.", **kwargs)
+        self.circuit = circuit
+        self.retry_after = retry_after
+
+
+class RateLimitExceededError(APIRequestError):
+    """
+    Raised without contacting the server when the client-side rate limiter
+    has no capacity (fail-fast mode), or cannot free any in time.
+
+    Attributes:
+        bucket (str): Limit that was exhausted ("agent:<id>" or "endpoint:<id>:<pattern>").
+        retry_after (float): Seconds until a request would be admitted.
+    """
+    def __init__(self, bucket: str, retry_after: float = 0.0, **kwargs):
+        super().__init__(f"Rate limit exceeded for {bucket}; retry in {retry_after:.3f}s.", **kwargs)
+        self.bucket = bucket
+        self.retry_after = retry_after
+
+
+class RequestTimeoutError(SpokeAgentError):
+    """
+    Raised when a request times out (connect or read), after any retries.
+    """
+    def __init__(self, message: str = "Request timed out.", **kwargs):
+        super().__init__(message, **kwargs)
+
+
+class DeadlineExceededError(RequestTimeoutError):
+    """
+    Raised when an operation's end-to-end deadline runs out, including time
+    spent renewing tokens, retrying and backing off.
+    """
+    def __init__(self, message: str = "Deadline exceeded.", **kwargs):
+        super().__init__(message, **kwargs)
@@ -1,8 +1,55 @@
 # Optional LangChain adapter
+import asyncio
+import threading
+import weakref
 from langchain.tools import Tool
-from typing import List, Optional, Callable
+from typing import Any, Dict, Iterable, List, Optional, Callable
 
 from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.async_client import AsyncSpokeAgentClient
+
+
+class _AsyncClients:
+    """
+    Lazily creates one AsyncSpokeAgentClient per event loop (httpx
+    connections cannot be shared across loops). Each one shares the sync
+    client's token registry, cache and refresher, so no extra registration,
+    token fetch or refresh thread is needed and renewals by either client
+    are seen by both. Bearers are always read from the shared registry.
+
+    Clients of loops that have since closed are dropped on the next get();
+    aclose() closes the running loop's client.
+    """
+
+    def __init__(self, config: SpokeAgentConfig, client: SpokeAgentClient):
+        self.config = config
+        self.client = client
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncSpokeAgentClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def get(self) -> AsyncSpokeAgentClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for closed in [other for other in self._clients if other.is_closed()]:
+                del self._clients[closed]
+            async_client = self._clients.get(loop)
+            if async_client is None:
+                async_client = AsyncSpokeAgentClient(self.config)
+                async_client.tokens = self.client.tokens
+                async_client.token_cache = self.client.token_cache
+                async_client.refresher = self.client.refresher
+                self._clients[loop] = async_client
+        return async_client
+
+    async def aclose(self) -> None:
+        """Closes the running loop's client, if one was created."""
+        with self._lock:
+            async_client = self._clients.pop(asyncio.get_running_loop(), None)
+        if async_client is not None:
+            async_client.refresher = None  # owned by the sync client
+            await async_client.aclose()
 
 
 class SpokeAgentTool:
@@ -29,6 +76,7 @@ class SpokeAgentTool:
         self.client = SpokeAgentClient(config)
         self.agent = self.client.register_agent(agent_name, metadata)
         self.client.get_token(self.agent["id"], scopes)
+        self._async_clients = _AsyncClients(config, self.client)
 
     def as_tool(
         self,
@@ -41,6 +89,10 @@ class SpokeAgentTool:
         """
         Returns a LangChain-compatible Tool for this agent's secure API access.
 
+        The tool has both a sync func and a native coroutine, so async
+        agents (ainvoke/abatch) run concurrent tool calls without tying up
+        a thread each.
+
         Args:
             name (str): Tool name for LangChain agent.
             description (str): Natural language description.
@@ -56,4 +108,129 @@ class SpokeAgentTool:
             result = self.client.call_api(endpoint=endpoint, method=method, data=payload)
             return str(result)
 
-        return Tool(name=name, func=_fn, description=description)
+        async def _afn(input_text: str) -> str:
+            payload = input_map(input_text) if input_map else {"query": input_text}
+            result = await self._async_clients.get().call_api(
+                endpoint=endpoint, method=method, data=payload, agent_id=self.agent["id"]
+            )
+            return str(result)
+
+        return Tool(name=name, func=_fn, coroutine=_afn, description=description)
+
+    async def aclose(self) -> None:
+        """Closes the async client used by tools invoked on the running event loop."""
+        await self._async_clients.aclose()
+
+
+class SpokeAgentToolkit:
+    """
+    Builds many LangChain Tools for one agent on top of a single shared client.
+
+    Unlike SpokeAgentTool, nothing is sent at construction: the agent is
+    registered and its token fetched on the first tool invocation (once,
+    even if several tools are invoked concurrently). Tools call the API on
+    behalf of that agent, so its token is renewed when it nears expiry.
+
+    Example usage:
+
+        toolkit = SpokeAgentToolkit(config, agent_name="reporter", scopes=["read:data"])
+        tools = toolkit.get_tools([
+            {"name": "ReportFetcher", "description": "Fetches today's report",
+             "endpoint": "/api/reports/today", "method": "GET"},
+            {"name": "KnowledgeSearch", "description": "Searches the knowledge base",
+             "endpoint": "/api/query/knowledge"}
+        ])
+    """
+
+    def __init__(
+        self,
+        config: SpokeAgentConfig,
+        agent_name: str,
+        scopes: List[str],
+        metadata: Optional[dict] = None,
+        client: Optional[SpokeAgentClient] = None
+    ):
+        """
+        Args:
+            config (SpokeAgentConfig): Configuration with base_url and API key.
+            agent_name (str): Name of the AI agent to register on first use.
+            scopes (list): Scopes for token access (e.g., ['read:logs']).
+            metadata (dict): Optional metadata about the agent.
+            client (SpokeAgentClient): Optional existing client to share.
+        """
+        self.client = client or SpokeAgentClient(config)
+        self.agent_name = agent_name
+        self.scopes = scopes
+        self.metadata = metadata
+        self.agent: Optional[Dict] = None
+        self._lock = threading.Lock()
+        self._async_clients = _AsyncClients(self.client.config, self.client)
+
+    def ensure_agent(self) -> str:
+        """
+        Registers the agent and fetches its token on first use.
+
+        A failure is raised to the caller and retried on the next invocation.
+
+        Returns:
+            str: The agent ID.
+        """
+        agent = self.agent
+        if agent is None:
+            with self._lock:
+                agent = self.agent
+                if agent is None:
+                    agent = self.client.register_agent(self.agent_name, self.metadata)
+                    self.client.get_token(agent["id"], self.scopes)
+                    self.agent = agent
+        return agent["id"]
+
+    async def aensure_agent(self) -> str:
+        """Async variant of ensure_agent(); the one-off setup runs in a worker thread."""
+        if self.agent is not None:
+            return self.agent["id"]
+        return await asyncio.get_running_loop().run_in_executor(None, self.ensure_agent)
+
+    def as_tool(
+        self,
+        name: str,
+        description: str,
+        endpoint: str,
+        method: str = "POST",
+        input_map: Optional[Callable[[str], dict]] = None
+    ) -> Tool:
+        """
+        Returns a LangChain Tool for one endpoint (see SpokeAgentTool.as_tool()).
+        """
+        def _fn(input_text: str) -> str:
+            agent_id = self.ensure_agent()
+            payload = input_map(input_text) if input_map else {"query": input_text}
+            result = self.client.call_api(endpoint=endpoint, method=method, data=payload, agent_id=agent_id)
+            return str(result)
+
+        async def _afn(input_text: str) -> str:
+            agent_id = await self.aensure_agent()
+            payload = input_map(input_text) if input_map else {"query": input_text}
+            result = await self._async_clients.get().call_api(
+                endpoint=endpoint, method=method, data=payload, agent_id=agent_id
+            )
+            return str(result)
+
+        return Tool(name=name, func=_fn, coroutine=_afn, description=description)
+
+    def get_tools(self, specs: Iterable[Dict[str, Any]]) -> List[Tool]:
+        """
+        Builds one Tool per endpoint spec.
+
+        Args:
+            specs (iterable): Dicts with "name", "description" and "endpoint",
+                and optionally "method" (default POST) and "input_map".
+
+        Returns:
+            list: LangChain Tool instances sharing this toolkit's client and token.
+        """
+        return [self.as_tool(**spec) for spec in specs]
+
+    async def aclose(self) -> None:
+        """Closes the async client used by tools invoked on the running event loop."""
+        await self._async_clients.aclose()
@@ -0,0 +1,236 @@
+# Lightweight metrics: counters, gauges and latency histograms
+import bisect
+import re
+import threading
+import weakref
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, Union
+
+from .errors import CircuitOpenError, RateLimitExceededError, RequestTimeoutError, SpokeAgentError
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+Sample = Tuple[str, Dict[str, str], float]
+Collector = Callable[[], Iterable[Sample]]
+
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,})$")
+
+
+def status_class(status: Union[None, int, str]) -> str:
+    """
+    Maps a status code to "2xx"/"4xx"/..., or "error" when no response was
+    received. Strings (e.g. "timeout") are used as-is.
+    """
+    if status is None:
+        return "error"
+    if isinstance(status, str):
+        return status
+    return f"{status // 100}xx"
+
+
+def request_outcome(error: SpokeAgentError) -> Union[None, int, str]:
+    """Returns the status label for a failed request."""
+    if isinstance(error, CircuitOpenError):
+        return "circuit_open"
+    if isinstance(error, RateLimitExceededError):
+        return "rate_limited"
+    if isinstance(error, RequestTimeoutError):
+        return "timeout"
+    return error.status_code
+
+
+def endpoint_label(path: str) -> str:
+    """
+    Normalizes a request path into a low-cardinality label.
+
+    Query strings are dropped and numeric or UUID/hex-like segments are
+    replaced with ":id", so /api/documents/123 and /api/documents/456 share
+    a series.
+    """
+    path = path.split("?", 1)[0]
+    return "/".join(":id" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Sequence[Tuple[str, str]] = ()) -> str:
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class Metrics:
+    """
+    In-process metrics registry with no external dependencies.
+
+    The clients record a counter and a latency histogram per logical
+    request, labeled by operation, endpoint, method and status class.
+    Collectors registered by the clients add connection-pool and token-cache
+    gauges lazily, only when a snapshot is taken. Metrics are disabled by
+    default (config.metrics is None), in which case the clients skip all
+    recording.
+
+    Example usage:
+
+        metrics = Metrics()
+        client = SpokeAgentClient(SpokeAgentConfig(..., metrics=metrics))
+        ...
+        metrics.snapshot()           # dict
+        metrics.render_prometheus()  # Prometheus text exposition format
+    """
+
+    def __init__(self, namespace: str = "spokeagent", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            namespace (str): Prefix for every metric name.
+            buckets (sequence): Upper bounds (seconds) of the latency histogram buckets.
+        """
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], _Histogram] = {}
+        self._collectors: List[Collector] = []
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, labels: Dict[str, str], value: float = 1.0) -> None:
+        """Adds value to a counter."""
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, labels: Dict[str, str], value: float) -> None:
+        """Records one observation in a histogram."""
+        key = (name, _labels(labels))
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(len(self.buckets))
+            if index < len(self.buckets):
+                histogram.counts[index] += 1
+            histogram.sum += value
+            histogram.count += 1
+
+    def observe_request(
+        self,
+        operation: str,
+        endpoint: str,
+        method: str,
+        status: Union[None, int, str],
+        latency: float
+    ) -> None:
+        """Records one logical client request; latency includes retries and backoff."""
+        labels = {
+            "operation": operation,
+            "endpoint": endpoint_label(endpoint),
+            "method": method.upper(),
+            "status_class": status_class(status)
+        }
+        self.inc("requests_total", labels)
+        self.observe("request_duration_seconds", labels, latency)
+
+    def add_collector(self, collector: Collector) -> None:
+        """
+        Registers a callable returning (name, labels, value) gauge samples.
+
+        Collectors run only when a snapshot is taken. Samples with the same
+        name and labels from different collectors are summed, so several
+        clients can share one registry. A weakref.WeakMethod may be passed
+        so the registry does not keep its owner alive; it is dropped once
+        the owner is collected.
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def remove_collector(self, collector: Collector) -> None:
+        with self._lock:
+            if collector in self._collectors:
+                self._collectors.remove(collector)
+
+    def _collect_gauges(self) -> Dict[Tuple[str, Labels], float]:
+        with self._lock:
+            collectors = list(self._collectors)
+        gauges: Dict[Tuple[str, Labels], float] = {}
+        for collector in collectors:
+            if isinstance(collector, weakref.WeakMethod):
+                method = collector()
+                if method is None:
+                    self.remove_collector(collector)
+                    continue
+                collector = method
+            for name, labels, value in collector():
+                key = (name, _labels(labels))
+                gauges[key] = gauges.get(key, 0.0) + value
+        return gauges
+
+    def snapshot(self) -> Dict[str, Dict[str, List[Dict]]]:
+        """
+        Returns every metric as plain data.
+
+        Returns:
+            dict: {"counters": {name: [{"labels": ..., "value": ...}]},
+                   "gauges": {...},
+                   "histograms": {name: [{"labels": ..., "buckets": {le: cumulative count},
+                                          "sum": ..., "count": ...}]}}
+        """
+        gauges = self._collect_gauges()
+        result: Dict[str, Dict[str, List[Dict]]] = {"counters": {}, "gauges": {}, "histograms": {}}
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                result["counters"].setdefault(name, []).append({"labels": dict(labels), "value": value})
+            for (name, labels), histogram in sorted(self._histograms.items(), key=lambda item: item[0]):
+                cumulative, buckets = 0, {}
+                for bound, count in zip(self.buckets, histogram.counts):
+                    cumulative += count
+                    buckets[str(bound)] = cumulative
+                buckets["+Inf"] = histogram.count
+                result["histograms"].setdefault(name, []).append({
+                    "labels": dict(labels),
+                    "buckets": buckets,
+                    "sum": histogram.sum,
+                    "count": histogram.count
+                })
+        for (name, labels), value in sorted(gauges.items()):
+            result["gauges"].setdefault(name, []).append({"labels": dict(labels), "value": value})
+        return result
+
+    def render_prometheus(self) -> str:
+        """Renders every metric in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines: List[str] = []
+        for kind, prom_type in (("counters", "counter"), ("gauges", "gauge")):
+            for name, series in snapshot[kind].items():
+                full_name = f"{self.namespace}_{name}"
+                lines.append(f"# TYPE {full_name} {prom_type}")
+                for sample in series:
+                    lines.append(f"{full_name}{_format_labels(_labels(sample['labels']))} {_format_value(sample['value'])}")
+        for name, series in snapshot["histograms"].items():
+            full_name = f"{self.namespace}_{name}"
+            lines.append(f"# TYPE {full_name} histogram")
+            for sample in series:
+                labels = _labels(sample["labels"])
+                for bound, count in sample["buckets"].items():
+                    lines.append(f"{full_name}_bucket{_format_labels(labels, [('le', bound)])} {count}")
+                lines.append(f"{full_name}_sum{_format_labels(labels)} {_format_value(sample['sum'])}")
+                lines.append(f"{full_name}_count{_format_labels(labels)} {sample['count']}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,254 @@
+# Cursor and offset pagination with background prefetch (shared by the sync and async clients)
+import abc
+import asyncio
+import queue
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlencode
+
+from .utils import safe_get
+
+DEFAULT_PREFETCH = 2
+
+
+class Paginator(abc.ABC):
+    """
+    Describes how a list endpoint is paged: the query parameters of the
+    first page, how to derive the next page's parameters from a response,
+    and where the items live in it. Subclass it for other schemes;
+    next_params() must be implemented.
+    """
+
+    def __init__(self, items_field: str = "items"):
+        """
+        Args:
+            items_field (str): Dot-separated path of the item list in each page.
+        """
+        self.items_field = items_field
+
+    def first_params(self) -> Dict[str, Any]:
+        return {}
+
+    @abc.abstractmethod
+    def next_params(self, page: Dict, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Returns the next page's query parameters, or None after the last page."""
+
+    def items(self, page: Dict) -> List:
+        items = safe_get(page, self.items_field)
+        return items if isinstance(items, list) else []
+
+
+class CursorPaginator(Paginator):
+    """
+    Follows an opaque cursor returned with each page, e.g.
+    {"items": [...], "next_cursor": "abc"} -> ?cursor=abc.
+
+    Example usage:
+
+        for item in client.iter_items("/api/documents", CursorPaginator(page_size=100)):
+            handle(item)
+    """
+
+    def __init__(
+        self,
+        cursor_param: str = "cursor",
+        cursor_field: str = "next_cursor",
+        items_field: str = "items",
+        page_size: Optional[int] = None,
+        size_param: str = "limit"
+    ):
+        """
+        Args:
+            cursor_param (str): Query parameter carrying the cursor.
+            cursor_field (str): Dot-separated path of the next cursor in each page;
+                a missing or empty cursor ends pagination.
+            items_field (str): Dot-separated path of the item list in each page.
+            page_size (int): Optional page size sent as size_param.
+            size_param (str): Query parameter carrying the page size.
+        """
+        super().__init__(items_field)
+        self.cursor_param = cursor_param
+        self.cursor_field = cursor_field
+        self.page_size = page_size
+        self.size_param = size_param
+
+    def first_params(self) -> Dict[str, Any]:
+        return {self.size_param: self.page_size} if self.page_size else {}
+
+    def next_params(self, page: Dict, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        cursor = safe_get(page, self.cursor_field)
+        if not cursor:
+            return None
+        return {**params, self.cursor_param: cursor}
+
+
+class OffsetPaginator(Paginator):
+    """
+    Pages with offset/limit parameters until a short page (or the reported
+    total) is reached, e.g. ?offset=200&limit=100.
+    """
+
+    def __init__(
+        self,
+        page_size: int = 100,
+        offset_param: str = "offset",
+        limit_param: str = "limit",
+        items_field: str = "items",
+        total_field: Optional[str] = None,
+        start: int = 0
+    ):
+        """
+        Args:
+            page_size (int): Items requested per page.
+            offset_param (str): Query parameter carrying the offset.
+            limit_param (str): Query parameter carrying the page size.
+            items_field (str): Dot-separated path of the item list in each page.
+            total_field (str): Optional dot-separated path of the total item count.
+            start (int): Offset of the first page.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1.")
+        super().__init__(items_field)
+        self.page_size = page_size
+        self.offset_param = offset_param
+        self.limit_param = limit_param
+        self.total_field = total_field
+        self.start = start
+
+    def first_params(self) -> Dict[str, Any]:
+        return {self.offset_param: self.start, self.limit_param: self.page_size}
+
+    def next_params(self, page: Dict, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        count = len(self.items(page))
+        offset = params[self.offset_param] + count
+        total = safe_get(page, self.total_field) if self.total_field else None
+        if count < self.page_size or (isinstance(total, int) and offset >= total):
+            return None
+        return {**params, self.offset_param: offset}
+
+
+def with_query(endpoint: str, params: Dict[str, Any]) -> str:
+    """Appends query parameters to an endpoint that may already have some."""
+    if not params:
+        return endpoint
+    return f"{endpoint}{'&' if '?' in endpoint else '?'}{urlencode(params)}"
+
+
+def walk_pages(
+    fetch: Callable[[Dict[str, Any]], Dict],
+    paginator: Paginator,
+    max_pages: Optional[int] = None
+) -> Iterator[Dict]:
+    """Fetches pages one after another with fetch(params)."""
+    params = paginator.first_params()
+    fetched = 0
+    while params is not None and (max_pages is None or fetched < max_pages):
+        page = fetch(params)
+        fetched += 1
+        yield page
+        params = paginator.next_params(page, params)
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_END = object()
+
+
+def prefetch_pages(pages: Iterator[Dict], prefetch: int = DEFAULT_PREFETCH) -> Iterator[Dict]:
+    """
+    Drives a page iterator from a background thread, keeping at most
+    `prefetch` pages buffered ahead of the consumer.
+
+    Errors are re-raised in the consumer at the position they occurred.
+    Closing the returned generator (or dropping it) stops the producer
+    after its current request.
+    """
+    if prefetch < 1:
+        yield from pages
+        return
+
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=prefetch)
+    stopped = threading.Event()
+
+    def offer(item: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for page in pages:
+                if not offer(page):
+                    return
+        except BaseException as e:  # re-raised in the consumer
+            offer(_Failure(e))
+            return
+        offer(_END)
+
+    producer = threading.Thread(target=produce, name="spokeagent-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stopped.set()
+
+
+async def awalk_pages(
+    fetch: Callable[[Dict[str, Any]], Awaitable[Dict]],
+    paginator: Paginator,
+    max_pages: Optional[int] = None
+) -> AsyncIterator[Dict]:
+    """Async counterpart of walk_pages()."""
+    params = paginator.first_params()
+    fetched = 0
+    while params is not None and (max_pages is None or fetched < max_pages):
+        page = await fetch(params)
+        fetched += 1
+        yield page
+        params = paginator.next_params(page, params)
+
+
+async def aprefetch_pages(pages: AsyncIterator[Dict], prefetch: int = DEFAULT_PREFETCH) -> AsyncIterator[Dict]:
+    """Async counterpart of prefetch_pages(), driving the pages from a task on the running loop."""
+    if prefetch < 1:
+        async for page in pages:
+            yield page
+        return
+
+    buffer: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=prefetch)
+
+    async def produce() -> None:
+        try:
+            async for page in pages:
+                await buffer.put(page)
+        except Exception as e:  # re-raised in the consumer
+            await buffer.put(_Failure(e))
+            return
+        await buffer.put(_END)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        producer.cancel()
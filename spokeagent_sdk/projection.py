@@ -0,0 +1,205 @@
+# Field projection for call_api(select=...), incremental for large bodies
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .errors import APIRequestError
+from .utils import WILDCARD, JSONPath, PathSegment, compile_path
+
+try:
+    import ijson
+except ImportError:  # incremental projection needs the optional 'ijson' package
+    ijson = None
+
+# Bodies at least this large (or of unknown length) are projected while parsing.
+INCREMENTAL_THRESHOLD = 1024 * 1024
+
+_VALUE_START = frozenset({"start_map", "start_array", "null", "boolean", "integer", "double", "number", "string"})
+
+
+def validate_paths(paths: Iterable[str]) -> List[str]:
+    """
+    Compiles every path up front so a bad selection fails before any request is sent.
+
+    Raises:
+        ValueError: If a path is malformed.
+    """
+    paths = list(paths)
+    for path in paths:
+        compile_path(path)
+    return paths
+
+
+def can_project_incrementally(paths: Iterable[str]) -> bool:
+    """Returns True if ijson is installed and no path needs a negative (from-the-end) index."""
+    if ijson is None:
+        return False
+    return not any(isinstance(s, int) and s < 0 for path in paths for s in compile_path(path).segments)
+
+
+def is_large_body(content_length: Optional[str]) -> bool:
+    """Returns True if a body should be projected while parsing rather than decoded whole."""
+    try:
+        return content_length is None or int(content_length) >= INCREMENTAL_THRESHOLD
+    except ValueError:
+        return True
+
+
+class _Frame:
+    __slots__ = ("is_array", "key")
+
+    def __init__(self, is_array: bool):
+        self.is_array = is_array
+        self.key: PathSegment = -1 if is_array else ""
+
+
+class Projector:
+    """
+    Extracts selected paths from a JSON document while it is being parsed.
+
+    Raw chunks go in through feed(). Only the values at selected paths are
+    built; everything else is tokenized and discarded, so the unused parts
+    of the document are never materialized. Requires the optional 'ijson'
+    package.
+
+    Example usage:
+
+        projector = Projector(["meta.total", "items[*].id"])
+        for chunk in chunks:
+            projector.feed(chunk)
+        projector.close()["items[*].id"]
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        """
+        Raises:
+            ValueError: If a path is malformed or uses a negative index.
+            RuntimeError: If 'ijson' is not installed.
+        """
+        if ijson is None:
+            raise RuntimeError("Incremental projection requires the 'ijson' package.")
+        self.paths: List[JSONPath] = [compile_path(path) for path in paths]
+        if not can_project_incrementally(path.path for path in self.paths):
+            raise ValueError("Negative indices cannot be resolved while parsing.")
+        self._results: Dict[str, Any] = {path.path: [] if path.has_wildcard else None for path in self.paths}
+        self._pending = {path.path for path in self.paths if not path.has_wildcard}
+        self._stack: List[_Frame] = []
+        self._builders: List[List[Any]] = []  # [matched paths, ObjectBuilder, depth]
+        self._skip_depth = 0
+        self._events = ijson.sendable_list()
+        self._parser = ijson.parse_coro(self._events, use_float=True)
+
+    @property
+    def done(self) -> bool:
+        """True once every selected path is known, so the rest of the body can be skipped."""
+        return not self._pending and not self._builders and not any(path.has_wildcard for path in self.paths)
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Raises:
+            APIRequestError: If the body is not valid JSON.
+        """
+        try:
+            self._parser.send(chunk)
+        except ijson.JSONError as e:
+            raise APIRequestError(f"API call failed: {str(e)}") from e
+        for _, event, value in self._events:
+            self._on_event(event, value)
+        del self._events[:]
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Finishes parsing and returns {path: value}, like utils.project().
+
+        Raises:
+            APIRequestError: If the body is truncated or invalid.
+        """
+        if not self.done:
+            try:
+                self._parser.close()
+            except ijson.JSONError as e:
+                raise APIRequestError(f"API call failed: {str(e)}") from e
+            for _, event, value in self._events:
+                self._on_event(event, value)
+            del self._events[:]
+        return self._results
+
+    def _on_event(self, event: str, value: Any) -> None:
+        for active in list(self._builders):
+            active[1].event(event, value)
+            if event in ("start_map", "start_array"):
+                active[2] += 1
+            elif event in ("end_map", "end_array"):
+                active[2] -= 1
+                if not active[2]:
+                    self._builders.remove(active)
+                    self._store(active[0], active[1].value)
+
+        # Containers that no path can reach are still tokenized, but never built or tracked.
+        if self._skip_depth:
+            if event in ("start_map", "start_array"):
+                self._skip_depth += 1
+            elif event in ("end_map", "end_array"):
+                self._skip_depth -= 1
+                if not self._skip_depth:
+                    self._stack.pop()
+            return
+
+        if event == "map_key":
+            self._stack[-1].key = value
+            return
+        if event in ("end_map", "end_array"):
+            self._stack.pop()
+            return
+        if event not in _VALUE_START:
+            return
+
+        if self._stack and self._stack[-1].is_array:
+            self._stack[-1].key += 1
+        location = [frame.key for frame in self._stack]
+        matched = [path for path in self.paths if _matches(path.segments, location, full=True)]
+        container = event in ("start_map", "start_array")
+        if matched:
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            if container:
+                self._builders.append([matched, builder, 1])
+            else:
+                self._store(matched, builder.value)
+        if container:
+            self._stack.append(_Frame(event == "start_array"))
+            if not any(len(path.segments) > len(location) and _matches(path.segments, location, full=False)
+                       for path in self.paths):
+                self._skip_depth = 1
+
+    def _store(self, matched: List[JSONPath], value: Any) -> None:
+        for path in matched:
+            if path.has_wildcard:
+                self._results[path.path].append(value)
+            elif path.path in self._pending:
+                self._results[path.path] = value
+                self._pending.discard(path.path)
+
+
+def _matches(segments: Tuple[PathSegment, ...], location: List[PathSegment], full: bool) -> bool:
+    """Checks a concrete location against a path: fully, or as a prefix the path may continue from."""
+    if len(location) > len(segments) or (full and len(location) != len(segments)):
+        return False
+    for segment, key in zip(segments, location):
+        if segment == WILDCARD:
+            continue
+        if isinstance(key, int):
+            if not (isinstance(segment, int) or segment.isdigit()) or int(segment) != key:
+                return False
+        elif str(segment) != key:
+            return False
+    return True
+
+
+def project_chunks(chunks: Iterable[bytes], paths: Iterable[str]) -> Dict[str, Any]:
+    """Projects a body given as an iterable of chunks, stopping early once every path is known."""
+    projector = Projector(paths)
+    for chunk in chunks:
+        projector.feed(chunk)
+        if projector.done:
+            break
+    return projector.close()
+
@@ -0,0 +1,227 @@
+# Client-side token-bucket rate limiting per agent and endpoint pattern
+import asyncio
+import threading
+import time
+from fnmatch import fnmatchcase
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from .errors import RateLimitExceededError
+from .retry import RetryPolicy
+
+
+class Limit(NamedTuple):
+    """A sustained rate in requests per second and the burst allowed on top of it."""
+    rate: float
+    burst: float = 1.0
+
+
+LimitSpec = Union[Limit, Tuple[float, float], float]
+
+
+def _coerce_limit(spec: LimitSpec) -> Limit:
+    if isinstance(spec, Limit):
+        limit = spec
+    elif isinstance(spec, tuple):
+        limit = Limit(*spec)
+    else:
+        limit = Limit(float(spec), max(1.0, float(spec)))
+    if limit.rate <= 0 or limit.burst < 1:
+        raise ValueError("rate must be positive and burst at least 1.")
+    return limit
+
+
+class _Bucket:
+    __slots__ = ("name", "limit", "rate", "tokens", "updated")
+
+    def __init__(self, name: str, limit: Limit, now: float):
+        self.name = name
+        self.limit = limit
+        self.rate = limit.rate
+        self.tokens = limit.burst
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.limit.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait(self) -> float:
+        """Seconds until one token is available (after refill())."""
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """
+    Shapes outgoing call_api()/stream_api() traffic with token buckets so
+    bursty agents stay under AuthSpoke's quotas instead of collecting 429s.
+
+    Every request takes one token from its agent's bucket and, if the
+    endpoint matches one of the `endpoints` patterns (fnmatch, first match
+    wins), from that agent's bucket for the pattern. Agents listed in
+    `agents` get their own limit; the others get `default` (None leaves
+    them unlimited per agent).
+
+    When a bucket is empty the request either waits for a token (blocking
+    mode, the default) or raises RateLimitExceededError (fail-fast).
+    Waiting callers reserve their token up front, so they are served in
+    arrival order. State sits behind one lock that is never held across a
+    sleep or an await, so a single limiter shapes traffic across every
+    thread and event loop in the process.
+
+    With adaptive=True a 429 response multiplies the rates of the buckets
+    involved by `decrease_factor` (and honours Retry-After by draining
+    them); each successful response then restores `increase_step` of the
+    configured rate, up to that rate.
+
+    Example usage:
+
+        limiter = RateLimiter(default=Limit(rate=10, burst=20),
+                              endpoints={"/api/reports/*": Limit(rate=1, burst=2)},
+                              adaptive=True)
+        config = SpokeAgentConfig(..., rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        default: Optional[LimitSpec] = None,
+        agents: Optional[Dict[str, LimitSpec]] = None,
+        endpoints: Optional[Dict[str, LimitSpec]] = None,
+        block: bool = True,
+        max_wait: Optional[float] = None,
+        adaptive: bool = False,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.05,
+        min_rate_fraction: float = 0.05,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            default (Limit): Per-agent limit for agents not listed in `agents`
+                (a bare number means that rate with an equal burst).
+            agents (dict): Agent ID -> Limit overrides.
+            endpoints (dict): Endpoint path pattern (e.g. "/api/reports/*") -> Limit,
+                applied per agent.
+            block (bool): Wait for capacity instead of raising RateLimitExceededError.
+            max_wait (float): Longest wait in blocking mode before failing (None waits
+                as long as needed, bounded by the call's deadline).
+            adaptive (bool): Shrink rates on 429 responses and recover them on success.
+            decrease_factor (float): Multiplier applied to a bucket's rate on 429.
+            increase_step (float): Fraction of the configured rate restored per success.
+            min_rate_fraction (float): Floor for adaptive rates, as a fraction of the configured rate.
+            clock (callable): Monotonic time source (overridable for tests).
+        """
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be in (0, 1).")
+        self.default = _coerce_limit(default) if default is not None else None
+        self.agents = {agent: _coerce_limit(spec) for agent, spec in (agents or {}).items()}
+        self.endpoints = [(pattern, _coerce_limit(spec)) for pattern, spec in (endpoints or {}).items()]
+        self.block = block
+        self.max_wait = max_wait
+        self.adaptive = adaptive
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.min_rate_fraction = min_rate_fraction
+        self._clock = clock
+        self._buckets: Dict[str, _Bucket] = {}
+        self._pattern_cache: Dict[str, Optional[Tuple[str, Limit]]] = {}
+        self._lock = threading.Lock()
+
+    def _match(self, endpoint: str) -> Optional[Tuple[str, Limit]]:
+        try:
+            return self._pattern_cache[endpoint]
+        except KeyError:
+            pass
+        match = next(((p, limit) for p, limit in self.endpoints if fnmatchcase(endpoint, p)), None)
+        if len(self._pattern_cache) < 4096:
+            self._pattern_cache[endpoint] = match
+        return match
+
+    def _buckets_for(self, agent: str, endpoint: str, now: float) -> List[_Bucket]:
+        """Returns the buckets a request draws from, creating them on first use (lock held)."""
+        specs = []
+        agent_limit = self.agents.get(agent, self.default)
+        if agent_limit is not None:
+            specs.append((f"agent:{agent}", agent_limit))
+        match = self._match(endpoint)
+        if match is not None:
+            specs.append((f"endpoint:{agent}:{match[0]}", match[1]))
+
+        buckets = []
+        for name, limit in specs:
+            bucket = self._buckets.get(name)
+            if bucket is None:
+                bucket = self._buckets[name] = _Bucket(name, limit, now)
+            else:
+                bucket.refill(now)
+            buckets.append(bucket)
+        return buckets
+
+    def reserve(self, agent: str, endpoint: str, max_wait: Optional[float] = None) -> float:
+        """
+        Takes one token from every bucket for the request and returns how
+        long the caller must wait before sending it (0 when capacity is
+        available). Nothing is taken if the request is refused.
+
+        Args:
+            agent (str): Agent ID (or token subject) the request is made for.
+            endpoint (str): Endpoint path, matched against the endpoint patterns.
+            max_wait (float): Refuse rather than wait longer than this; combined with
+                the limiter's own max_wait.
+
+        Raises:
+            RateLimitExceededError: In fail-fast mode when a bucket is empty, or
+                when the wait would exceed max_wait.
+        """
+        if self.max_wait is not None:
+            max_wait = self.max_wait if max_wait is None else min(max_wait, self.max_wait)
+        with self._lock:
+            buckets = self._buckets_for(agent, endpoint, self._clock())
+            if not buckets:
+                return 0.0
+            slowest = max(buckets, key=_Bucket.wait)
+            delay = slowest.wait()
+            if delay > 0 and (not self.block or (max_wait is not None and delay > max_wait)):
+                raise RateLimitExceededError(slowest.name, delay)
+            for bucket in buckets:
+                bucket.tokens -= 1
+            return delay
+
+    def acquire(self, agent: str, endpoint: str, max_wait: Optional[float] = None) -> None:
+        """Blocks the calling thread until the request is admitted (see reserve())."""
+        delay = self.reserve(agent, endpoint, max_wait)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, agent: str, endpoint: str, max_wait: Optional[float] = None) -> None:
+        """Suspends the calling task until the request is admitted (see reserve())."""
+        delay = self.reserve(agent, endpoint, max_wait)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record(self, agent: str, endpoint: str, status_code: int, retry_after: Optional[str] = None) -> None:
+        """Feeds a response status back into adaptive mode (no-op otherwise)."""
+        if not self.adaptive:
+            return
+        with self._lock:
+            now = self._clock()
+            buckets = self._buckets_for(agent, endpoint, now)
+            if status_code == 429:
+                pause = RetryPolicy.parse_retry_after(retry_after) if retry_after else None
+                for bucket in buckets:
+                    floor = bucket.limit.rate * self.min_rate_fraction
+                    bucket.rate = max(floor, bucket.rate * self.decrease_factor)
+                    if pause:
+                        bucket.tokens = min(bucket.tokens, 1 - pause * bucket.rate)
+            elif status_code < 400:
+                for bucket in buckets:
+                    if bucket.rate < bucket.limit.rate:
+                        bucket.rate = min(bucket.limit.rate, bucket.rate + bucket.limit.rate * self.increase_step)
+
+    def rates(self) -> Dict[str, float]:
+        """Returns the current rate of every bucket (lower than configured after 429s in adaptive mode)."""
+        with self._lock:
+            return {name: bucket.rate for name, bucket in self._buckets.items()}
+
+    def reset(self) -> None:
+        """Forgets all buckets, restoring full capacity and configured rates."""
+        with self._lock:
+            self._buckets.clear()
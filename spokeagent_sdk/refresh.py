@@ -0,0 +1,165 @@
+# Background, proactive token refresh
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .auth import AgentToken
+from .token_cache import TokenCache, TokenCacheKey
+
+logger = logging.getLogger(__name__)
+
+RefreshFunction = Callable[[str, List[str], str], str]
+
+
+class TokenRefresher:
+    """
+    Renews tokens in the background before they expire.
+
+    A single daemon timer thread keeps a heap of due times, so the cost does
+    not grow with one thread per token. A token is renewed once `fraction`
+    of its lifetime (from `iat`, or from when it was scheduled, to `exp`) has
+    passed. Refreshed tokens are rescheduled in turn until cancel() or stop()
+    is called.
+
+    Example usage:
+
+        refresher = TokenRefresher(refresh_fn, fraction=0.8)
+        refresher.schedule("agent123", ["read:data"], token)
+        ...
+        refresher.stop()
+    """
+
+    def __init__(
+        self,
+        refresh_fn: RefreshFunction,
+        fraction: float = 0.8,
+        retry_interval: float = 5.0,
+        min_interval: float = 1.0,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            refresh_fn (callable): Called as refresh_fn(agent_id, scopes, old_token)
+                from the timer thread; must return the new token.
+            fraction (float): Portion of the token lifetime after which it is renewed.
+            retry_interval (float): Seconds to wait before retrying a failed refresh.
+            min_interval (float): Minimum delay before any refresh, so short-lived
+                tokens cannot spin the timer thread.
+            clock (callable): Source of the current Unix time (overridable for tests).
+        """
+        if not 0 < fraction < 1:
+            raise ValueError("fraction must be between 0 and 1.")
+        self.refresh_fn = refresh_fn
+        self.fraction = fraction
+        self.retry_interval = retry_interval
+        self.min_interval = min_interval
+        self._clock = clock
+        self._heap: List[Tuple[float, int, TokenCacheKey]] = []
+        self._entries: Dict[TokenCacheKey, Tuple[float, int, str]] = {}
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self.refreshes = 0
+        self.failures = 0
+
+    def schedule(self, agent_id: str, scopes: Iterable[str], token: str) -> bool:
+        """
+        Schedules a token for renewal, replacing any earlier schedule for the same key.
+
+        Returns:
+            bool: False if the token has no `exp` claim and cannot be scheduled.
+        """
+        parsed = AgentToken(token)
+        expiry = parsed.exp
+        if expiry is None:
+            return False
+        issued_at = parsed.iat
+        if issued_at is None or issued_at >= expiry:
+            issued_at = self._clock()
+        due = max(issued_at + self.fraction * (expiry - issued_at), self._clock() + self.min_interval)
+
+        key = TokenCache.make_key(agent_id, scopes)
+        self._push(key, due, token)
+        return True
+
+    def cancel(self, agent_id: str, scopes: Optional[Iterable[str]] = None) -> None:
+        """Stops refreshing one (agent_id, scopes) key, or every key for the agent."""
+        with self._condition:
+            if scopes is not None:
+                self._entries.pop(TokenCache.make_key(agent_id, scopes), None)
+                return
+            for key in [key for key in self._entries if key[0] == agent_id]:
+                del self._entries[key]
+
+    def stop(self, wait: bool = True) -> None:
+        """Stops the timer thread and drops every schedule."""
+        with self._condition:
+            self._stopped = True
+            self._entries.clear()
+            self._heap.clear()
+            self._condition.notify_all()
+        thread = self._thread
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _push(self, key: TokenCacheKey, due: float, token: str) -> None:
+        with self._condition:
+            if self._stopped:
+                return
+            seq = next(self._counter)
+            self._entries[key] = (due, seq, token)
+            heapq.heappush(self._heap, (due, seq, key))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="spokeagent-token-refresher", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _next_due(self) -> Optional[Tuple[TokenCacheKey, str]]:
+        """Blocks until a schedule is due and pops it; returns None once stopped."""
+        with self._condition:
+            while not self._stopped:
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                due, seq, key = self._heap[0]
+                entry = self._entries.get(key)
+                if entry is None or entry[1] != seq:
+                    # Superseded or cancelled schedule.
+                    heapq.heappop(self._heap)
+                    continue
+                delay = due - self._clock()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                heapq.heappop(self._heap)
+                del self._entries[key]
+                return key, entry[2]
+        return None
+
+    def _run(self) -> None:
+        while True:
+            item = self._next_due()
+            if item is None:
+                return
+            key, old_token = item
+            agent_id, scopes = key
+            try:
+                new_token = self.refresh_fn(agent_id, list(scopes), old_token)
+            except Exception as e:
+                self.failures += 1
+                logger.warning("Background token refresh failed for agent %s: %s", agent_id, e)
+                expiry = AgentToken(old_token).exp
+                retry_at = self._clock() + self.retry_interval
+                if expiry is not None and retry_at < expiry:
+                    self._push(key, retry_at, old_token)
+                continue
+
+            self.refreshes += 1
+            self.schedule(agent_id, scopes, new_token)
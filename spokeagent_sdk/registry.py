@@ -0,0 +1,82 @@
+# Per-agent token registry shared by one client across many agents
+import threading
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from .auth import AgentToken
+
+
+def _expiry_of(token: str) -> Optional[float]:
+    expiry = AgentToken(token).exp
+    return float(expiry) if expiry is not None else None
+
+
+class RegisteredToken(NamedTuple):
+    token: str
+    scopes: Tuple[str, ...]
+    expires_at: Optional[float]
+
+
+class TokenRegistry:
+    """
+    Thread-safe map of agent IDs to their current bearer token.
+
+    Lets one client act for many agents: get_token() records each agent's
+    token here and call_api(..., agent_id=...) picks the matching bearer.
+    Reads are lock-free; writes are serialized.
+
+    Example usage:
+
+        registry = TokenRegistry()
+        registry.set("agent123", token, ["read:data"])
+        registry.get("agent123")  # token
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, RegisteredToken] = {}
+        self._lock = threading.Lock()
+
+    def set(self, agent_id: str, token: str, scopes: Iterable[str]) -> None:
+        """Records the agent's current token, the scopes it was issued for and its expiry."""
+        entry = RegisteredToken(token, tuple(sorted(set(scopes or ()))), _expiry_of(token))
+        with self._lock:
+            self._entries[agent_id] = entry
+
+    def replace(self, agent_id: str, old_token: str, new_token: str) -> bool:
+        """
+        Swaps in a renewed token only if the agent still holds old_token.
+
+        Returns:
+            bool: True if the registry was updated.
+        """
+        expires_at = _expiry_of(new_token)
+        with self._lock:
+            entry = self._entries.get(agent_id)
+            if entry is None or entry.token != old_token:
+                return False
+            self._entries[agent_id] = RegisteredToken(new_token, entry.scopes, expires_at)
+        return True
+
+    def get(self, agent_id: str) -> Optional[str]:
+        """Returns the agent's current token, or None if it has none."""
+        entry = self._entries.get(agent_id)
+        return entry.token if entry else None
+
+    def get_entry(self, agent_id: str) -> Optional[RegisteredToken]:
+        """Returns the agent's token together with its scopes and expiry."""
+        return self._entries.get(agent_id)
+
+    def remove(self, agent_id: str) -> None:
+        """Forgets the agent's token."""
+        with self._lock:
+            self._entries.pop(agent_id, None)
+
+    def clear(self) -> None:
+        """Forgets every agent's token."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,194 @@
+# Opt-in cache for GET responses with ETag revalidation
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from .auth import AgentToken
+
+ResponseCacheKey = Tuple[str, Tuple[str, ...], str]
+
+
+class CachedResponse(NamedTuple):
+    value: Any
+    etag: Optional[str]
+    expires_at: float
+    lifetime: float
+    size: int
+
+
+def parse_cache_control(header: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parses a Cache-Control header into {directive: value or None}."""
+    directives: Dict[str, Optional[str]] = {}
+    for part in (header or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip().strip('"') or None
+    return directives
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of decoded GET responses, bounded by total body size.
+
+    Entries are keyed by the bearer's agent (`sub`) and scopes plus the full
+    URL, so a response fetched with one set of permissions is never served
+    for another. Opaque bearers are keyed by a hash of the token itself.
+
+    Freshness follows the response's Cache-Control header: no-store is
+    never cached, max-age sets the lifetime (minus Age) and no-cache
+    forces revalidation on every use. Without the header, default_ttl
+    applies. Once an entry is stale but has an ETag, the next call sends
+    If-None-Match and a 304 refreshes the entry instead of re-downloading.
+
+    Cached values are shared between callers and must not be mutated.
+
+    Example usage:
+
+        config = SpokeAgentConfig(..., response_cache=ResponseCache(max_bytes=8 * 1024 * 1024))
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 8 * 1024 * 1024,
+        default_ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_bytes (int): Maximum total size of cached bodies before LRU eviction.
+            default_ttl (float): Lifetime in seconds for responses without Cache-Control (0 disables).
+            clock (callable): Monotonic time source (overridable for tests).
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1.")
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[ResponseCacheKey, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(bearer: str, url: str) -> ResponseCacheKey:
+        """Builds the cache key from the bearer's identity and scopes and the request URL."""
+        token = AgentToken(bearer)
+        if token.sub is None:
+            return "bearer:" + hashlib.sha256(bearer.encode("utf-8")).hexdigest(), (), url
+        return str(token.sub), tuple(sorted(set(token.scopes or ()))), url
+
+    def lookup(self, key: ResponseCacheKey) -> Tuple[Optional[CachedResponse], bool]:
+        """
+        Returns (entry, fresh). A stale entry is only returned if it has an
+        ETag to revalidate with; otherwise it is dropped and (None, False)
+        is returned.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry, True
+            self.misses += 1
+            if entry is not None and entry.etag is None:
+                self._remove(key)
+                return None, False
+            return entry, False
+
+    def _lifetime(self, headers: Mapping[str, str]) -> Optional[float]:
+        """Returns the freshness lifetime in seconds, or None if the response must not be stored."""
+        directives = parse_cache_control(headers.get("Cache-Control"))
+        if "no-store" in directives:
+            return None
+        if "no-cache" in directives:
+            return 0.0
+        if "max-age" in directives:
+            try:
+                max_age = float(directives["max-age"] or 0)
+                age = float(headers.get("Age") or 0)
+            except ValueError:
+                return 0.0
+            return max(0.0, max_age - age)
+        return self.default_ttl
+
+    def store(self, key: ResponseCacheKey, value: Any, size: int, headers: Mapping[str, str]) -> bool:
+        """
+        Caches a decoded 200 response according to its headers.
+
+        Returns:
+            bool: True if the response was cached.
+        """
+        lifetime = self._lifetime(headers)
+        etag = headers.get("ETag")
+        if lifetime is None or (lifetime <= 0 and etag is None) or size > self.max_bytes:
+            with self._lock:
+                self._remove(key)
+            return False
+
+        entry = CachedResponse(value, etag, self._clock() + lifetime, lifetime, size)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+        return True
+
+    def revalidated(self, key: ResponseCacheKey, headers: Mapping[str, str]) -> None:
+        """
+        Refreshes a stale entry after a 304 Not Modified. The 304's
+        Cache-Control wins; without one the original lifetime is reused.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            self.revalidations += 1
+            lifetime = self._lifetime(headers) if "Cache-Control" in headers else entry.lifetime
+            if lifetime is None:
+                self._remove(key)
+                return
+            self._entries[key] = entry._replace(
+                etag=headers.get("ETag") or entry.etag,
+                expires_at=self._clock() + lifetime,
+                lifetime=lifetime
+            )
+            self._entries.move_to_end(key)
+
+    def _remove(self, key: ResponseCacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """Drops every entry for a URL (all agents), or everything if url is None."""
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            for key in [key for key in self._entries if key[2] == url]:
+                self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit, miss, revalidation and eviction counters plus the current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes
+            }
@@ -0,0 +1,98 @@
+# Retry policy: exponential backoff with full jitter and Retry-After support
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterable, Optional
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    Delays use exponential backoff with full jitter: attempt n waits a
+    uniformly random time in [0, min(backoff_max, backoff_base * 2 ** (n - 1))].
+    A Retry-After header, when present and honoured, sets a floor on the
+    delay. Only idempotent methods are retried unless the caller says a
+    request is safe to repeat.
+
+    Example usage:
+
+        config = SpokeAgentConfig(..., retry_policy=RetryPolicy(max_attempts=5))
+        config = SpokeAgentConfig(..., retry_policy=None)  # disable retries
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.2,
+        backoff_max: float = 10.0,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        rng: Callable[[], float] = random.random
+    ):
+        """
+        Args:
+            max_attempts (int): Total attempts including the first one.
+            backoff_base (float): Backoff ceiling in seconds for the first retry.
+            backoff_max (float): Upper bound on any backoff ceiling.
+            retry_statuses (iterable): HTTP statuses treated as transient.
+            retry_methods (iterable): HTTP methods retried by default.
+            respect_retry_after (bool): Wait at least as long as the server's Retry-After.
+            max_retry_after (float): Retry-After values above this are not waited for.
+            rng (callable): Source of uniform [0, 1) numbers (overridable for tests).
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self._rng = rng
+
+    def allows_method(self, method: str) -> bool:
+        return method.upper() in self.retry_methods
+
+    def allows_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def compute_delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Returns the seconds to wait after a failed attempt (1-based).
+
+        Returns:
+            float or None: Delay, or None if the server asked for a longer
+            wait than max_retry_after (the caller should give up).
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        delay = self._rng() * ceiling
+        if self.respect_retry_after and retry_after:
+            server_delay = self.parse_retry_after(retry_after)
+            if server_delay is not None:
+                if server_delay > self.max_retry_after:
+                    return None
+                delay = max(delay, server_delay)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: str) -> Optional[float]:
+        """Parses a Retry-After header given as delta-seconds or an HTTP date."""
+        value = value.strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError, IndexError):
+            return None
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
@@ -0,0 +1,167 @@
+# Compiled scope sets with wildcard and hierarchical matching
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, Iterator, Optional, Tuple
+
+WILDCARD = "*"
+SEPARATOR = ":"
+
+_LEAF = None  # trie key marking the end of a granted scope
+
+_COMPILED_CACHE_SIZE = 1024
+_RESULT_CACHE_SIZE = 256
+
+
+def _split(scope: str) -> Tuple[str, ...]:
+    return tuple(sys.intern(segment) for segment in scope.split(SEPARATOR))
+
+
+class ScopeSet:
+    """
+    An immutable, indexed set of granted scopes.
+
+    Scopes are interned and stored both in a frozenset (for O(1) exact
+    checks) and in a trie keyed by ":"-separated segments, so pattern
+    checks walk the few segments of the query instead of every scope.
+
+    A "*" segment in a granted scope matches any single segment, or, as
+    the last segment, one or more trailing segments:
+
+        granted "admin:*"            allows "admin:users" and "admin:users:delete"
+        granted "read:*:summary"     allows "read:reports:summary"
+
+    allows(), has_all() and has_any() are permission checks: wildcards are
+    honoured on the granted side only, so a query of "admin:*" needs a
+    grant that covers all of admin (granted "admin:users" does not allow
+    it). To ask whether any granted scope fits a pattern, e.g. "does this
+    token carry any read:* scope", use matches_any_pattern().
+
+    Check results are memoized per set, and ScopeSet.compile() shares one
+    compiled set between tokens carrying the same scopes, so repeated
+    checks on hot paths cost a dict lookup.
+
+    Example usage:
+
+        scopes = AgentToken(token).scope_set
+        if not scopes.has_all(["read:documents", "write:logs"]):
+            raise PermissionError
+    """
+
+    __slots__ = ("_scopes", "_trie", "_results", "_pattern_results")
+
+    _compiled: "OrderedDict[FrozenSet[str], ScopeSet]" = OrderedDict()
+    _compiled_lock = threading.Lock()
+
+    def __init__(self, scopes: Iterable[str] = ()):
+        """
+        Args:
+            scopes (iterable of str): Granted scopes; empty strings and non-strings
+                (possible in untrusted token claims) are ignored.
+        """
+        self._scopes: FrozenSet[str] = frozenset(
+            sys.intern(scope) for scope in scopes if isinstance(scope, str) and scope
+        )
+        self._trie: Dict = {}
+        self._results: Dict[str, bool] = {}
+        self._pattern_results: Dict[str, bool] = {}
+        for scope in self._scopes:
+            node = self._trie
+            for segment in _split(scope):
+                node = node.setdefault(segment, {})
+            node[_LEAF] = True
+
+    @classmethod
+    def compile(cls, scopes: Optional[Iterable[str]]) -> "ScopeSet":
+        """Returns a shared ScopeSet for these scopes, compiling it on first use."""
+        key = frozenset(scope for scope in scopes or () if isinstance(scope, str))
+        with cls._compiled_lock:
+            compiled = cls._compiled.get(key)
+            if compiled is not None:
+                cls._compiled.move_to_end(key)
+                return compiled
+        compiled = cls(key)
+        with cls._compiled_lock:
+            compiled = cls._compiled.setdefault(key, compiled)
+            if len(cls._compiled) > _COMPILED_CACHE_SIZE:
+                cls._compiled.popitem(last=False)
+        return compiled
+
+    def allows(self, scope: str) -> bool:
+        """
+        Returns True if a granted scope covers `scope`.
+
+        Wildcards only widen the granted side; a "*" in `scope` is matched
+        literally and must be covered by a granted wildcard.
+        """
+        if scope in self._scopes:
+            return True
+        return self._cached(self._results, scope, False)
+
+    def matches_any_pattern(self, pattern: str) -> bool:
+        """
+        Returns True if any granted scope fits `pattern`, with "*" honoured
+        on both sides (e.g. "read:*" matches a token granted "read:documents").
+
+        This is a lookup, not a permission check; use allows() to authorize.
+        """
+        if pattern in self._scopes:
+            return True
+        return self._cached(self._pattern_results, pattern, True)
+
+    def has_all(self, scopes: Iterable[str]) -> bool:
+        """Returns True if every scope is allowed."""
+        return all(self.allows(scope) for scope in scopes)
+
+    def has_any(self, scopes: Iterable[str]) -> bool:
+        """Returns True if at least one scope is allowed."""
+        return any(self.allows(scope) for scope in scopes)
+
+    def _cached(self, results: Dict[str, bool], query: str, query_wildcards: bool) -> bool:
+        result = results.get(query)
+        if result is None:
+            result = self._match(self._trie, _split(query), 0, query_wildcards)
+            if len(results) < _RESULT_CACHE_SIZE:
+                results[query] = result
+        return result
+
+    @classmethod
+    def _match(cls, node: Dict, segments: Tuple[str, ...], index: int, query_wildcards: bool) -> bool:
+        if index == len(segments):
+            return _LEAF in node
+
+        granted_wildcard = node.get(WILDCARD)
+        if granted_wildcard is not None:
+            if _LEAF in granted_wildcard or cls._match(granted_wildcard, segments, index + 1, query_wildcards):
+                return True
+
+        segment = segments[index]
+        if query_wildcards and segment == WILDCARD:
+            children = [child for key, child in node.items() if key is not _LEAF]
+            if index == len(segments) - 1:
+                return bool(children)
+            return any(cls._match(child, segments, index + 1, query_wildcards) for child in children)
+
+        child = node.get(segment)
+        return child is not None and cls._match(child, segments, index + 1, query_wildcards)
+
+    def __contains__(self, scope: object) -> bool:
+        return isinstance(scope, str) and self.allows(scope)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._scopes)
+
+    def __len__(self) -> int:
+        return len(self._scopes)
+
+    def __bool__(self) -> bool:
+        return bool(self._scopes)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ScopeSet) and self._scopes == other._scopes
+
+    def __hash__(self) -> int:
+        return hash(self._scopes)
+
+    def __repr__(self) -> str:
+        return f"ScopeSet({sorted(self._scopes)!r})"
@@ -0,0 +1,129 @@
+# Request coalescing: concurrent callers for the same key share one call
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls from threads.
+
+    The first caller for a key runs the function; callers that arrive while
+    it is in flight block until it finishes and receive the same result or
+    exception. Once the call completes the key is forgotten, so later calls
+    run the function again.
+
+    Example usage:
+
+        flight = SingleFlight()
+        token = flight.do(("agent123", ("read:data",)), lambda: fetch_token(...))
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Runs fn() once for all concurrent callers sharing key.
+
+        Args:
+            key: Identifies calls that may share a result.
+            fn (callable): The call to make.
+            timeout (float): Maximum seconds a follower waits for the leader.
+
+        Returns:
+            The result of fn().
+
+        Raises:
+            TimeoutError: If a follower gives up waiting after timeout seconds.
+            Whatever fn() raised, in every waiting caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError("Timed out waiting for an in-flight call.")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """Returns the number of keys currently being fetched."""
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent calls from asyncio tasks on one event loop.
+
+    The shared call runs as its own task and every caller awaits it through
+    asyncio.shield(), so cancelling one waiter does not cancel the fetch for
+    the others.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, "asyncio.Future"] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]], timeout: Optional[float] = None) -> Any:
+        """
+        Awaits fn() once for all concurrent callers sharing key.
+
+        Args:
+            key: Identifies calls that may share a result.
+            fn (callable): Returns the awaitable to run.
+            timeout (float): Maximum seconds this caller waits for the shared call.
+
+        Returns:
+            The result of fn().
+
+        Raises:
+            TimeoutError: If this caller gives up waiting after timeout seconds.
+            Whatever fn() raised, in every waiting caller.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        if timeout is None:
+            return await asyncio.shield(task)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError as e:
+            raise TimeoutError("Timed out waiting for an in-flight call.") from e
+
+    def _forget(self, key: Hashable, task: "asyncio.Future") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter was cancelled.
+            task.exception()
+
+    def in_flight(self) -> int:
+        """Returns the number of keys currently being fetched."""
+        return len(self._tasks)
@@ -0,0 +1,320 @@
+# Persistent, cross-process store for agent identities and tokens
+import abc
+import contextlib
+import errno
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, Optional, Union
+
+from .auth import AgentToken
+from .timeouts import Deadline
+from .utils import redact_token
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # encryption at rest needs the optional 'cryptography' package
+    Fernet = None
+
+logger = logging.getLogger(__name__)
+
+_LOCK_SLOTS = 4096
+
+# Backoff bounds (seconds) while polling a lock held elsewhere.
+LOCK_POLL_INTERVAL = 0.005
+LOCK_MAX_POLL_INTERVAL = 0.1
+
+
+def scopes_key(scopes: Iterable[str]) -> str:
+    """Normalizes scopes the same way TokenCache does, as a single string."""
+    return " ".join(sorted(set(scopes or ())))
+
+
+class TokenStore(abc.ABC):
+    """
+    Interface for stores that share agent identities and tokens between
+    processes. Subclass it to plug in another backend; the abstract methods
+    must all be implemented before a store can be created.
+
+    lock() serializes the "check the store, else hit the network" sequence
+    across processes, so a fleet of restarting workers only registers an
+    agent (or fetches a token) once.
+    """
+
+    @abc.abstractmethod
+    def get_agent(self, name: str, metadata: Optional[Dict] = None) -> Optional[Dict]:
+        """Returns the stored identity for an agent name and metadata, or None."""
+
+    @abc.abstractmethod
+    def put_agent(self, name: str, metadata: Optional[Dict], agent: Dict) -> None:
+        """Stores the identity registered for an agent name and metadata."""
+
+    @abc.abstractmethod
+    def get_token(self, agent_id: str, scopes: Iterable[str]) -> Optional[str]:
+        """Returns a stored token that is not within the skew of expiry, or None."""
+
+    @abc.abstractmethod
+    def put_token(self, agent_id: str, scopes: Iterable[str], token: str) -> bool:
+        """Stores a token until its `exp`; returns False for tokens without a usable expiry."""
+
+    @abc.abstractmethod
+    def delete_token(self, agent_id: str, scopes: Optional[Iterable[str]] = None) -> None:
+        """Deletes an agent's token for these scopes, or all of its tokens."""
+
+    def acquire(self, key: str) -> None:
+        """Takes the cross-process lock for key (no-op by default)."""
+
+    def try_acquire(self, key: str) -> bool:
+        """
+        Takes the lock for key only if it is free, without waiting.
+
+        The async client polls this instead of parking executor threads in
+        acquire(). Stores that actually lock must override it; the default
+        suits the no-op lock.
+        """
+        self.acquire(key)
+        return True
+
+    def release(self, key: str) -> None:
+        """Releases a lock taken with acquire()."""
+
+    @contextlib.contextmanager
+    def lock(self, key: str, deadline: Optional[Deadline] = None) -> Iterator[None]:
+        """
+        Holds the lock for key. With a deadline, the lock is polled with
+        try_acquire() so the wait gives up when the deadline runs out.
+
+        Raises:
+            DeadlineExceededError: If the deadline runs out while waiting.
+        """
+        if deadline is None:
+            self.acquire(key)
+        else:
+            delay = LOCK_POLL_INTERVAL
+            while not self.try_acquire(key):
+                deadline.check("Waiting for the token store lock")
+                time.sleep(min(delay, deadline.remaining()))
+                delay = min(delay * 2, LOCK_MAX_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            self.release(key)
+
+
+class SQLiteTokenStore(TokenStore):
+    """
+    TokenStore backed by a SQLite database that worker processes share.
+
+    The database runs in WAL mode so readers never block each other. It is
+    created with 0600 permissions, and with an encryption_key tokens are
+    additionally encrypted at rest with Fernet (requires the 'cryptography'
+    package). A store opened with a different key, or with a key where there
+    was none (or vice versa), ignores the mismatched tokens and logs a
+    warning. Agent identities are not secret and are stored in clear.
+
+    Cross-process locking uses fcntl byte-range locks on a "<path>.lock"
+    file, striped by key; it is a no-op where fcntl is unavailable.
+
+    Example usage:
+
+        store = SQLiteTokenStore("/var/run/myapp/spokeagent.db", encryption_key=os.environ["STORE_KEY"])
+        config = SpokeAgentConfig(..., token_store=store)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        encryption_key: Union[None, str, bytes] = None,
+        skew: float = 30.0,
+        busy_timeout: float = 30.0,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            path (str): Database file; created with mode 0600 if missing.
+            encryption_key (str or bytes): Optional Fernet key (see Fernet.generate_key()).
+            skew (float): Seconds before `exp` at which stored tokens are ignored.
+            busy_timeout (float): Seconds to wait for another process's write lock.
+            clock (callable): Source of the current Unix time (overridable for tests).
+
+        Raises:
+            ValueError: If encryption_key is given but 'cryptography' is not installed.
+        """
+        if encryption_key is not None and Fernet is None:
+            raise ValueError("encryption_key requires the 'cryptography' package.")
+        self.path = path
+        self.skew = skew
+        self.busy_timeout = busy_timeout
+        self._clock = clock
+        self._fernet = Fernet(encryption_key) if encryption_key is not None else None
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._lock_fd: Optional[int] = None
+        self._lock_guard = threading.Lock()
+        self._slot_locks: Dict[int, threading.Lock] = {}
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        os.close(fd)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS agents ("
+                "name TEXT NOT NULL, metadata TEXT NOT NULL, agent TEXT NOT NULL, "
+                "PRIMARY KEY (name, metadata))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS tokens ("
+                "agent_id TEXT NOT NULL, scopes TEXT NOT NULL, token BLOB NOT NULL, expires_at REAL NOT NULL, "
+                "PRIMARY KEY (agent_id, scopes))"
+            )
+
+    def _check_fork(self) -> None:
+        """Drops connections and the lock file inherited from a parent process."""
+        if os.getpid() != self._pid:
+            self._pid = os.getpid()
+            self._local = threading.local()
+            self._lock_fd = None
+            self._slot_locks = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Returns this thread's connection, reopening it after a fork."""
+        self._check_fork()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _metadata_key(metadata: Optional[Dict]) -> str:
+        return json.dumps(metadata or {}, sort_keys=True, separators=(",", ":"))
+
+    def get_agent(self, name: str, metadata: Optional[Dict] = None) -> Optional[Dict]:
+        row = self._connect().execute(
+            "SELECT agent FROM agents WHERE name = ? AND metadata = ?", (name, self._metadata_key(metadata))
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_agent(self, name: str, metadata: Optional[Dict], agent: Dict) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO agents (name, metadata, agent) VALUES (?, ?, ?)",
+                (name, self._metadata_key(metadata), json.dumps(agent))
+            )
+
+    def get_token(self, agent_id: str, scopes: Iterable[str]) -> Optional[str]:
+        row = self._connect().execute(
+            "SELECT token, expires_at FROM tokens WHERE agent_id = ? AND scopes = ?", (agent_id, scopes_key(scopes))
+        ).fetchone()
+        if row is None or row[1] - self.skew <= self._clock():
+            return None
+        # Encrypted tokens are written as BLOBs and plain ones as TEXT, so the
+        # column's storage class records which it is.
+        encrypted = isinstance(row[0], bytes)
+        if self._fernet is None:
+            if encrypted:
+                logger.warning("Ignoring stored token for agent %s: it is encrypted and no key is set.", agent_id)
+                return None
+            return row[0]
+        if not encrypted:
+            logger.warning("Ignoring stored token for agent %s: it is not encrypted but a key is set.", agent_id)
+            return None
+        try:
+            return self._fernet.decrypt(row[0]).decode("utf-8")
+        except InvalidToken:
+            logger.warning("Ignoring stored token for agent %s: cannot decrypt it with this key.", agent_id)
+            return None
+
+    def put_token(self, agent_id: str, scopes: Iterable[str], token: str) -> bool:
+        expiry = AgentToken(token).exp
+        if expiry is None or expiry - self.skew <= self._clock():
+            return False
+        value = self._fernet.encrypt(token.encode("utf-8")) if self._fernet is not None else token
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO tokens (agent_id, scopes, token, expires_at) VALUES (?, ?, ?, ?)",
+                (agent_id, scopes_key(scopes), value, expiry)
+            )
+        logger.debug("Stored token %s for agent %s.", redact_token(token), agent_id)
+        return True
+
+    def delete_token(self, agent_id: str, scopes: Optional[Iterable[str]] = None) -> None:
+        with self._connect() as conn:
+            if scopes is None:
+                conn.execute("DELETE FROM tokens WHERE agent_id = ?", (agent_id,))
+            else:
+                conn.execute("DELETE FROM tokens WHERE agent_id = ? AND scopes = ?", (agent_id, scopes_key(scopes)))
+
+    def purge_expired(self) -> int:
+        """Deletes tokens past their expiry and returns how many were removed."""
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM tokens WHERE expires_at <= ?", (self._clock(),)).rowcount
+
+    def _slot(self, key: str) -> int:
+        return int.from_bytes(hashlib.sha1(key.encode("utf-8")).digest()[:4], "big") % _LOCK_SLOTS
+
+    def _lock_file(self) -> int:
+        with self._lock_guard:
+            self._check_fork()
+            if self._lock_fd is None:
+                self._lock_fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+            return self._lock_fd
+
+    def _slot_lock(self, slot: int) -> threading.Lock:
+        with self._lock_guard:
+            return self._slot_locks.setdefault(slot, threading.Lock())
+
+    def acquire(self, key: str) -> None:
+        # fcntl locks are per process, so threads of one process also queue on a thread lock.
+        slot = self._slot(key)
+        self._slot_lock(slot).acquire()
+        if fcntl is not None:
+            try:
+                fcntl.lockf(self._lock_file(), fcntl.LOCK_EX, 1, slot)
+            except OSError:
+                self._slot_lock(slot).release()
+                raise
+
+    def try_acquire(self, key: str) -> bool:
+        slot = self._slot(key)
+        slot_lock = self._slot_lock(slot)
+        if not slot_lock.acquire(blocking=False):
+            return False
+        if fcntl is not None:
+            try:
+                fcntl.lockf(self._lock_file(), fcntl.LOCK_EX | fcntl.LOCK_NB, 1, slot)
+            except OSError as e:
+                slot_lock.release()
+                if e.errno in (errno.EACCES, errno.EAGAIN):
+                    return False
+                raise
+        return True
+
+    def release(self, key: str) -> None:
+        slot = self._slot(key)
+        try:
+            if fcntl is not None:
+                fcntl.lockf(self._lock_file(), fcntl.LOCK_UN, 1, slot)
+        finally:
+            self._slot_lock(slot).release()
+
+    def close(self) -> None:
+        """Closes this thread's connection and the lock file."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+        with self._lock_guard:
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
@@ -0,0 +1,37 @@
+# Helpers for streaming responses (shared by the sync and async clients)
+import json
+from typing import Any, Iterable, Iterator, Union
+
+from .errors import APIRequestError
+
+STREAM_MODES = ("chunks", "lines", "ndjson")
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def validate_stream_mode(mode: str) -> None:
+    """
+    Raises:
+        ValueError: If mode is not one of STREAM_MODES.
+    """
+    if mode not in STREAM_MODES:
+        raise ValueError(f"Unsupported stream mode: {mode!r}. Use one of {', '.join(STREAM_MODES)}.")
+
+
+def parse_ndjson_line(line: Union[str, bytes]) -> Any:
+    """
+    Parses one NDJSON record.
+
+    Raises:
+        APIRequestError: If the line is not valid JSON.
+    """
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        raise APIRequestError(f"API stream failed: invalid NDJSON record: {str(e)}") from e
+
+
+def iter_ndjson(lines: Iterable[Union[str, bytes]]) -> Iterator[Any]:
+    """Yields one decoded record per non-blank line."""
+    for line in lines:
+        if line and line.strip():
+            yield parse_ndjson_line(line)
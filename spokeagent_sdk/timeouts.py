@@ -0,0 +1,79 @@
+# Per-request timeouts and end-to-end deadline budgets
+import time
+from typing import Callable, Optional, Tuple, Union
+
+from .errors import DeadlineExceededError
+
+TimeoutSpec = Union[None, float, Tuple[float, float]]
+DeadlineSpec = Union[None, float, "Deadline"]
+
+
+class Deadline:
+    """
+    A fixed point in time that a whole operation has to finish by.
+
+    One Deadline is threaded through every step of an operation (token
+    renewal, each retry attempt and the backoff sleeps in between), and
+    each step only gets what is left of the budget.
+
+    Example usage:
+
+        deadline = Deadline(2.0)
+        client.call_api("/secure/data", agent_id="agent123", deadline=deadline)
+    """
+
+    __slots__ = ("expires_at", "_clock")
+
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self.expires_at = clock() + seconds
+
+    @classmethod
+    def coerce(cls, deadline: DeadlineSpec) -> Optional["Deadline"]:
+        """Accepts None, a number of seconds or an existing Deadline."""
+        if deadline is None or isinstance(deadline, Deadline):
+            return deadline
+        return cls(float(deadline))
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        return self._clock() >= self.expires_at
+
+    def check(self, operation: str, attempts: int = 1) -> None:
+        """
+        Raises:
+            DeadlineExceededError: If the deadline has passed.
+        """
+        if self.expired:
+            raise DeadlineExceededError(f"{operation}: deadline exceeded.", attempts=attempts)
+
+    def clamp(self, timeout: Tuple[float, float], operation: str = "Request") -> Tuple[float, float]:
+        """
+        Shrinks a (connect, read) timeout so neither outlives the deadline.
+
+        Raises:
+            DeadlineExceededError: If no time is left, rather than returning a zero timeout.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError(f"{operation}: deadline exceeded.")
+        return min(timeout[0], remaining), min(timeout[1], remaining)
+
+
+def resolve_timeout(timeout: TimeoutSpec, connect_timeout: float, read_timeout: float) -> Tuple[float, float]:
+    """
+    Normalizes a per-call timeout into a (connect, read) pair.
+
+    None falls back to the configured defaults, a single number applies to
+    both phases, and a tuple is used as-is.
+    """
+    if timeout is None:
+        return connect_timeout, read_timeout
+    if isinstance(timeout, (int, float)):
+        return float(timeout), float(timeout)
+    connect, read = timeout
+    return float(connect), float(read)
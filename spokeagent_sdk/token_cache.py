@@ -0,0 +1,118 @@
+# In-process, expiry-aware token cache
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from .auth import AgentToken
+
+TokenCacheKey = Tuple[str, Tuple[str, ...]]
+
+
+class TokenCache:
+    """
+    Thread-safe LRU cache of agent tokens keyed by (agent_id, scope set).
+
+    Entries live until the token's `exp` claim minus a safety skew. Tokens
+    without an `exp` claim (opaque tokens) are never cached, since there is
+    no way to know when they stop being valid.
+
+    Example usage:
+
+        cache = TokenCache(maxsize=1024, skew=30)
+        cache.put("agent123", ["read:data"], token)
+        cache.get("agent123", ["read:data"])  # token, or None once near expiry
+    """
+
+    def __init__(self, maxsize: int = 1024, skew: float = 30.0, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            maxsize (int): Maximum number of cached tokens before LRU eviction.
+            skew (float): Seconds subtracted from `exp` so tokens are dropped before they expire.
+            clock (callable): Source of the current Unix time (overridable for tests).
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.skew = skew
+        self._clock = clock
+        self._entries: "OrderedDict[TokenCacheKey, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(agent_id: str, scopes: Iterable[str]) -> TokenCacheKey:
+        """Normalizes scopes so ordering and duplicates do not split the cache."""
+        return agent_id, tuple(sorted(set(scopes or ())))
+
+    def get(self, agent_id: str, scopes: Iterable[str]) -> Optional[str]:
+        """
+        Returns the cached token, or None if missing or within the skew of expiry.
+        """
+        key = self.make_key(agent_id, scopes)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            token, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return token
+
+    def put(self, agent_id: str, scopes: Iterable[str], token: str) -> bool:
+        """
+        Caches a token until its expiry minus the skew.
+
+        Returns:
+            bool: True if the token was cached, False if it has no usable expiry.
+        """
+        expiry = AgentToken(token).exp
+        if expiry is None:
+            return False
+        expires_at = expiry - self.skew
+        if expires_at <= self._clock():
+            return False
+
+        key = self.make_key(agent_id, scopes)
+        with self._lock:
+            self._entries[key] = (token, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return True
+
+    def invalidate(self, agent_id: str, scopes: Optional[Iterable[str]] = None) -> None:
+        """Drops one (agent_id, scopes) entry, or every entry for the agent if scopes is None."""
+        with self._lock:
+            if scopes is not None:
+                self._entries.pop(self.make_key(agent_id, scopes), None)
+                return
+            for key in [key for key in self._entries if key[0] == agent_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Removes every cached token (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit, miss and eviction counters plus the current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize
+            }
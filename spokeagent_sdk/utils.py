@@ -1,7 +1,16 @@
 # Helper functions (optional)
 import base64
 import json
-from typing import Optional
+import re
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+WILDCARD = "*"
+_MISSING = object()
+_PATH_TOKEN = re.compile(r"\[(-?\d+|\*)\]|([^.\[\]]+)")
+
+PathSegment = Union[str, int]
 
 
 def decode_jwt_segment(segment: str) -> Optional[dict]:
@@ -23,13 +32,137 @@ def decode_jwt_segment(segment: str) -> Optional[dict]:
         return None
 
 
+class JSONPath:
+    """
+    A compiled, reusable accessor for a dotted path into decoded JSON.
+
+    Segments are separated by dots; `[n]` indexes a list (negative indices
+    count from the end) and `*` or `[*]` matches every list item or dict
+    value. A path with a wildcard yields a list of every match.
+
+    Example:
+        path = compile_path("items[*].owner.name")
+        path.get({"items": [{"owner": {"name": "a"}}, {"owner": {"name": "b"}}]})  # ["a", "b"]
+    """
+
+    __slots__ = ("path", "segments", "has_wildcard")
+
+    def __init__(self, path: str):
+        """
+        Raises:
+            ValueError: If the path is empty or malformed.
+        """
+        segments: List[PathSegment] = []
+        position = 0
+        for match in _PATH_TOKEN.finditer(path):
+            gap = path[position:match.start()]
+            if gap not in ("", ".") or (gap == "." and not segments):
+                raise ValueError(f"Malformed path: {path!r}")
+            index, key = match.groups()
+            if index is not None:
+                segments.append(WILDCARD if index == WILDCARD else int(index))
+            else:
+                segments.append(key)
+            position = match.end()
+        if not segments or position != len(path):
+            raise ValueError(f"Malformed path: {path!r}")
+        self.path = path
+        self.segments: Tuple[PathSegment, ...] = tuple(segments)
+        self.has_wildcard = WILDCARD in self.segments
+
+    def get(self, data: Any, default=None) -> Any:
+        """
+        Returns the value at the path, or default if any part is missing.
+        With wildcards, returns the list of matches (missing ones skipped).
+        """
+        if not self.has_wildcard:
+            for segment in self.segments:
+                data = _step(data, segment)
+                if data is _MISSING:
+                    return default
+            return data
+        matches: List[Any] = []
+        self._collect(data, 0, matches)
+        return matches
+
+    def _collect(self, data: Any, start: int, matches: List[Any]) -> None:
+        for position in range(start, len(self.segments)):
+            segment = self.segments[position]
+            if segment == WILDCARD:
+                children = data.values() if isinstance(data, Mapping) else data if _is_sequence(data) else ()
+                for child in children:
+                    self._collect(child, position + 1, matches)
+                return
+            data = _step(data, segment)
+            if data is _MISSING:
+                return
+        matches.append(data)
+
+    def __repr__(self) -> str:
+        return f"JSONPath({self.path!r})"
+
+
+def _is_sequence(data: Any) -> bool:
+    return isinstance(data, Sequence) and not isinstance(data, (str, bytes, bytearray))
+
+
+def _step(data: Any, segment: PathSegment) -> Any:
+    """Follows one non-wildcard segment; digit keys also index sequences."""
+    if isinstance(data, Mapping):
+        try:
+            return data[str(segment)]
+        except KeyError:
+            return _MISSING
+    if _is_sequence(data):
+        if isinstance(segment, str):
+            if not segment.lstrip("-").isdigit():
+                return _MISSING
+            segment = int(segment)
+        try:
+            return data[segment]
+        except IndexError:
+            return _MISSING
+    return _MISSING
+
+
+def _literal_get(data: Any, path: str) -> Any:
+    """Looks a path up as plain dot-separated keys, so keys like "*" or "tags[0]" still match."""
+    try:
+        for key in path.split("."):
+            data = data[key]
+        return data
+    except (KeyError, TypeError):
+        return _MISSING
+
+
+@lru_cache(maxsize=1024)
+def compile_path(path: str) -> JSONPath:
+    """Returns the compiled JSONPath for a path string, cached across calls."""
+    return JSONPath(path)
+
+
+def project(data: Any, paths: Iterable[str]) -> Dict[str, Any]:
+    """
+    Extracts several paths at once.
+
+    Returns:
+        dict: {path: value} for each path; missing values are None.
+    """
+    return {path: compile_path(path).get(data) for path in paths}
+
+
 def safe_get(data: dict, path: str, default=None):
     """
     Safely retrieves nested properties from a dictionary using dot notation.
 
+    The path is compiled once and cached (see compile_path()), and may use
+    list indices and wildcards. Keys that exist literally (e.g. "*" or
+    "tags[0]") take precedence over that syntax.
+
     Example:
         user = {"meta": {"profile": {"name": "Alice"}}}
         safe_get(user, "meta.profile.name")  # "Alice"
+        safe_get({"items": [{"id": 1}, {"id": 2}]}, "items[-1].id")  # 2
 
     Args:
         data (dict): The dictionary to traverse.
@@ -39,12 +172,12 @@ def safe_get(data: dict, path: str, default=None):
     Returns:
         The value at the nested path, or default if not found.
     """
+    value = _literal_get(data, path)
+    if value is not _MISSING:
+        return value
     try:
-        keys = path.split(".")
-        for key in keys:
-            data = data[key]
-        return data
-    except (KeyError, TypeError):
+        return compile_path(path).get(data, default)
+    except ValueError:
         return default
 
 
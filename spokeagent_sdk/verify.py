@@ -0,0 +1,361 @@
+# Offline JWT verification against a cached key set
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import requests
+
+from .errors import TokenVerificationError
+
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa
+    from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+except ImportError:  # RS*/ES* need the optional 'cryptography' package; HS* works without it
+    hashes = None
+
+logger = logging.getLogger(__name__)
+
+HMAC_ALGORITHMS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+RSA_ALGORITHMS = ("RS256", "RS384", "RS512")
+EC_ALGORITHMS = {"ES256": 32, "ES384": 48, "ES512": 66}
+_KEY_TYPES = {"HS": "oct", "RS": "RSA", "ES": "EC"}
+
+KeyLoader = Callable[[], Union[Dict[str, Any], List[Dict[str, Any]]]]
+
+
+def b64url_decode(segment: str) -> bytes:
+    """Decodes base64url without padding."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _b64url_int(segment: str) -> int:
+    return int.from_bytes(b64url_decode(segment), "big")
+
+
+class VerificationKey(NamedTuple):
+    kid: Optional[str]
+    kty: str
+    alg: Optional[str]
+    key: Any
+
+
+def parse_jwk(jwk: Dict[str, Any]) -> VerificationKey:
+    """
+    Converts one JWK into a VerificationKey.
+
+    "oct" keys need only the standard library; "RSA" and "EC" keys need the
+    'cryptography' package.
+
+    Raises:
+        TokenVerificationError: If the JWK is malformed or its type is unsupported.
+    """
+    kty = jwk.get("kty")
+    try:
+        if kty == "oct":
+            return VerificationKey(jwk.get("kid"), kty, jwk.get("alg"), b64url_decode(jwk["k"]))
+        if kty in ("RSA", "EC") and hashes is None:
+            raise TokenVerificationError(f"{kty} keys require the 'cryptography' package.")
+        if kty == "RSA":
+            public_key = rsa.RSAPublicNumbers(_b64url_int(jwk["e"]), _b64url_int(jwk["n"])).public_key()
+            return VerificationKey(jwk.get("kid"), kty, jwk.get("alg"), public_key)
+        if kty == "EC":
+            curve = {"P-256": ec.SECP256R1, "P-384": ec.SECP384R1, "P-521": ec.SECP521R1}[jwk["crv"]]()
+            numbers = ec.EllipticCurvePublicNumbers(_b64url_int(jwk["x"]), _b64url_int(jwk["y"]), curve)
+            return VerificationKey(jwk.get("kid"), kty, jwk.get("alg"), numbers.public_key())
+    except (KeyError, ValueError, TypeError) as e:
+        raise TokenVerificationError(f"Invalid {kty} key: {str(e)}") from e
+    raise TokenVerificationError(f"Unsupported key type: {kty!r}")
+
+
+class KeySet:
+    """
+    Thread-safe, cached set of verification keys.
+
+    Keys come from a loader returning a JWKS document ({"keys": [...]}) or a
+    list of JWKs. They are reloaded every refresh_interval seconds, and
+    immediately when a token names an unknown `kid` (key rotation), but
+    never more often than min_refresh_interval. If a reload fails, the
+    previous keys stay in use.
+
+    Example usage:
+
+        keys = KeySet.from_url("https://auth.example.com/.well-known/jwks.json")
+        keys = KeySet.from_secret("shared-hmac-secret", kid="v1")
+    """
+
+    def __init__(
+        self,
+        loader: Optional[KeyLoader] = None,
+        keys: Optional[Iterable[VerificationKey]] = None,
+        refresh_interval: float = 300.0,
+        min_refresh_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            loader (callable): Returns a JWKS dict or a list of JWKs (None for a static set).
+            keys (iterable): Initial keys.
+            refresh_interval (float): Seconds after which keys are reloaded.
+            min_refresh_interval (float): Minimum seconds between reloads triggered by unknown kids.
+            clock (callable): Monotonic time source (overridable for tests).
+        """
+        self.loader = loader
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self._clock = clock
+        self._keys: Tuple[VerificationKey, ...] = tuple(keys or ())
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self.refreshes = 0
+
+    @classmethod
+    def from_secret(cls, secret: Union[str, bytes], kid: Optional[str] = None, alg: Optional[str] = None) -> "KeySet":
+        """Builds a static key set holding one HMAC secret."""
+        if isinstance(secret, str):
+            secret = secret.encode("utf-8")
+        return cls(keys=[VerificationKey(kid, "oct", alg, secret)])
+
+    @classmethod
+    def from_url(
+        cls,
+        url: str,
+        timeout: float = 5.0,
+        session: Optional[requests.Session] = None,
+        **kwargs
+    ) -> "KeySet":
+        """Builds a key set that loads a JWKS document from url."""
+        http = session or requests.Session()
+
+        def load() -> Dict[str, Any]:
+            response = http.get(url, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+
+        return cls(loader=load, **kwargs)
+
+    def refresh(self, force: bool = False) -> None:
+        """Reloads the keys if they are stale (or if force is set, subject to min_refresh_interval)."""
+        if self.loader is None:
+            return
+        with self._lock:
+            now = self._clock()
+            if self._loaded_at is not None:
+                age = now - self._loaded_at
+                if age < self.min_refresh_interval or (not force and age < self.refresh_interval):
+                    return
+            self._loaded_at = now
+            try:
+                document = self.loader()
+                jwks = document.get("keys", []) if isinstance(document, dict) else document
+                keys = []
+                for jwk in jwks:
+                    try:
+                        keys.append(parse_jwk(jwk))
+                    except TokenVerificationError as e:
+                        logger.warning("Skipping key %s: %s", jwk.get("kid"), e)
+                self._keys = tuple(keys)
+                self.refreshes += 1
+            except Exception as e:
+                logger.warning("Failed to refresh key set: %s", e)
+
+    def keys(self) -> Tuple[VerificationKey, ...]:
+        """Returns the current keys, reloading them first if stale."""
+        self.refresh()
+        return self._keys
+
+    def find(self, kid: Optional[str], alg: str) -> List[VerificationKey]:
+        """
+        Returns the candidate keys for a token header.
+
+        With a kid, only that key matches (a reload is attempted once if it
+        is unknown); without one, every key of the algorithm's type does.
+        """
+        kty = _KEY_TYPES.get(alg[:2])
+
+        def matching() -> List[VerificationKey]:
+            return [
+                key for key in self.keys()
+                if key.kty == kty and (key.alg is None or key.alg == alg) and (kid is None or key.kid == kid)
+            ]
+
+        candidates = matching()
+        if not candidates and kid is not None:
+            self.refresh(force=True)
+            candidates = matching()
+        return candidates
+
+
+def _verify_signature(key: VerificationKey, alg: str, signing_input: bytes, signature: bytes) -> bool:
+    if alg in HMAC_ALGORITHMS:
+        expected = hmac.new(key.key, signing_input, HMAC_ALGORITHMS[alg]).digest()
+        return hmac.compare_digest(expected, signature)
+    if hashes is None:
+        raise TokenVerificationError(f"{alg} requires the 'cryptography' package.")
+    digest = {"256": hashes.SHA256, "384": hashes.SHA384, "512": hashes.SHA512}[alg[2:]]()
+    try:
+        if alg in RSA_ALGORITHMS:
+            key.key.verify(signature, signing_input, padding.PKCS1v15(), digest)
+        else:
+            size = EC_ALGORITHMS[alg]
+            if len(signature) != 2 * size:
+                return False
+            r = int.from_bytes(signature[:size], "big")
+            s = int.from_bytes(signature[size:], "big")
+            key.key.verify(encode_dss_signature(r, s), signing_input, ec.ECDSA(digest))
+    except InvalidSignature:
+        return False
+    return True
+
+
+class JWTVerifier:
+    """
+    Verifies agent tokens locally, without a round trip to AuthSpoke.
+
+    Checks the signature against a KeySet, then `exp`, `nbf` and `iat`
+    (with leeway), and the audience and issuer when configured. Successful
+    verifications are memoized per token until the token expires, so
+    repeated checks of the same token only re-check expiry. A key removed
+    from the key set does not invalidate memoized tokens; call clear() to
+    force re-verification.
+
+    Example usage:
+
+        verifier = JWTVerifier(KeySet.from_secret(secret), audience="reports-api", issuer="authspoke")
+        claims = verifier.verify(bearer_token)
+    """
+
+    def __init__(
+        self,
+        key_set: KeySet,
+        algorithms: Sequence[str] = ("HS256",),
+        audience: Union[None, str, Sequence[str]] = None,
+        issuer: Optional[str] = None,
+        leeway: float = 0.0,
+        require: Sequence[str] = ("exp",),
+        cache_size: int = 4096,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            key_set (KeySet): Source of verification keys.
+            algorithms (sequence): Accepted `alg` values ("none" is never accepted).
+            audience (str or sequence): Accepted audience(s); None skips the check.
+            issuer (str): Required `iss`; None skips the check.
+            leeway (float): Seconds of clock skew tolerated for exp, nbf and iat.
+            require (sequence): Claims that must be present.
+            cache_size (int): Maximum memoized verifications (0 disables memoization).
+            clock (callable): Source of the current Unix time (overridable for tests).
+        """
+        unsupported = [alg for alg in algorithms if alg not in HMAC_ALGORITHMS
+                       and alg not in RSA_ALGORITHMS and alg not in EC_ALGORITHMS]
+        if unsupported:
+            raise ValueError(f"Unsupported algorithms: {', '.join(unsupported)}")
+        self.key_set = key_set
+        self.algorithms = frozenset(algorithms)
+        self.audience = {audience} if isinstance(audience, str) else set(audience) if audience else None
+        self.issuer = issuer
+        self.leeway = leeway
+        self.require = tuple(require)
+        self.cache_size = cache_size
+        self._clock = clock
+        self._verified: "OrderedDict[str, Tuple[Dict[str, Any], Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """
+        Verifies a token and returns its claims.
+
+        Returns:
+            dict: The token's claims (shared with the memo; treat as read-only).
+
+        Raises:
+            TokenVerificationError: If the token is malformed, its signature is
+                invalid or a claim check fails.
+        """
+        now = self._clock()
+        with self._lock:
+            memo = self._verified.get(token)
+            if memo is not None:
+                claims, exp = memo
+                if exp is None or now < exp + self.leeway:
+                    self._verified.move_to_end(token)
+                    return claims
+                del self._verified[token]
+
+        claims = self._verify_uncached(token, now)
+        if self.cache_size > 0:
+            exp = claims.get("exp")
+            with self._lock:
+                self._verified[token] = (claims, exp)
+                while len(self._verified) > self.cache_size:
+                    self._verified.popitem(last=False)
+        return claims
+
+    def _verify_uncached(self, token: str, now: float) -> Dict[str, Any]:
+        parts = token.strip().split(".")
+        if len(parts) != 3:
+            raise TokenVerificationError("Malformed token: expected three segments.")
+        try:
+            header = json.loads(b64url_decode(parts[0]))
+            claims = json.loads(b64url_decode(parts[1]))
+            signature = b64url_decode(parts[2])
+        except ValueError as e:
+            raise TokenVerificationError(f"Malformed token: {str(e)}") from e
+        if not isinstance(header, dict) or not isinstance(claims, dict):
+            raise TokenVerificationError("Malformed token: header and payload must be JSON objects.")
+
+        alg = header.get("alg")
+        if not isinstance(alg, str) or alg not in self.algorithms:
+            raise TokenVerificationError(f"Algorithm not allowed: {alg!r}")
+        kid = header.get("kid")
+        if kid is not None and not isinstance(kid, str):
+            raise TokenVerificationError("Malformed token: kid must be a string.")
+        keys = self.key_set.find(kid, alg)
+        if not keys:
+            raise TokenVerificationError(f"No key found for kid {header.get('kid')!r}.")
+        signing_input = f"{parts[0]}.{parts[1]}".encode("ascii")
+        if not any(_verify_signature(key, alg, signing_input, signature) for key in keys):
+            raise TokenVerificationError("Invalid signature.")
+
+        self._check_claims(claims, now)
+        return claims
+
+    def _check_claims(self, claims: Dict[str, Any], now: float) -> None:
+        for name in self.require:
+            if name not in claims:
+                raise TokenVerificationError(f"Missing required claim: {name}")
+        for name in ("exp", "nbf", "iat"):
+            # A present time claim must be a number; null is as invalid as a string.
+            value = claims.get(name)
+            if name in claims and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                raise TokenVerificationError(f"Claim {name} must be a number.")
+
+        if "exp" in claims and now >= claims["exp"] + self.leeway:
+            raise TokenVerificationError("Token has expired.")
+        if "nbf" in claims and now + self.leeway < claims["nbf"]:
+            raise TokenVerificationError("Token is not yet valid.")
+        if "iat" in claims and now + self.leeway < claims["iat"]:
+            raise TokenVerificationError("Token was issued in the future.")
+
+        if self.issuer is not None and claims.get("iss") != self.issuer:
+            raise TokenVerificationError("Invalid issuer.")
+        if self.audience is not None:
+            aud = claims.get("aud")
+            audiences = {aud} if isinstance(aud, str) else set()
+            if isinstance(aud, list):
+                audiences = {item for item in aud if isinstance(item, str)}
+            if not audiences & self.audience:
+                raise TokenVerificationError("Invalid audience.")
+
+    def clear(self) -> None:
+        """Forgets every memoized verification."""
+        with self._lock:
+            self._verified.clear()
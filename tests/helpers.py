@@ -0,0 +1,32 @@
+# Shared test helpers: fake JWTs and a controllable clock
+import base64
+import json
+
+
+def encode_jwt_payload(payload: dict) -> str:
+    """
+    Helper function to base64-url encode a JWT payload.
+    """
+    json_bytes = json.dumps(payload).encode("utf-8")
+    b64_bytes = base64.urlsafe_b64encode(json_bytes)
+    return b64_bytes.decode("utf-8").rstrip("=")
+
+
+def generate_jwt(payload: dict) -> str:
+    """
+    Creates a fake JWT with a given payload.
+    (Header and signature are dummies; this is for non-validating tests.)
+    """
+    header = encode_jwt_payload({"alg": "HS256", "typ": "JWT"})
+    body = encode_jwt_payload(payload)
+    return f"{header}.{body}.signature"
+
+
+class FakeClock:
+    """A clock for injectable `clock` parameters; tests move it by setting `now`."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
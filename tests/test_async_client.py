@@ -0,0 +1,98 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from spokeagent_sdk import SpokeAgentConfig
+from spokeagent_sdk.async_client import AsyncSpokeAgentClient
+from spokeagent_sdk.errors import APIRequestError, TokenRequestError
+
+
+@pytest.fixture
+def mock_config():
+    return SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key")
+
+
+def make_transport(routes):
+    """
+    Builds an httpx.MockTransport that answers from a {(method, path): (status, body)} map.
+    """
+    def handler(request: httpx.Request) -> httpx.Response:
+        status, body = routes[(request.method, request.url.path)]
+        return httpx.Response(status, json=body)
+
+    return httpx.MockTransport(handler)
+
+
+def test_async_full_agent_flow(mock_config):
+    transport = make_transport({
+        ("POST", "/api/agents/register"): (200, {"id": "agent123", "name": "testbot"}),
+        ("POST", "/api/agents/token"): (200, {"token": "abc123"}),
+        ("GET", "/secure/data"): (200, {"result": "success"}),
+    })
+
+    async def flow():
+        async with AsyncSpokeAgentClient(mock_config, transport=transport) as client:
+            agent = await client.register_agent("testbot")
+            token = await client.get_token(agent["id"], scopes=["read:data"])
+            response = await client.call_api("/secure/data", method="GET")
+            return agent, token, response
+
+    agent, token, response = asyncio.run(flow())
+    assert agent["id"] == "agent123"
+    assert token == "abc123"
+    assert response["result"] == "success"
+
+
+def test_async_call_api_sends_bearer_and_body(mock_config):
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["auth"] = request.headers["Authorization"]
+        seen["body"] = json.loads(request.content)
+        return httpx.Response(200, json={"ok": True})
+
+    async def flow():
+        async with AsyncSpokeAgentClient(mock_config, transport=httpx.MockTransport(handler)) as client:
+            client.token = "abc123"
+            return await client.call_api("/secure/data", method="POST", data={"q": 1})
+
+    assert asyncio.run(flow()) == {"ok": True}
+    assert seen == {"auth": "Bearer abc123", "body": {"q": 1}}
+
+
+def test_async_errors_match_sync_client(mock_config):
+    transport = make_transport({
+        ("POST", "/api/agents/token"): (500, {"error": "boom"}),
+    })
+
+    async def flow():
+        async with AsyncSpokeAgentClient(mock_config, transport=transport) as client:
+            with pytest.raises(APIRequestError):
+                await client.call_api("/secure/data")
+            with pytest.raises(TokenRequestError):
+                await client.get_token("agent123", scopes=["read:data"])
+
+    asyncio.run(flow())
+
+
+def test_async_call_api_with_agent_id(mock_config):
+    tokens = iter(["token-a", "token-b"])
+    bearers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/agents/token":
+            return httpx.Response(200, json={"token": next(tokens)})
+        bearers.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"ok": True})
+
+    async def flow():
+        async with AsyncSpokeAgentClient(mock_config, transport=httpx.MockTransport(handler)) as client:
+            await client.get_token("agent-a", scopes=["read:data"])
+            await client.get_token("agent-b", scopes=["read:data"])
+            await client.call_api("/secure/data", agent_id="agent-a")
+            await client.call_api("/secure/data", agent_id="agent-b")
+
+    asyncio.run(flow())
+    assert bearers == ["Bearer token-a", "Bearer token-b"]
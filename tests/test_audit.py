@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from spokeagent_sdk.audit import AuditReport, audit_file, audit_tokens, iter_tokens, main
+from tests.helpers import generate_jwt
+
+NOW = 1_700_000_000
+
+
+def sample_tokens():
+    return [
+        generate_jwt({"sub": "agent-a", "scope": "read:data", "exp": NOW + 600}),
+        generate_jwt({"sub": "agent-a", "scope": "read:data write:data", "exp": NOW + 3 * 86400}),
+        generate_jwt({"sub": "agent-b", "scope": "admin:*", "exp": NOW - 1}),
+        generate_jwt({"sub": "agent-b", "scope": " ".join(f"s{i}" for i in range(25))}),
+        "opaque-token-value",
+        "eyJhbGciOi.not-json.sig",
+    ]
+
+
+def test_report_aggregates():
+    report = audit_tokens(sample_tokens(), workers=0, now=NOW, max_scopes=20)
+    data = report.to_dict()
+
+    assert data["total"] == 6
+    assert data["malformed"] == 2
+    assert data["expired"] == 1
+    assert data["expiring"] == 1
+    assert data["over_scoped"] == 2
+    assert data["expiry_histogram"] == {
+        "expired": 1, "<1h": 1, "<24h": 0, "<7d": 1, "<30d": 0, ">=30d": 0, "no_exp": 1
+    }
+    assert data["scope_frequency"]["read:data"] == 2
+    assert data["per_agent"] == {"agent-a": 2, "agent-b": 2}
+
+
+def test_samples_are_redacted():
+    tokens = sample_tokens()
+    data = audit_tokens(tokens, workers=0, now=NOW).to_dict()
+    serialized = json.dumps(data)
+    assert not any(token in serialized for token in tokens)
+    assert [s["index"] for s in data["samples"]["malformed"]] == [4, 5]
+    assert data["samples"]["expired"][0]["agent"] == "agent-b"
+
+
+
+def test_non_string_scopes_count_as_malformed():
+    tokens = [
+        generate_jwt({"sub": "agent-a", "scope": [1], "exp": NOW + 600}),
+        generate_jwt({"sub": "agent-b", "scope": [{"name": "read"}], "exp": NOW + 600}),
+        generate_jwt({"sub": "agent-c", "scope": ["read:data"], "exp": NOW + 600}),
+    ]
+    data = audit_tokens(tokens, workers=0, now=NOW).to_dict()
+    assert data["total"] == 3
+    assert data["malformed"] == 2
+    assert [s["agent"] for s in data["samples"]["malformed"]] == ["agent-a", "agent-b"]
+    assert data["per_agent"] == {"agent-c": 1}
+
+def test_memory_bounds():
+    tokens = (generate_jwt({"sub": f"agent-{i}", "scope": f"scope-{i}"}) for i in range(50))
+    report = audit_tokens(tokens, workers=0, batch_size=7, max_keys=10, sample_size=2, now=NOW)
+    assert report.total == 50
+    assert len(report.per_agent) == 11 and report.per_agent["<other>"] == 40
+    assert len(report.scope_frequency) == 11
+
+
+def test_process_pool_matches_inline():
+    tokens = sample_tokens() * 40
+    inline = audit_tokens(tokens, workers=0, now=NOW).to_dict()
+    pooled = audit_tokens(iter(tokens), workers=2, batch_size=16, max_in_flight=2, now=NOW).to_dict()
+    assert pooled == inline
+
+
+def test_merge_keeps_earliest_samples():
+    first, second = AuditReport(sample_size=1), AuditReport(sample_size=1)
+    second.add(0, "bad", NOW, 60, 20)
+    first.add(9, "also-bad", NOW, 60, 20)
+    assert first.merge(second).samples["malformed"][0]["index"] == 0
+
+
+def test_iter_tokens_and_cli(tmp_path, capsys):
+    token = generate_jwt({"sub": "agent-a", "scope": "read:data", "exp": NOW + 60})
+    log = tmp_path / "app.log"
+    log.write_text(f"INFO request auth=Bearer {token} path=/x\nINFO no token here\n\n")
+
+    assert list(iter_tokens([f" {token} \n", "\n"])) == [token]
+    assert audit_file(str(log), extract=True, workers=0, now=NOW).total == 1
+
+    assert main([str(log), "--extract", "--workers", "0", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["per_agent"] == {"agent-a": 1}
+    assert main([str(log), "--extract", "--workers", "0"]) == 0
+    assert "agent-a" in capsys.readouterr().out
+
+
+def test_rejects_bad_batch_size():
+    with pytest.raises(ValueError):
+        audit_tokens([], batch_size=0)
@@ -1,27 +1,5 @@
-import pytest
-import base64
-import json
-
 from spokeagent_sdk.auth import AgentToken
-
-
-def encode_jwt_payload(payload: dict) -> str:
-    """
-    Helper function to base64-url encode a JWT payload.
-    """
-    json_bytes = json.dumps(payload).encode("utf-8")
-    b64_bytes = base64.urlsafe_b64encode(json_bytes)
-    return b64_bytes.decode("utf-8").rstrip("=")
-
-
-def generate_jwt(payload: dict) -> str:
-    """
-    Creates a fake JWT with a given payload.
-    (Header and signature are dummies; this is for non-validating tests.)
-    """
-    header = encode_jwt_payload({"alg": "HS256", "typ": "JWT"})
-    body = encode_jwt_payload(payload)
-    return f"{header}.{body}.signature"
+from tests.helpers import generate_jwt
 
 
 def test_decode_jwt_payload():
@@ -69,3 +47,31 @@ def test_get_expiry():
 def test_invalid_jwt_format():
     token = AgentToken("not.a.valid.token")
     assert token.decode_jwt_payload() is None
+
+
+def test_payload_is_parsed_once():
+    token = AgentToken(generate_jwt({"sub": "agent-1", "scope": "read:logs", "exp": 1890000000, "iat": 1880000000}))
+    first = token.decode_jwt_payload()
+
+    assert token.decode_jwt_payload() is first
+    assert token.scopes is token.scopes
+    assert token.scopes == ("read:logs",)
+    assert (token.sub, token.exp, token.iat) == ("agent-1", 1890000000, 1880000000)
+
+
+def test_reassigning_token_resets_cached_claims():
+    token = AgentToken(generate_jwt({"exp": 1}))
+    assert token.exp == 1
+    token.token = generate_jwt({"exp": 2})
+    assert token.exp == 2
+
+
+def test_typed_accessors_ignore_malformed_claims():
+    token = AgentToken(generate_jwt({"sub": 42, "exp": "soon", "iat": True}))
+    assert (token.sub, token.exp, token.iat, token.scopes) == (None, None, None, None)
+
+
+def test_agent_token_uses_slots():
+    token = AgentToken("opaque-token")
+    assert not hasattr(token, "__dict__")
+    assert token.get_scope() is None
@@ -0,0 +1,54 @@
+import json
+import requests
+
+from benchmarks.run import compare, main, percentile, run_suite
+from benchmarks.server import StubServer
+
+
+def test_percentile_nearest_rank():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_run_suite_smoke():
+    with StubServer() as server:
+        results = run_suite(server.base_url, requests=5, concurrency_levels=(2,),
+                            operations=("get_token", "call_api"))
+
+    assert [(row["mode"], row["operation"], row["concurrency"]) for row in results] == [
+        ("sync", "get_token", 1), ("sync", "call_api", 1),
+        ("threaded", "get_token", 2), ("threaded", "call_api", 2),
+        ("async", "get_token", 2), ("async", "call_api", 2)
+    ]
+    for row in results:
+        assert row["requests"] == 5
+        assert row["errors"] == 0
+        assert row["rps"] > 0
+        assert row["p50_ms"] <= row["p95_ms"] <= row["p99_ms"]
+
+
+def test_stub_server_injects_errors():
+    with StubServer(error_rate=1.0) as server:
+        response = requests.get(f"{server.base_url}/api/anything", headers={"Authorization": "Bearer x"})
+        assert server.requests == 1
+    assert response.status_code == 503
+
+
+
+def test_setup_survives_injected_errors():
+    with StubServer(error_rate=0.5) as server:
+        results = run_suite(server.base_url, requests=5, concurrency_levels=(2,), operations=("get_token_cached",))
+
+    assert [row["errors"] for row in results] == [0, 0, 0]
+
+def test_main_writes_json_and_compares(tmp_path):
+    output = tmp_path / "results.json"
+    args = ["--requests", "3", "--modes", "sync", "--operations", "call_api", "--output", str(output)]
+    assert main(args) == 0
+    report = json.loads(output.read_text())
+    assert report["settings"]["requests"] == 3
+    assert report["results"][0]["operation"] == "call_api"
+
+    assert compare(report["results"], report["results"])[0]["rps_change"] == 0
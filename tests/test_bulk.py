@@ -0,0 +1,217 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import requests
+import requests_mock
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.async_client import AsyncSpokeAgentClient
+from spokeagent_sdk.bulk import normalize_agent_spec, normalize_call_spec
+from spokeagent_sdk.errors import AgentRegistrationError, APIRequestError, DeadlineExceededError, RequestTimeoutError
+
+
+@pytest.fixture
+def mock_config():
+    return SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key")
+
+
+def register_callback(request, context):
+    name = request.json()["name"]
+    if name == "broken-bot":
+        context.status_code = 500
+        return {"error": "boom"}
+    return {"id": f"id-{name}", "name": name}
+
+
+def test_normalize_agent_spec_forms():
+    assert normalize_agent_spec("bot") == {"name": "bot", "metadata": {}}
+    assert normalize_agent_spec(("bot", {"a": 1})) == {"name": "bot", "metadata": {"a": 1}}
+    assert normalize_agent_spec({"name": "bot"}) == {"name": "bot", "metadata": {}}
+    with pytest.raises(ValueError):
+        normalize_agent_spec({"metadata": {}})
+
+
+def test_register_agents_falls_back_to_concurrent_fanout(mock_config):
+    client = SpokeAgentClient(mock_config)
+    names = [f"bot-{i}" for i in range(20)] + ["broken-bot"]
+    progress = []
+
+    with requests_mock.Mocker() as m:
+        m.post("http://localhost:8000/api/agents/register/batch", status_code=404)
+        m.post("http://localhost:8000/api/agents/register", json=register_callback)
+
+        results = client.register_agents(names, max_concurrency=4, progress=lambda done, total: progress.append(done))
+
+        assert [r["id"] for r in results[:-1]] == [f"id-bot-{i}" for i in range(20)]
+        assert isinstance(results[-1], AgentRegistrationError)
+        assert progress == list(range(1, 22))
+
+        # The missing batch endpoint is remembered for later calls.
+        client.register_agents(["again"])
+        batch_calls = [r for r in m.request_history if r.path == "/api/agents/register/batch"]
+        assert len(batch_calls) == 1
+
+
+def test_register_agents_uses_batch_endpoint(mock_config):
+    client = SpokeAgentClient(mock_config)
+
+    def batch_callback(request, context):
+        agents = request.json()["agents"]
+        return {"agents": [
+            {"error": "duplicate"} if a["name"] == "dup" else {"id": f"id-{a['name']}", "name": a["name"]}
+            for a in agents
+        ]}
+
+    with requests_mock.Mocker() as m:
+        m.post("http://localhost:8000/api/agents/register/batch", json=batch_callback)
+
+        results = client.register_agents(["a", ("b", {"x": 1}), "dup", {"name": "c"}], batch_size=2)
+
+        assert [r["id"] for r in results if isinstance(r, dict)] == ["id-a", "id-b", "id-c"]
+        assert isinstance(results[2], AgentRegistrationError)
+        assert m.call_count == 2
+
+
+def test_async_register_agents_fanout(mock_config):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/batch"):
+            return httpx.Response(405)
+        name = json.loads(request.content)["name"]
+        return httpx.Response(200, json={"id": f"id-{name}"})
+
+    async def flow():
+        async with AsyncSpokeAgentClient(mock_config, transport=httpx.MockTransport(handler)) as client:
+            return await client.register_agents([f"bot-{i}" for i in range(10)], max_concurrency=3)
+
+    results = asyncio.run(flow())
+    assert [r["id"] for r in results] == [f"id-bot-{i}" for i in range(10)]
+
+
+def test_register_agents_returns_timeouts_per_item(mock_config):
+    client = SpokeAgentClient(mock_config)
+
+    def callback(request, context):
+        if request.json()["name"] == "slow-bot":
+            raise requests.exceptions.ReadTimeout("read timed out")
+        return register_callback(request, context)
+
+    with requests_mock.Mocker() as m:
+        m.post("http://localhost:8000/api/agents/register/batch", status_code=404)
+        m.post("http://localhost:8000/api/agents/register", json=callback)
+
+        results = client.register_agents(["a", "slow-bot", "b"], max_concurrency=2)
+
+    assert results[0]["id"] == "id-a"
+    assert isinstance(results[1], RequestTimeoutError)
+    assert results[2]["id"] == "id-b"
+
+
+def test_async_register_agents_returns_timeouts_per_item(mock_config):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/batch"):
+            raise httpx.ReadTimeout("read timed out", request=request)
+        name = json.loads(request.content)["name"]
+        if name == "slow-bot":
+            raise httpx.ReadTimeout("read timed out", request=request)
+        return httpx.Response(200, json={"id": f"id-{name}"})
+
+    async def flow():
+        async with AsyncSpokeAgentClient(mock_config, transport=httpx.MockTransport(handler)) as client:
+            batched = await client.register_agents(["a", "b"])
+            client._batch_register_supported = False
+            return batched, await client.register_agents(["a", "slow-bot", "b"])
+
+    batched, fanned_out = asyncio.run(flow())
+    assert all(isinstance(r, RequestTimeoutError) for r in batched)
+    assert fanned_out[0] == {"id": "id-a"}
+    assert isinstance(fanned_out[1], RequestTimeoutError)
+    assert fanned_out[2] == {"id": "id-b"}
+
+
+def test_normalize_call_spec_forms():
+    assert normalize_call_spec("/docs/1") == {"endpoint": "/docs/1", "method": "GET", "data": None, "agent_id": None}
+    assert normalize_call_spec(("/docs", "POST", {"a": 1}, "agent123")) == {
+        "endpoint": "/docs", "method": "POST", "data": {"a": 1}, "agent_id": "agent123"
+    }
+    assert normalize_call_spec({"endpoint": "/docs/1", "agent_id": "a"})["agent_id"] == "a"
+    with pytest.raises(ValueError):
+        normalize_call_spec(("/docs", "GET", None, None, "extra"))
+    with pytest.raises(ValueError):
+        normalize_call_spec({"method": "GET"})
+
+
+def document_callback(request, context):
+    doc_id = request.path.rsplit("/", 1)[-1]
+    if doc_id == "13":
+        context.status_code = 500
+        return {"error": "boom"}
+    return {"id": doc_id}
+
+
+def test_call_many_returns_results_in_order(mock_config):
+    mock_config.retry_policy = None
+    client = SpokeAgentClient(mock_config)
+    client.token = "abc123"
+
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, json=document_callback)
+        m.post("http://localhost:8000/api/documents", json={"created": True})
+        results = client.call_many(
+            [f"/api/documents/{i}" for i in range(20)] + [("/api/documents", "POST", {"title": "x"})],
+            max_concurrency=4
+        )
+
+    assert [r["id"] for i, r in enumerate(results[:20]) if i != 13] == [str(i) for i in range(20) if i != 13]
+    assert isinstance(results[13], APIRequestError) and results[13].status_code == 500
+    assert results[20] == {"created": True}
+
+
+def test_call_many_fail_fast_raises_first_error(mock_config):
+    mock_config.retry_policy = None
+    client = SpokeAgentClient(mock_config)
+    client.token = "abc123"
+
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, json=document_callback)
+        with pytest.raises(APIRequestError):
+            client.call_many([f"/api/documents/{i}" for i in range(10, 40)], max_concurrency=1, fail_fast=True)
+        assert m.call_count < 30  # queued requests are cancelled after the failure
+
+
+def test_call_many_shares_one_deadline(mock_config):
+    client = SpokeAgentClient(mock_config)
+    client.token = "abc123"
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, json={})
+        results = client.call_many(["/a", "/b"], deadline=0)
+        assert m.call_count == 0
+    assert all(isinstance(r, DeadlineExceededError) for r in results)
+
+
+def test_async_call_many(mock_config):
+    mock_config.retry_policy = None
+    in_flight, peak = 0, 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        doc_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(500 if doc_id == "13" else 200, json={"id": doc_id})
+
+    async def flow(fail_fast):
+        async with AsyncSpokeAgentClient(mock_config, transport=httpx.MockTransport(handler)) as client:
+            client.token = "abc123"
+            return await client.call_many([f"/api/documents/{i}" for i in range(20)],
+                                          max_concurrency=5, fail_fast=fail_fast)
+
+    results = asyncio.run(flow(False))
+    assert peak == 5
+    assert results[0] == {"id": "0"} and results[19] == {"id": "19"}
+    assert isinstance(results[13], APIRequestError)
+    with pytest.raises(APIRequestError):
+        asyncio.run(flow(True))
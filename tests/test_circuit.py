@@ -0,0 +1,153 @@
+import asyncio
+
+import httpx
+import pytest
+import requests_mock
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.async_client import AsyncSpokeAgentClient
+from spokeagent_sdk.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from spokeagent_sdk.errors import APIRequestError, CircuitOpenError
+from tests.helpers import FakeClock
+
+
+def test_key_groups_endpoints_by_host_and_prefix():
+    breaker = CircuitBreaker(prefix_depth=2)
+    assert breaker.key_for("http://api:8000/api/reports/today?x=1") == "api:8000/api/reports"
+    assert breaker.key_for("http://api:8000/api/reports/123") == "api:8000/api/reports"
+    assert breaker.key_for("http://api:8000/health") == "api:8000/health"
+    assert breaker.key_for("http://api:8000/api/123/reports") == "api:8000/api/:id"
+
+
+def test_circuit_map_is_bounded_and_keeps_open_circuits():
+    breaker = CircuitBreaker(window_size=2, minimum_calls=2, max_circuits=3, clock=FakeClock())
+    breaker.before_call("host/failing")
+    breaker.record("host/failing", False, 0.0)
+    breaker.before_call("host/failing")
+    breaker.record("host/failing", False, 0.0)
+    assert breaker.state("host/failing") == OPEN
+
+    for i in range(10):
+        breaker.before_call(f"host/ok-{i}")
+        breaker.record(f"host/ok-{i}", True, 0.0)
+
+    assert breaker.states() == {"host/failing": OPEN, "host/ok-8": CLOSED, "host/ok-9": CLOSED}
+
+
+def test_breaker_opens_half_opens_and_closes():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_rate_threshold=0.5, window_size=4, minimum_calls=4, open_duration=10, clock=clock)
+    key = "api/reports"
+
+    for success in (True, False, True, False):
+        breaker.before_call(key)
+        breaker.record(key, success, 0.01)
+    assert breaker.state(key) == OPEN
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_call(key)
+    assert excinfo.value.retry_after == 10
+
+    clock.now = 10
+    breaker.before_call(key)
+    assert breaker.state(key) == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call(key)  # only one trial call at a time
+    breaker.record(key, True, 0.01)
+    assert breaker.state(key) == CLOSED
+
+
+def test_failed_trial_reopens_circuit():
+    clock = FakeClock()
+    breaker = CircuitBreaker(window_size=2, minimum_calls=2, open_duration=5, clock=clock)
+    for _ in range(2):
+        breaker.before_call("k")
+        breaker.record("k", False, 0.01)
+
+    clock.now = 5
+    breaker.before_call("k")
+    breaker.record("k", False, 0.01)
+    assert breaker.state("k") == OPEN
+
+
+def test_slow_calls_open_circuit():
+    breaker = CircuitBreaker(slow_call_threshold=1.0, slow_call_rate_threshold=0.5, window_size=2, minimum_calls=2)
+    for latency in (2.0, 3.0):
+        breaker.before_call("k")
+        breaker.record("k", True, latency)
+    assert breaker.state("k") == OPEN
+
+
+def test_client_fails_fast_while_open():
+    breaker = CircuitBreaker(window_size=2, minimum_calls=2, open_duration=60)
+    config = SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key",
+                              retry_policy=None, circuit_breaker=breaker)
+    client = SpokeAgentClient(config)
+    client.token = "abc123"
+
+    with requests_mock.Mocker() as m:
+        m.get("http://localhost:8000/api/reports/today", status_code=500)
+        m.get("http://localhost:8000/api/documents/today", json={"ok": True})
+
+        for _ in range(2):
+            with pytest.raises(APIRequestError):
+                client.call_api("/api/reports/today")
+
+        with pytest.raises(CircuitOpenError):
+            client.call_api("/api/reports/today")
+        assert m.call_count == 2
+
+        # Other endpoint prefixes are unaffected.
+        assert client.call_api("/api/documents/today") == {"ok": True}
+
+
+def open_breaker(clock):
+    breaker = CircuitBreaker(window_size=2, minimum_calls=2, open_duration=5, clock=clock)
+    key = breaker.key_for("http://localhost:8000/api/reports")
+    for _ in range(2):
+        breaker.before_call(key)
+        breaker.record(key, False, 0.01)
+    clock.now = 5
+    return breaker, key
+
+
+def test_cancelled_async_trial_frees_the_half_open_slot():
+    clock = FakeClock()
+    breaker, key = open_breaker(clock)
+    config = SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key",
+                              retry_policy=None, circuit_breaker=breaker)
+
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            await asyncio.sleep(1)
+        return httpx.Response(200, json={"ok": True})
+
+    async def flow():
+        async with AsyncSpokeAgentClient(config, transport=httpx.MockTransport(handler)) as client:
+            client.token = "abc123"
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.call_api("/api/reports"), 0.05)
+            assert breaker.state(key) == HALF_OPEN
+            return await client.call_api("/api/reports")
+
+    assert asyncio.run(flow()) == {"ok": True}
+    assert breaker.state(key) == CLOSED
+
+
+def test_interrupted_sync_trial_frees_the_half_open_slot():
+    clock = FakeClock()
+    breaker, key = open_breaker(clock)
+    config = SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key",
+                              retry_policy=None, circuit_breaker=breaker)
+    client = SpokeAgentClient(config)
+    client.token = "abc123"
+
+    with requests_mock.Mocker() as m:
+        m.get("http://localhost:8000/api/reports", [{"exc": KeyboardInterrupt}, {"json": {"ok": True}}])
+        with pytest.raises(KeyboardInterrupt):
+            client.call_api("/api/reports")
+        assert client.call_api("/api/reports") == {"ok": True}
+    assert breaker.state(key) == CLOSED
@@ -1,6 +1,11 @@
+import time
+
 import pytest
 import requests_mock
+from unittest.mock import patch
 from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.errors import APIRequestError
+from tests.helpers import generate_jwt
 
 
 @pytest.fixture
@@ -36,3 +41,74 @@ def test_call_api(mock_config):
 
         response = client.call_api("/secure/data", method="GET")
         assert response["result"] == "success"
+
+
+def test_client_uses_pooled_session():
+    config = SpokeAgentConfig(
+        base_url="http://localhost:8000",
+        api_key="fake-api-key",
+        pool_connections=4,
+        pool_maxsize=32,
+        pool_block=True
+    )
+    client = SpokeAgentClient(config)
+
+    adapter = client.session.get_adapter("http://localhost:8000")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+    assert client.session.headers["Connection"] == "keep-alive"
+
+
+def test_keep_alive_disabled_sends_connection_close():
+    config = SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key", keep_alive=False)
+    client = SpokeAgentClient(config)
+    assert client.session.headers["Connection"] == "close"
+
+
+def test_client_context_manager_closes_session(mock_config):
+    client = SpokeAgentClient(mock_config)
+    with patch.object(client.session, "close") as mock_close:
+        with client as entered:
+            assert entered is client
+        mock_close.assert_called_once()
+
+
+def test_call_api_uses_each_agents_own_token(mock_config):
+    client = SpokeAgentClient(mock_config)
+    with requests_mock.Mocker() as m:
+        m.post("http://localhost:8000/api/agents/token", [{"json": {"token": "token-a"}}, {"json": {"token": "token-b"}}])
+        m.get("http://localhost:8000/secure/data", json={"result": "success"})
+
+        client.get_token("agent-a", scopes=["read:data"])
+        client.get_token("agent-b", scopes=["read:data"])
+
+        client.call_api("/secure/data", agent_id="agent-a")
+        client.call_api("/secure/data", agent_id="agent-b")
+
+        bearers = [r.headers["Authorization"] for r in m.request_history if r.method == "GET"]
+        assert bearers == ["Bearer token-a", "Bearer token-b"]
+        assert client.tokens.get("agent-a") == "token-a"
+
+
+def test_call_api_unknown_agent_raises(mock_config):
+    client = SpokeAgentClient(mock_config)
+    client.token = "abc123"
+    with pytest.raises(APIRequestError):
+        client.call_api("/secure/data", agent_id="never-seen")
+
+
+def test_call_api_renews_expiring_agent_token(mock_config):
+    client = SpokeAgentClient(mock_config)
+    expiring = generate_jwt({"exp": int(time.time()) + 5})
+    fresh = generate_jwt({"exp": int(time.time()) + 3600})
+
+    with requests_mock.Mocker() as m:
+        m.post("http://localhost:8000/api/agents/token", [{"json": {"token": expiring}}, {"json": {"token": fresh}}])
+        m.get("http://localhost:8000/secure/data", json={"result": "success"})
+
+        client.get_token("agent-a", scopes=["read:data"])
+        client.call_api("/secure/data", agent_id="agent-a")
+
+        assert m.request_history[-1].headers["Authorization"] == f"Bearer {fresh}"
+        assert client.tokens.get("agent-a") == fresh
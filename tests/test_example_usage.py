@@ -11,9 +11,10 @@ def mock_config():
     )
 
 
-@patch("spokeagent_sdk.client.requests.post")
-@patch("spokeagent_sdk.client.requests.get")  # ✅ Correctly mocking the GET request
-def test_full_agent_flow(mock_get, mock_post, mock_config):
+@patch("spokeagent_sdk.client.requests.Session")  # ✅ All calls go through the pooled session
+def test_full_agent_flow(mock_session_class, mock_config):
+    mock_session = mock_session_class.return_value
+
     # 1. Mock /api/agents/register response
     register_response = MagicMock()
     register_response.status_code = 200
@@ -29,15 +30,16 @@ def test_full_agent_flow(mock_get, mock_post, mock_config):
         "token": "fake-jwt-token"
     }
 
-    # Set side effect: first POST = register, second POST = token
-    mock_post.side_effect = [register_response, token_response]
-
     # 3. Mock GET /api/reports/today response
-    mock_get.return_value.status_code = 200
-    mock_get.return_value.json.return_value = {
+    report_response = MagicMock()
+    report_response.status_code = 200
+    report_response.json.return_value = {
         "report": "This is the summary for today"
     }
 
+    # Set side effect: register, token, then the report GET
+    mock_session.request.side_effect = [register_response, token_response, report_response]
+
     # 4. Execute the full SDK flow
     client = SpokeAgentClient(mock_config)
 
@@ -51,10 +53,12 @@ def test_full_agent_flow(mock_get, mock_post, mock_config):
     assert result["report"] == "This is the summary for today"
 
     # 5. Assert internal behavior
-    assert mock_post.call_count == 2
+    assert mock_session.request.call_count == 3
 
-    mock_get.assert_called_once_with(
+    mock_session.request.assert_called_with(
+        "GET",
         "https://api.spokeagent.com/api/reports/today",  # ✅ url passed as positional arg
+        timeout=(5.0, 30.0),  # ✅ default connect/read timeouts from the config
         headers={
             "Authorization": "Bearer fake-jwt-token",
             "Content-Type": "application/json"
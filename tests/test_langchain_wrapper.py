@@ -1,9 +1,17 @@
+import asyncio
+import time
+
+import httpx
 import pytest
-from unittest.mock import patch, MagicMock
+import requests_mock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, patch, MagicMock
 from langchain.tools import Tool
 
+from spokeagent_sdk.async_client import AsyncSpokeAgentClient
 from spokeagent_sdk.config import SpokeAgentConfig
-from spokeagent_sdk.langchain_wrapper import SpokeAgentTool
+from spokeagent_sdk.errors import AgentRegistrationError
+from spokeagent_sdk.langchain_wrapper import SpokeAgentTool, SpokeAgentToolkit
 
 
 @pytest.fixture
@@ -84,3 +92,145 @@ def test_input_map_functionality(mock_client_class, mock_config):
         method="POST",
         data={"input": "HELLO WORLD"}
     )
+
+
+@patch("spokeagent_sdk.langchain_wrapper.SpokeAgentClient")
+def test_toolkit_defers_registration_and_shares_one_client(mock_client_class, mock_config):
+    mock_client = MagicMock()
+    mock_client.register_agent.return_value = {"id": "agent789"}
+    mock_client.call_api.return_value = {"result": "ok"}
+    mock_client_class.return_value = mock_client
+
+    toolkit = SpokeAgentToolkit(config=mock_config, agent_name="multi-agent", scopes=["read:data"])
+    tools = toolkit.get_tools([
+        {"name": f"Tool{i}", "description": f"Tool number {i}", "endpoint": f"/api/tool/{i}", "method": "GET"}
+        for i in range(20)
+    ])
+
+    assert len(tools) == 20
+    mock_client_class.assert_called_once()
+    mock_client.register_agent.assert_not_called()
+    mock_client.get_token.assert_not_called()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda tool: tool.run("hi"), tools))
+
+    assert all("ok" in result for result in results)
+    mock_client.register_agent.assert_called_once_with("multi-agent", None)
+    mock_client.get_token.assert_called_once_with("agent789", ["read:data"])
+    mock_client.call_api.assert_any_call(
+        endpoint="/api/tool/3",
+        method="GET",
+        data={"query": "hi"},
+        agent_id="agent789"
+    )
+
+
+@patch("spokeagent_sdk.langchain_wrapper.SpokeAgentClient")
+def test_toolkit_retries_registration_after_failure(mock_client_class, mock_config):
+    mock_client = MagicMock()
+    mock_client.register_agent.side_effect = [AgentRegistrationError(), {"id": "agent1"}]
+    mock_client.call_api.return_value = {"result": "ok"}
+    mock_client_class.return_value = mock_client
+
+    tool = SpokeAgentToolkit(mock_config, "flaky-agent", ["read:data"]).as_tool(
+        name="Flaky", description="Flaky registration", endpoint="/api/data"
+    )
+
+    with pytest.raises(AgentRegistrationError):
+        tool.run("first")
+    assert "ok" in tool.run("second")
+    assert mock_client.register_agent.call_count == 2
+
+
+def test_tools_expose_a_native_coroutine_sharing_the_token(mock_config):
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.headers["Authorization"]))
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"result": request.url.path})
+
+    transport = httpx.MockTransport(handler)
+    with requests_mock.Mocker() as m, \
+            patch("spokeagent_sdk.langchain_wrapper.AsyncSpokeAgentClient",
+                  lambda config: AsyncSpokeAgentClient(config, transport=transport)):
+        m.post("http://fake-url.com/api/agents/register", json={"id": "agent123"})
+        m.post("http://fake-url.com/api/agents/token", json={"token": "sync-token"})
+        toolkit = SpokeAgentToolkit(mock_config, "async-agent", ["read:data"])
+        tools = toolkit.get_tools([
+            {"name": f"Tool{i}", "description": "d", "endpoint": f"/api/tool/{i}"} for i in range(5)
+        ])
+
+        async def run_all():
+            return await asyncio.gather(*(tool.ainvoke("hi") for tool in tools))
+
+        started = time.monotonic()
+        results = asyncio.run(run_all())
+        elapsed = time.monotonic() - started
+        assert m.call_count == 2
+
+    assert results == [str({"result": f"/api/tool/{i}"}) for i in range(5)]
+    assert {auth for _, auth in seen} == {"Bearer sync-token"}
+    assert elapsed < 0.4
+
+
+@patch("spokeagent_sdk.langchain_wrapper.AsyncSpokeAgentClient")
+@patch("spokeagent_sdk.langchain_wrapper.SpokeAgentClient")
+def test_tool_ainvoke_uses_async_client(mock_client_class, mock_async_client_class, mock_config):
+    mock_client = MagicMock()
+    mock_client.register_agent.return_value = {"id": "agent123"}
+    mock_client_class.return_value = mock_client
+    mock_async_client = MagicMock()
+    mock_async_client.call_api = AsyncMock(return_value={"result": "async"})
+    mock_async_client_class.return_value = mock_async_client
+
+    tool = SpokeAgentTool(mock_config, "test-agent", ["read:data"]).as_tool(
+        name="AsyncTool", description="Async data", endpoint="/api/data"
+    )
+
+    assert "async" in asyncio.run(tool.ainvoke("hello"))
+    mock_client.call_api.assert_not_called()
+    mock_async_client.call_api.assert_awaited_once_with(
+        endpoint="/api/data", method="POST", data={"query": "hello"}, agent_id="agent123"
+    )
+    assert mock_async_client.tokens is mock_client.tokens
+
+
+def test_async_clients_are_closed_and_pruned_per_loop():
+    config = SpokeAgentConfig(base_url="http://fake-url.com", api_key="fake-api-key", proactive_refresh=True)
+    created = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"auth": request.headers["Authorization"]})
+
+    def make_client(config):
+        created.append(AsyncSpokeAgentClient(config, transport=httpx.MockTransport(handler)))
+        return created[-1]
+
+    with requests_mock.Mocker() as m, \
+            patch("spokeagent_sdk.langchain_wrapper.AsyncSpokeAgentClient", make_client):
+        m.post("http://fake-url.com/api/agents/register", json={"id": "agent123"})
+        m.post("http://fake-url.com/api/agents/token", json={"token": "first-token"})
+        toolkit = SpokeAgentToolkit(config, "async-agent", ["read:data"])
+        tool = toolkit.as_tool(name="Tool", description="d", endpoint="/api/tool")
+
+        first = asyncio.run(tool.ainvoke("hi"))
+        toolkit.client.tokens.replace("agent123", "first-token", "renewed-token")
+
+        async def invoke_and_close():
+            result = await tool.ainvoke("hi")
+            live = len(toolkit._async_clients._clients)
+            await toolkit.aclose()
+            return result, live
+
+        second, live = asyncio.run(invoke_and_close())
+        toolkit.client.close()
+
+    assert "Bearer first-token" in first
+    assert "Bearer renewed-token" in second
+    assert len(created) == 2
+    assert live == 1
+    assert created[0].refresher is toolkit.client.refresher is not None
+    assert created[1].session.is_closed
+    assert len(toolkit._async_clients._clients) == 0
@@ -0,0 +1,98 @@
+import time
+
+import pytest
+import requests_mock
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.errors import APIRequestError
+from spokeagent_sdk.metrics import Metrics, endpoint_label, status_class
+from spokeagent_sdk.retry import RetryPolicy
+from tests.helpers import generate_jwt
+
+
+def series(snapshot, kind, name):
+    return {tuple(sorted(s["labels"].items())): s for s in snapshot[kind].get(name, [])}
+
+
+def test_endpoint_label_collapses_ids_and_query():
+    assert endpoint_label("/api/documents/123") == "/api/documents/:id"
+    assert endpoint_label("/api/agents/3f2b8c1e-9a4d-4c1b-8f3e-2a1b0c9d8e7f/tokens?x=1") == "/api/agents/:id/tokens"
+    assert endpoint_label("/secure/data") == "/secure/data"
+
+
+def test_status_class():
+    assert status_class(200) == "2xx"
+    assert status_class(503) == "5xx"
+    assert status_class(None) == "error"
+    assert status_class("timeout") == "timeout"
+
+
+def test_histogram_buckets_are_cumulative():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    for latency in (0.05, 0.5, 5.0):
+        metrics.observe("latency", {"op": "x"}, latency)
+    sample = metrics.snapshot()["histograms"]["latency"][0]
+    assert sample["buckets"] == {"0.1": 1, "1.0": 2, "+Inf": 3}
+    assert sample["count"] == 3
+    assert sample["sum"] == pytest.approx(5.55)
+
+
+def test_render_prometheus():
+    metrics = Metrics(buckets=(0.1,))
+    metrics.observe_request("call_api", "/secure/data", "get", 200, 0.05)
+    metrics.add_collector(lambda: [("pool_connections_idle", {"host": "api:443"}, 2)])
+    text = metrics.render_prometheus()
+
+    assert "# TYPE spokeagent_requests_total counter" in text
+    assert ('spokeagent_requests_total{endpoint="/secure/data",method="GET",'
+            'operation="call_api",status_class="2xx"} 1') in text
+    assert 'spokeagent_pool_connections_idle{host="api:443"} 2' in text
+    assert "# TYPE spokeagent_request_duration_seconds histogram" in text
+    assert 'le="+Inf"} 1' in text
+
+
+def test_client_records_requests_retries_and_cache_stats():
+    metrics = Metrics()
+    config = SpokeAgentConfig(
+        base_url="http://api",
+        api_key="key",
+        metrics=metrics,
+        retry_policy=RetryPolicy(max_attempts=2, backoff_base=0)
+    )
+    client = SpokeAgentClient(config)
+    token = generate_jwt({"exp": int(time.time()) + 3600})
+
+    with requests_mock.Mocker() as m:
+        m.post("http://api/api/agents/token", json={"token": token})
+        m.get("http://api/secure/data", [{"status_code": 503}, {"json": {"ok": True}}])
+        m.get("http://api/secure/missing", status_code=404)
+        client.get_token("agent123", ["read:data"])
+        client.get_token("agent123", ["read:data"])
+        client.call_api("/secure/data")
+        with pytest.raises(APIRequestError):
+            client.call_api("/secure/missing")
+
+    snapshot = metrics.snapshot()
+    requests_total = series(snapshot, "counters", "requests_total")
+    assert requests_total[(("endpoint", "/api/agents/token"), ("method", "POST"),
+                           ("operation", "get_token"), ("status_class", "2xx"))]["value"] == 1
+    assert requests_total[(("endpoint", "/secure/data"), ("method", "GET"),
+                           ("operation", "call_api"), ("status_class", "2xx"))]["value"] == 1
+    assert requests_total[(("endpoint", "/secure/missing"), ("method", "GET"),
+                           ("operation", "call_api"), ("status_class", "4xx"))]["value"] == 1
+    assert series(snapshot, "counters", "retries_total")[(("operation", "call_api"),)]["value"] == 1
+
+    gauges = series(snapshot, "gauges", "token_cache_hits")
+    assert gauges[()]["value"] == 1
+    assert series(snapshot, "gauges", "token_cache_misses")[()]["value"] == 1
+
+    client.close()
+    assert "token_cache_hits" not in metrics.snapshot()["gauges"]
+
+
+def test_collector_is_dropped_with_its_client():
+    metrics = Metrics()
+    client = SpokeAgentClient(SpokeAgentConfig(base_url="http://api", api_key="key", metrics=metrics))
+    assert "token_cache_size" in metrics.snapshot()["gauges"]
+    del client
+    assert metrics.snapshot()["gauges"] == {}
@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import requests_mock
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.async_client import AsyncSpokeAgentClient
+from spokeagent_sdk.errors import APIRequestError
+from spokeagent_sdk.pagination import CursorPaginator, OffsetPaginator, Paginator, prefetch_pages, with_query
+
+DOCS = [{"id": i} for i in range(25)]
+
+
+@pytest.fixture
+def client():
+    client = SpokeAgentClient(SpokeAgentConfig(base_url="http://api", api_key="key", retry_policy=None))
+    client.token = "abc123"
+    return client
+
+
+def cursor_page(request, context):
+    start = int(request.qs.get("cursor", ["0"])[0])
+    size = int(request.qs["limit"][0])
+    end = start + size
+    return {"data": {"items": DOCS[start:end]}, "next": str(end) if end < len(DOCS) else None}
+
+
+def offset_page(request, context):
+    offset, limit = int(request.qs["offset"][0]), int(request.qs["limit"][0])
+    return {"items": DOCS[offset:offset + limit], "total": len(DOCS)}
+
+
+def test_with_query():
+    assert with_query("/docs", {}) == "/docs"
+    assert with_query("/docs", {"cursor": "a b"}) == "/docs?cursor=a+b"
+    assert with_query("/docs?type=pdf", {"limit": 10}) == "/docs?type=pdf&limit=10"
+
+
+def test_offset_paginator_stops_on_short_page_or_total():
+    paginator = OffsetPaginator(page_size=10, total_field="total")
+    params = paginator.first_params()
+    assert params == {"offset": 0, "limit": 10}
+    assert paginator.next_params({"items": [0] * 10, "total": 25}, params) == {"offset": 10, "limit": 10}
+    assert paginator.next_params({"items": [0] * 10, "total": 10}, params) is None
+    assert paginator.next_params({"items": [0] * 3}, params) is None
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iter_items_cursor(client, prefetch):
+    paginator = CursorPaginator(cursor_field="next", items_field="data.items", page_size=10)
+    with requests_mock.Mocker() as m:
+        m.get("http://api/api/documents", json=cursor_page)
+        assert list(client.iter_items("/api/documents", paginator, prefetch=prefetch)) == DOCS
+        assert m.call_count == 3
+
+
+def test_iter_pages_offset_with_max_pages(client):
+    with requests_mock.Mocker() as m:
+        m.get("http://api/api/documents", json=offset_page)
+        pages = list(client.iter_pages("/api/documents", OffsetPaginator(page_size=10), max_pages=2))
+    assert [len(page["items"]) for page in pages] == [10, 10]
+
+
+def test_errors_surface_in_page_order(client):
+    with requests_mock.Mocker() as m:
+        m.get("http://api/api/documents", [
+            {"json": {"items": [1], "next_cursor": "b"}},
+            {"status_code": 500}
+        ])
+        pages = client.iter_pages("/api/documents")
+        assert next(pages) == {"items": [1], "next_cursor": "b"}
+        with pytest.raises(APIRequestError):
+            next(pages)
+
+
+def test_prefetch_is_bounded_and_overlaps_processing():
+    produced = []
+
+    def pages():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    iterator = prefetch_pages(pages(), prefetch=2)
+    assert next(iterator) == 0
+    time.sleep(0.05)
+    # One page handed out, two buffered and one blocked on the full buffer.
+    assert len(produced) == 4
+
+    iterator.close()
+    time.sleep(0.2)
+    assert len(produced) <= 5
+    assert not any(t.name == "spokeagent-prefetch" for t in threading.enumerate())
+
+
+def test_async_iter_items():
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset, limit = int(request.url.params["offset"]), int(request.url.params["limit"])
+        return httpx.Response(200, json={"items": DOCS[offset:offset + limit]})
+
+    async def flow():
+        config = SpokeAgentConfig(base_url="http://api", api_key="key")
+        async with AsyncSpokeAgentClient(config, transport=httpx.MockTransport(handler)) as client:
+            client.token = "abc123"
+            return [item async for item in client.iter_items("/api/documents", OffsetPaginator(page_size=10))]
+
+    assert asyncio.run(flow()) == DOCS
+
+
+def test_paginator_subclass_must_implement_next_params():
+    class NoNextParams(Paginator):
+        pass
+
+    with pytest.raises(TypeError):
+        NoNextParams()
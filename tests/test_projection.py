@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import requests_mock
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.async_client import AsyncSpokeAgentClient
+from spokeagent_sdk.errors import APIRequestError
+from spokeagent_sdk.utils import project
+
+ijson = pytest.importorskip("ijson")
+
+from spokeagent_sdk.projection import Projector, project_chunks  # noqa: E402
+
+DOC = {
+    "meta": {"total": 3, "blob": list(range(50))},
+    "items": [{"id": 1, "owner": {"name": "a"}}, {"id": 2, "owner": {"name": "b"}}, {"other": True}],
+    "tail": {"k": [1, {"z": 2.5}]},
+    "status": "ok"
+}
+RAW = json.dumps(DOC).encode()
+
+
+@pytest.mark.parametrize("paths", [
+    ["meta.total", "items[*].id", "items[1].owner", "tail.k[1].z", "missing.x", "items.0.id"],
+    ["items", "items[*].owner.name", "status"],
+    ["meta.*"],
+    ["items[*]"],
+])
+@pytest.mark.parametrize("chunk_size", [1, 16, 10000])
+def test_incremental_projection_matches_in_memory(paths, chunk_size):
+    chunks = [RAW[i:i + chunk_size] for i in range(0, len(RAW), chunk_size)]
+    assert project_chunks(chunks, paths) == project(DOC, paths)
+
+
+def test_unselected_containers_are_never_built(monkeypatch):
+    built = []
+    original = ijson.ObjectBuilder.event
+
+    def spy(self, event, value):
+        built.append(event)
+        original(self, event, value)
+
+    monkeypatch.setattr(ijson.ObjectBuilder, "event", spy)
+    assert project_chunks([RAW], ["status"]) == {"status": "ok"}
+    assert built == ["string"]
+
+
+def test_projection_stops_early_and_rejects_bad_input():
+    chunks = iter([b'{"status": "ok", ', b'"rest": [1, 2'])
+    assert project_chunks(chunks, ["status"]) == {"status": "ok"}
+
+    with pytest.raises(ValueError):
+        Projector(["items[-1]"])
+    projector = Projector(["a"])
+    with pytest.raises(APIRequestError):
+        projector.feed(b'{"a": }')
+
+
+def test_call_api_select(monkeypatch):
+    monkeypatch.setattr("spokeagent_sdk.projection.INCREMENTAL_THRESHOLD", 100)
+    client = SpokeAgentClient(SpokeAgentConfig(base_url="http://api", api_key="key"))
+    client.token = "abc123"
+
+    with requests_mock.Mocker() as m:
+        m.get("http://api/big", content=RAW)
+        m.get("http://api/small", json={"a": {"b": 1}})
+        assert client.call_api("/big", select=["items[*].id", "status"]) == {"items[*].id": [1, 2], "status": "ok"}
+        assert client.call_api("/small", select=["a.b"]) == {"a.b": 1}
+        assert client.call_api("/small") == {"a": {"b": 1}}
+        with pytest.raises(ValueError):
+            client.call_api("/small", select=["a..b"])
+        assert m.call_count == 3
+
+
+def test_async_call_api_select(monkeypatch):
+    monkeypatch.setattr("spokeagent_sdk.projection.INCREMENTAL_THRESHOLD", 100)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/big":
+            return httpx.Response(200, content=RAW)
+        return httpx.Response(200, json={"a": [{"b": 1}]})
+
+    async def flow():
+        config = SpokeAgentConfig(base_url="http://api", api_key="key")
+        async with AsyncSpokeAgentClient(config, transport=httpx.MockTransport(handler)) as client:
+            client.token = "abc123"
+            return (await client.call_api("/big", select=["meta.total", "tail.k[1].z"]),
+                    await client.call_api("/small", select=["a[-1].b"]))
+
+    assert asyncio.run(flow()) == ({"meta.total": 3, "tail.k[1].z": 2.5}, {"a[-1].b": 1})
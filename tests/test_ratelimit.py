@@ -0,0 +1,144 @@
+import asyncio
+
+import httpx
+import pytest
+import requests_mock
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.async_client import AsyncSpokeAgentClient
+from spokeagent_sdk.errors import DeadlineExceededError, RateLimitExceededError
+from spokeagent_sdk.ratelimit import Limit, RateLimiter
+from spokeagent_sdk.timeouts import Deadline
+from tests.helpers import FakeClock
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    clock = FakeClock()
+    limiter = RateLimiter(default=Limit(rate=2, burst=2), clock=clock)
+
+    assert limiter.reserve("a", "/x") == 0
+    assert limiter.reserve("a", "/x") == 0
+    assert limiter.reserve("a", "/x") == pytest.approx(0.5)
+    assert limiter.reserve("a", "/x") == pytest.approx(1.0)  # callers queue in arrival order
+    assert limiter.reserve("b", "/x") == 0  # other agents have their own bucket
+
+    clock.now = 1.0
+    assert limiter.reserve("a", "/x") == pytest.approx(0.5)
+
+
+def test_fail_fast_and_max_wait_do_not_consume():
+    clock = FakeClock()
+    limiter = RateLimiter(default=Limit(rate=1, burst=1), block=False, clock=clock)
+    limiter.reserve("a", "/x")
+    with pytest.raises(RateLimitExceededError) as excinfo:
+        limiter.reserve("a", "/x")
+    assert excinfo.value.bucket == "agent:a"
+    assert excinfo.value.retry_after == pytest.approx(1.0)
+
+    blocking = RateLimiter(default=1, clock=clock)
+    blocking.reserve("a", "/x")
+    with pytest.raises(RateLimitExceededError):
+        blocking.reserve("a", "/x", max_wait=0.5)
+    assert blocking.reserve("a", "/x", max_wait=2) == pytest.approx(1.0)
+
+
+def test_agent_overrides_and_endpoint_patterns():
+    clock = FakeClock()
+    limiter = RateLimiter(
+        agents={"vip": Limit(rate=100, burst=100)},
+        endpoints={"/api/reports/*": Limit(rate=1, burst=1)},
+        block=False,
+        clock=clock
+    )
+    for _ in range(10):
+        limiter.reserve("vip", "/api/documents/1")
+        limiter.reserve("anyone", "/api/documents/1")  # no default: unlimited
+
+    limiter.reserve("vip", "/api/reports/today")
+    with pytest.raises(RateLimitExceededError) as excinfo:
+        limiter.reserve("vip", "/api/reports/yesterday")
+    assert excinfo.value.bucket == "endpoint:vip:/api/reports/*"
+    limiter.reserve("other", "/api/reports/today")
+
+
+def test_adaptive_mode_backs_off_on_429_and_recovers():
+    clock = FakeClock()
+    limiter = RateLimiter(default=Limit(rate=10, burst=10), adaptive=True, increase_step=0.25, clock=clock)
+    limiter.reserve("a", "/x")
+
+    limiter.record("a", "/x", 429)
+    limiter.record("a", "/x", 429)
+    assert limiter.rates() == {"agent:a": 2.5}
+
+    limiter.record("a", "/x", 429, retry_after="3")
+    assert limiter.reserve("a", "/x") == pytest.approx(3.0)
+
+    for _ in range(10):
+        limiter.record("a", "/x", 200)
+    assert limiter.rates() == {"agent:a": 10}
+
+
+def test_client_applies_limiter_per_agent():
+    limiter = RateLimiter(default=Limit(rate=1, burst=2), block=False)
+    config = SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key", rate_limiter=limiter)
+    client = SpokeAgentClient(config)
+    client.token = "abc123"
+
+    with requests_mock.Mocker() as m:
+        m.get("http://localhost:8000/api/reports/today?page=1", json={"ok": True})
+        client.call_api("/api/reports/today?page=1")
+        client.call_api("/api/reports/today?page=1")
+        with pytest.raises(RateLimitExceededError):
+            client.call_api("/api/reports/today?page=1")
+        assert m.call_count == 2
+
+
+def test_limiter_wait_that_uses_up_the_deadline_sends_nothing():
+    clock = FakeClock()
+
+    class SlowLimiter(RateLimiter):
+        def acquire(self, agent, endpoint, max_wait=None):
+            clock.now += max_wait
+
+        async def acquire_async(self, agent, endpoint, max_wait=None):
+            clock.now += max_wait
+
+    config = SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key",
+                              rate_limiter=SlowLimiter(default=Limit(rate=1, burst=1)))
+    client = SpokeAgentClient(config)
+    client.token = "abc123"
+
+    with requests_mock.Mocker() as m:
+        m.get("http://localhost:8000/api/reports", json={"ok": True})
+        with pytest.raises(DeadlineExceededError):
+            client.call_api("/api/reports", deadline=Deadline(1, clock=clock))
+        assert m.call_count == 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("no request should be sent")
+
+    async def flow():
+        async with AsyncSpokeAgentClient(config, transport=httpx.MockTransport(handler)) as async_client:
+            async_client.token = "abc123"
+            await async_client.call_api("/api/reports", deadline=Deadline(1, clock=clock))
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(flow())
+
+
+def test_async_client_waits_for_capacity_and_adapts():
+    limiter = RateLimiter(default=Limit(rate=1000, burst=1), adaptive=True)
+    config = SpokeAgentConfig(base_url="http://api", api_key="key", rate_limiter=limiter, retry_policy=None)
+    statuses = iter([200, 429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), json={})
+
+    async def flow():
+        async with AsyncSpokeAgentClient(config, transport=httpx.MockTransport(handler)) as client:
+            client.token = "abc123"
+            return await asyncio.gather(*(client.call_api("/x") for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(flow())
+    assert sum(isinstance(r, Exception) for r in results) == 1
+    assert limiter.rates()["agent:"] < 1000  # opaque token: no subject to key on
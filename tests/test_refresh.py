@@ -0,0 +1,74 @@
+import threading
+import time
+
+import requests_mock
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.refresh import TokenRefresher
+from tests.helpers import generate_jwt
+
+
+def make_token(lifetime: float, elapsed: float) -> str:
+    now = int(time.time())
+    return generate_jwt({"iat": now - int(elapsed), "exp": now - int(elapsed) + int(lifetime)})
+
+
+def test_refresher_renews_due_token_and_reschedules():
+    refreshed = threading.Event()
+    calls = []
+
+    def refresh_fn(agent_id, scopes, old_token):
+        calls.append((agent_id, scopes, old_token))
+        refreshed.set()
+        return make_token(lifetime=3600, elapsed=0)
+
+    refresher = TokenRefresher(refresh_fn, fraction=0.5, min_interval=0)
+    old_token = make_token(lifetime=100, elapsed=90)
+    try:
+        assert refresher.schedule("agent1", ["read:data"], old_token)
+        assert refreshed.wait(timeout=2)
+        assert calls == [("agent1", ["read:data"], old_token)]
+
+        # The new token is scheduled for its own half-life, not refreshed again right away.
+        time.sleep(0.05)
+        assert len(refresher) == 1
+        assert refresher.refreshes == 1
+    finally:
+        refresher.stop()
+
+
+def test_refresher_skips_tokens_without_expiry_and_honours_cancel():
+    refresher = TokenRefresher(lambda *args: "unused", fraction=0.8)
+    try:
+        assert refresher.schedule("agent1", ["read:data"], "opaque-token") is False
+        assert refresher.schedule("agent1", ["read:data"], make_token(lifetime=3600, elapsed=0))
+        assert len(refresher) == 1
+        refresher.cancel("agent1")
+        assert len(refresher) == 0
+    finally:
+        refresher.stop()
+
+
+def test_client_proactive_refresh_updates_cache_and_current_token():
+    config = SpokeAgentConfig(
+        base_url="http://localhost:8000",
+        api_key="fake-api-key",
+        proactive_refresh=True,
+        refresh_fraction=0.5
+    )
+    first = make_token(lifetime=1000, elapsed=900)
+    second = make_token(lifetime=3600, elapsed=0)
+
+    with SpokeAgentClient(config) as client, requests_mock.Mocker() as m:
+        client.refresher.min_interval = 0
+        m.post("http://localhost:8000/api/agents/token", [{"json": {"token": first}}, {"json": {"token": second}}])
+
+        assert client.get_token("agent123", ["read:data"]) == first
+
+        deadline = time.time() + 2
+        while client.token != second and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert client.token == second
+        assert client.get_token("agent123", ["read:data"]) == second
+        assert m.call_count == 2
@@ -0,0 +1,130 @@
+import asyncio
+
+import httpx
+import requests_mock
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.async_client import AsyncSpokeAgentClient
+from spokeagent_sdk.response_cache import ResponseCache, parse_cache_control
+from tests.helpers import FakeClock, generate_jwt
+
+
+READER = generate_jwt({"sub": "agent123", "scope": "read:data"})
+WRITER = generate_jwt({"sub": "agent123", "scope": "read:data write:data"})
+URL = "http://api/api/documents/today"
+
+
+def test_parse_cache_control():
+    assert parse_cache_control('max-age=60, no-cache, private="x"') == {
+        "max-age": "60", "no-cache": None, "private": "x"
+    }
+    assert parse_cache_control(None) == {}
+
+
+def test_keys_separate_agents_and_scopes():
+    assert ResponseCache.make_key(READER, URL) == ("agent123", ("read:data",), URL)
+    assert ResponseCache.make_key(READER, URL) != ResponseCache.make_key(WRITER, URL)
+    opaque = ResponseCache.make_key("opaque-token", URL)
+    assert opaque[0].startswith("bearer:") and "opaque-token" not in opaque[0]
+
+
+def test_key_for_token_without_scopes():
+    unscoped = generate_jwt({"sub": "agent123"})
+    assert ResponseCache.make_key(unscoped, URL) == ("agent123", (), URL)
+
+
+def test_cache_control_and_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(default_ttl=10, clock=clock)
+    key = ResponseCache.make_key(READER, URL)
+
+    assert not cache.store(key, {"a": 1}, 10, {"Cache-Control": "no-store"})
+    assert not cache.store(key, {"a": 1}, 10, {"Cache-Control": "no-cache"})
+
+    assert cache.store(key, {"a": 1}, 10, {"Cache-Control": "max-age=60", "Age": "20"})
+    clock.now = 39
+    assert cache.lookup(key) == (cache._entries[key], True)
+    clock.now = 40
+    assert cache.lookup(key) == (None, False)
+
+    assert cache.store(key, {"a": 2}, 10, {})
+    clock.now = 49.9
+    assert cache.lookup(key)[1]
+
+
+def test_stale_entry_with_etag_is_kept_for_revalidation():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    key = ResponseCache.make_key(READER, URL)
+    cache.store(key, {"a": 1}, 10, {"Cache-Control": "no-cache", "ETag": '"v1"'})
+
+    entry, fresh = cache.lookup(key)
+    assert not fresh and entry.etag == '"v1"'
+
+    cache.revalidated(key, {"Cache-Control": "max-age=5"})
+    entry, fresh = cache.lookup(key)
+    assert fresh and entry.value == {"a": 1} and entry.etag == '"v1"'
+    assert cache.stats()["revalidations"] == 1
+
+
+def test_lru_is_bounded_by_bytes():
+    cache = ResponseCache(max_bytes=100)
+    keys = [ResponseCache.make_key(READER, f"{URL}?page={i}") for i in range(3)]
+    cache.store(keys[0], 0, 40, {})
+    cache.store(keys[1], 1, 40, {})
+    cache.lookup(keys[0])
+    cache.store(keys[2], 2, 40, {})
+
+    assert cache.lookup(keys[1]) == (None, False)
+    assert cache.lookup(keys[0])[1] and cache.lookup(keys[2])[1]
+    assert cache.stats()["bytes"] == 80
+    assert cache.stats()["evictions"] == 1
+    assert not cache.store(keys[1], 1, 101, {})
+
+
+def test_client_serves_fresh_hits_and_revalidates_with_etag():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    client = SpokeAgentClient(SpokeAgentConfig(base_url="http://api", api_key="key", response_cache=cache))
+    client.token = READER
+
+    with requests_mock.Mocker() as m:
+        m.get(URL, [
+            {"json": {"doc": "today"}, "headers": {"Cache-Control": "max-age=10", "ETag": '"v1"'}},
+            {"status_code": 304, "headers": {"Cache-Control": "max-age=10"}}
+        ])
+        first = client.call_api("/api/documents/today")
+        assert client.call_api("/api/documents/today") is first
+        assert m.call_count == 1
+
+        clock.now = 11
+        assert client.call_api("/api/documents/today") == {"doc": "today"}
+        assert m.call_count == 2
+        assert m.request_history[1].headers["If-None-Match"] == '"v1"'
+
+        assert client.call_api("/api/documents/today") == {"doc": "today"}
+        assert m.call_count == 2
+
+        client.token = WRITER
+        m.get(URL, json={"doc": "writer view"})
+        assert client.call_api("/api/documents/today") == {"doc": "writer view"}
+
+
+def test_async_client_uses_response_cache():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"doc": "today"}, headers={"Cache-Control": "no-cache", "ETag": '"v1"'})
+
+    config = SpokeAgentConfig(base_url="http://api", api_key="key", response_cache=ResponseCache())
+
+    async def flow():
+        async with AsyncSpokeAgentClient(config, transport=httpx.MockTransport(handler)) as client:
+            client.token = READER
+            return [await client.call_api("/api/documents/today") for _ in range(3)]
+
+    assert asyncio.run(flow()) == [{"doc": "today"}] * 3
+    assert calls == [None, '"v1"', '"v1"']
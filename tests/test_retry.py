@@ -0,0 +1,92 @@
+import pytest
+import requests
+import requests_mock
+from unittest.mock import patch
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.errors import APIRequestError
+from spokeagent_sdk.retry import RetryPolicy
+
+
+def make_client(**policy_kwargs):
+    policy = RetryPolicy(rng=lambda: 1.0, **policy_kwargs)
+    client = SpokeAgentClient(SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key", retry_policy=policy))
+    client.token = "abc123"
+    return client
+
+
+def test_compute_delay_uses_capped_exponential_full_jitter():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3.0, rng=lambda: 1.0)
+    assert [policy.compute_delay(n) for n in range(1, 5)] == [0.5, 1.0, 2.0, 3.0]
+    assert RetryPolicy(rng=lambda: 0.0).compute_delay(3) == 0.0
+
+
+def test_compute_delay_honours_retry_after():
+    policy = RetryPolicy(backoff_base=0.1, max_retry_after=30, rng=lambda: 1.0)
+    assert policy.compute_delay(1, "7") == 7.0
+    assert policy.compute_delay(1, "Wed, 21 Oct 2015 07:28:00 GMT") == 0.1
+    assert policy.compute_delay(1, "120") is None
+    assert RetryPolicy.parse_retry_after("garbage") is None
+
+
+@patch("spokeagent_sdk.client.time.sleep")
+def test_get_retries_transient_statuses_then_succeeds(mock_sleep):
+    client = make_client(max_attempts=4, backoff_base=0.1)
+    with requests_mock.Mocker() as m:
+        m.get("http://localhost:8000/secure/data", [
+            {"status_code": 503},
+            {"status_code": 429, "headers": {"Retry-After": "2"}},
+            {"json": {"result": "success"}},
+        ])
+
+        assert client.call_api("/secure/data")["result"] == "success"
+        assert m.call_count == 3
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.1, 2.0]
+
+
+@patch("spokeagent_sdk.client.time.sleep")
+def test_exhausted_retries_attach_attempts_to_error(mock_sleep):
+    client = make_client(max_attempts=3)
+    with requests_mock.Mocker() as m:
+        m.get("http://localhost:8000/secure/data", status_code=502)
+
+        with pytest.raises(APIRequestError) as excinfo:
+            client.call_api("/secure/data")
+
+    assert excinfo.value.status_code == 502
+    assert excinfo.value.attempts == 3
+    assert excinfo.value.retries == 2
+
+
+@patch("spokeagent_sdk.client.time.sleep")
+def test_connection_errors_are_retried(mock_sleep):
+    client = make_client(max_attempts=2)
+    with requests_mock.Mocker() as m:
+        m.get("http://localhost:8000/secure/data", [
+            {"exc": requests.ConnectionError("connection reset")},
+            {"json": {"result": "success"}},
+        ])
+        assert client.call_api("/secure/data")["result"] == "success"
+
+
+@patch("spokeagent_sdk.client.time.sleep")
+def test_post_is_not_retried_by_default(mock_sleep):
+    client = make_client(max_attempts=3)
+    with requests_mock.Mocker() as m:
+        m.post("http://localhost:8000/secure/data", status_code=503)
+
+        with pytest.raises(APIRequestError) as excinfo:
+            client.call_api("/secure/data", method="POST", data={"q": 1})
+
+        assert m.call_count == 1
+    assert excinfo.value.attempts == 1
+    mock_sleep.assert_not_called()
+
+
+@patch("spokeagent_sdk.client.time.sleep")
+def test_token_requests_are_retried(mock_sleep):
+    client = make_client(max_attempts=2)
+    with requests_mock.Mocker() as m:
+        m.post("http://localhost:8000/api/agents/token", [{"status_code": 503}, {"json": {"token": "abc"}}])
+        assert client.get_token("agent123", ["read:data"]) == "abc"
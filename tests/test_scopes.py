@@ -0,0 +1,92 @@
+import pytest
+
+from spokeagent_sdk.auth import AgentToken, scope_set_for
+from spokeagent_sdk.scopes import ScopeSet
+from tests.helpers import generate_jwt
+
+
+@pytest.fixture
+def scopes():
+    return ScopeSet(["read:documents", "write:logs", "admin:*", "read:*:summary", "audit"])
+
+
+@pytest.mark.parametrize("query, allowed", [
+    ("read:documents", True),
+    ("write:documents", False),
+    ("audit", True),
+    ("audit:events", False),
+    ("admin:users", True),
+    ("admin:users:delete", True),
+    ("admin", False),
+    ("read:reports:summary", True),
+    ("read:reports:raw", False),
+    ("admin:*", True),  # covered by the granted wildcard
+    ("read:*", False),  # only read:documents and read:*:summary are granted
+    ("write:*", False),
+    ("*:logs", False),
+    ("*", False),
+])
+def test_exact_wildcard_and_hierarchical_matches(scopes, query, allowed):
+    assert scopes.allows(query) is allowed
+    assert scopes.allows(query) is allowed  # memoized result
+
+
+def test_query_wildcards_never_widen_grants():
+    scopes = ScopeSet(["admin:users", "write:logs"])
+    assert not scopes.allows("admin:*")
+    assert not scopes.allows("*:logs")
+    assert not scopes.has_any(["admin:*", "*:logs"])
+    assert not scopes.has_all(["admin:users", "admin:*"])
+    assert ScopeSet(["*"]).allows("admin:*")
+
+
+def test_matches_any_pattern():
+    scopes = ScopeSet(["read:documents", "write:logs", "admin:*"])
+    assert scopes.matches_any_pattern("read:*")
+    assert scopes.matches_any_pattern("*:logs")
+    assert scopes.matches_any_pattern("*:reports")  # admin:reports
+    assert not scopes.matches_any_pattern("delete:*")
+    assert not scopes.matches_any_pattern("read:*:summary")
+
+
+def test_has_all_and_has_any(scopes):
+    assert scopes.has_all(["read:documents", "admin:users"])
+    assert not scopes.has_all(["read:documents", "write:documents"])
+    assert scopes.has_any(["write:documents", "write:logs"])
+    assert not scopes.has_any(["write:documents", "delete:logs"])
+    assert scopes.has_all([])
+    assert not scopes.has_any([])
+
+
+def test_set_protocol(scopes):
+    assert "admin:users" in scopes
+    assert 42 not in scopes
+    assert len(scopes) == 5 and set(scopes) >= {"audit"}
+    assert not ScopeSet() and ScopeSet([""]) == ScopeSet()
+
+
+def test_compiled_sets_are_shared_and_cached_per_token():
+    first = AgentToken(generate_jwt({"sub": "a", "scope": "read:data write:data"}))
+    second = AgentToken(generate_jwt({"sub": "b", "scope": "write:data read:data"}))
+    assert first.scope_set is first.scope_set
+    assert first.scope_set is second.scope_set
+    assert first.scope_set.matches_any_pattern("read:*")
+
+    raw = generate_jwt({"sub": "c", "scope": ["read:data"]})
+    assert scope_set_for(raw) is scope_set_for(raw)
+    assert scope_set_for(raw) == ScopeSet(["read:data"])
+    assert not scope_set_for("opaque-token")
+
+
+def test_scope_set_resets_with_token():
+    token = AgentToken(generate_jwt({"scope": "read:data"}))
+    assert token.scope_set.allows("read:data")
+    token.token = generate_jwt({"scope": "write:data"})
+    assert not token.scope_set.allows("read:data")
+
+
+def test_non_string_scope_claims_are_ignored():
+    token = generate_jwt({"sub": "agent123", "scope": ["read:a", 7, {"x": 1}, None]})
+    assert AgentToken(token).scope_set == ScopeSet(["read:a"])
+    assert scope_set_for(token).allows("read:a")
+    assert not scope_set_for(token).allows("7")
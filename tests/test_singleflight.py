@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.errors import TokenRequestError
+from spokeagent_sdk.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_singleflight_coalesces_concurrent_threads():
+    flight = SingleFlight()
+    calls = []
+    barrier = threading.Barrier(8)
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.1)
+        return "token"
+
+    def worker():
+        barrier.wait()
+        return flight.do("key", fetch)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: worker(), range(8)))
+
+    assert results == ["token"] * 8
+    assert len(calls) == 1
+    assert flight.in_flight() == 0
+
+
+def test_singleflight_shares_exception():
+    flight = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def fetch():
+        started.set()
+        time.sleep(0.1)
+        raise TokenRequestError("boom")
+
+    def follower():
+        started.wait()
+        try:
+            flight.do("key", lambda: "not called")
+        except TokenRequestError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=follower)
+    thread.start()
+    with pytest.raises(TokenRequestError):
+        flight.do("key", fetch)
+    thread.join()
+
+    assert len(errors) == 1
+
+
+def test_async_singleflight_coalesces_tasks():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "token"
+
+    async def run():
+        flight = AsyncSingleFlight()
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(20)))
+        return results, flight.in_flight()
+
+    results, in_flight = asyncio.run(run())
+    assert results == ["token"] * 20
+    assert len(calls) == 1
+    assert in_flight == 0
+
+
+def test_client_get_token_sends_one_request_for_a_burst():
+    config = SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key")
+    client = SpokeAgentClient(config)
+    calls = []
+
+    def slow_fetch(agent_id, scopes, *args):
+        calls.append((agent_id, scopes))
+        time.sleep(0.1)
+        return "opaque-token"
+
+    client._fetch_token = slow_fetch
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        tokens = list(pool.map(lambda _: client.get_token("agent123", ["read:data"]), range(10)))
+
+    assert tokens == ["opaque-token"] * 10
+    assert len(calls) == 1
+
+
+def test_forced_refresh_does_not_join_a_normal_fetch():
+    config = SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key")
+    client = SpokeAgentClient(config)
+    calls = []
+    release = threading.Event()
+
+    def fetch(agent_id, scopes, *args):
+        calls.append(agent_id)
+        if len(calls) == 1:
+            release.wait(5)
+            return "old-token"
+        return "new-token"
+
+    client._fetch_token = fetch
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        normal = pool.submit(client.get_token, "agent123", ["read:data"])
+        while not calls:
+            time.sleep(0.01)
+        forced = client.get_token("agent123", ["read:data"], force_refresh=True)
+        release.set()
+        assert normal.result() == "old-token"
+
+    assert forced == "new-token"
+    assert len(calls) == 2
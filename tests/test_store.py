@@ -0,0 +1,229 @@
+import asyncio
+import os
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import requests_mock
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.async_client import AsyncSpokeAgentClient
+from spokeagent_sdk.errors import DeadlineExceededError
+from spokeagent_sdk.store import SQLiteTokenStore, TokenStore, scopes_key
+from tests.helpers import generate_jwt
+
+
+def make_token(sub="agent123", ttl=3600):
+    return generate_jwt({"sub": sub, "exp": int(time.time()) + ttl})
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteTokenStore(str(tmp_path / "tokens.db"))
+    yield store
+    store.close()
+
+
+def test_database_is_private(store):
+    assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o600
+
+
+def test_agent_round_trip_is_keyed_by_metadata(store):
+    store.put_agent("bot", {"team": "a", "env": "prod"}, {"id": "agent123"})
+    assert store.get_agent("bot", {"env": "prod", "team": "a"}) == {"id": "agent123"}
+    assert store.get_agent("bot", {"team": "b"}) is None
+    assert store.get_agent("bot") is None
+
+
+def test_token_round_trip_and_skew(store):
+    token = make_token()
+    assert scopes_key(["b", "a", "a"]) == "a b"
+    assert store.put_token("agent123", ["read", "write"], token)
+    assert store.get_token("agent123", ["write", "read"]) == token
+    assert store.get_token("agent123", ["read"]) is None
+
+    assert not store.put_token("agent123", ["read"], make_token(ttl=10))
+    assert not store.put_token("agent123", ["read"], "not-a-jwt")
+
+    store.delete_token("agent123")
+    assert store.get_token("agent123", ["read", "write"]) is None
+
+
+def test_expired_tokens_are_ignored_and_purged(tmp_path):
+    now = [time.time()]
+    store = SQLiteTokenStore(str(tmp_path / "tokens.db"), skew=0, clock=lambda: now[0])
+    store.put_token("agent123", ["read"], make_token(ttl=60))
+    now[0] += 61
+    assert store.get_token("agent123", ["read"]) is None
+    assert store.purge_expired() == 1
+
+
+def test_tokens_are_encrypted_at_rest(tmp_path):
+    fernet = pytest.importorskip("cryptography.fernet")
+    key = fernet.Fernet.generate_key()
+    path = str(tmp_path / "tokens.db")
+    token = make_token()
+
+    SQLiteTokenStore(path, encryption_key=key).put_token("agent123", ["read"], token)
+    with open(path, "rb") as f:
+        assert token.encode() not in f.read()
+    assert SQLiteTokenStore(path, encryption_key=key).get_token("agent123", ["read"]) == token
+    assert SQLiteTokenStore(path, encryption_key=fernet.Fernet.generate_key()).get_token("agent123", ["read"]) is None
+
+
+def test_encryption_key_mismatch_is_refused_both_ways(tmp_path, caplog):
+    fernet = pytest.importorskip("cryptography.fernet")
+    key = fernet.Fernet.generate_key()
+    token = make_token()
+
+    encrypted_path = str(tmp_path / "encrypted.db")
+    SQLiteTokenStore(encrypted_path, encryption_key=key).put_token("agent123", ["read"], token)
+    assert SQLiteTokenStore(encrypted_path).get_token("agent123", ["read"]) is None
+
+    plain_path = str(tmp_path / "plain.db")
+    SQLiteTokenStore(plain_path).put_token("agent123", ["read"], token)
+    assert SQLiteTokenStore(plain_path, encryption_key=key).get_token("agent123", ["read"]) is None
+    assert SQLiteTokenStore(plain_path).get_token("agent123", ["read"]) == token
+
+    assert "no key is set" in caplog.text
+    assert "not encrypted" in caplog.text
+
+
+def test_lock_serializes_threads(store):
+    active, overlaps = [], []
+
+    def worker():
+        with store.lock("token:agent123:read"):
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.01)
+            active.pop()
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert overlaps == [1] * 5
+
+
+def test_clients_share_identity_and_tokens_through_the_store(store):
+    token = make_token()
+    config = SpokeAgentConfig(base_url="http://api", api_key="key", token_store=store)
+
+    with requests_mock.Mocker() as m:
+        register = m.post("http://api/api/agents/register", json={"id": "agent123"})
+        issue = m.post("http://api/api/agents/token", json={"token": token})
+
+        first = SpokeAgentClient(config)
+        agent = first.register_agent("bot", metadata={"team": "a"})
+        first.get_token(agent["id"], ["read"])
+
+        second = SpokeAgentClient(config)
+        assert second.register_agent("bot", metadata={"team": "a"}) == {"id": "agent123"}
+        assert second.get_token("agent123", ["read"]) == token
+        assert register.call_count == 1
+        assert issue.call_count == 1
+
+        second.get_token("agent123", ["read"], force_refresh=True)
+        assert issue.call_count == 2
+
+
+def test_async_client_reads_the_store(store):
+    token = make_token()
+    store.put_agent("bot", None, {"id": "agent123"})
+    store.put_token("agent123", ["read"], token)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError(f"unexpected request to {request.url}")
+
+    config = SpokeAgentConfig(base_url="http://api", api_key="key", token_store=store)
+
+    async def flow():
+        async with AsyncSpokeAgentClient(config, transport=httpx.MockTransport(handler)) as client:
+            agent = await client.register_agent("bot")
+            return await client.get_token(agent["id"], ["read"])
+
+    assert asyncio.run(flow()) == token
+
+
+def test_try_acquire_does_not_wait(store):
+    assert store.try_acquire("agent:bot")
+    results = []
+    worker = threading.Thread(target=lambda: results.append(store.try_acquire("agent:bot")))
+    worker.start()
+    worker.join()
+    assert results == [False]
+    store.release("agent:bot")
+    assert store.try_acquire("agent:bot")
+    store.release("agent:bot")
+
+
+def test_async_concurrent_registrations_do_not_exhaust_the_executor(store):
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": "agent123"})
+
+    config = SpokeAgentConfig(base_url="http://api", api_key="key", token_store=store)
+
+    async def flow():
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=2))
+        async with AsyncSpokeAgentClient(config, transport=httpx.MockTransport(handler)) as client:
+            return await asyncio.wait_for(
+                asyncio.gather(*(client.register_agent("bot") for _ in range(8))), timeout=5
+            )
+
+    assert asyncio.run(flow()) == [{"id": "agent123"}] * 8
+    assert calls == ["/api/agents/register"]
+
+
+def test_cancelled_async_lock_wait_does_not_leak_the_lock(store):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": "agent123"})
+
+    config = SpokeAgentConfig(base_url="http://api", api_key="key", token_store=store)
+    store.acquire("agent:bot")
+
+    async def flow():
+        async with AsyncSpokeAgentClient(config, transport=httpx.MockTransport(handler)) as client:
+            waiter = asyncio.ensure_future(client.register_agent("bot"))
+            await asyncio.sleep(0.05)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            store.release("agent:bot")
+            return await asyncio.wait_for(client.register_agent("bot"), timeout=5)
+
+    assert asyncio.run(flow()) == {"id": "agent123"}
+    assert store.try_acquire("agent:bot")
+    store.release("agent:bot")
+
+
+def test_sync_lock_wait_respects_the_deadline(store):
+    config = SpokeAgentConfig(base_url="http://api", api_key="key", token_store=store)
+    holder = threading.Thread(target=store.acquire, args=("agent:bot",))
+    holder.start()
+    holder.join()
+
+    with requests_mock.Mocker() as m:
+        register = m.post("http://api/api/agents/register", json={"id": "agent123"})
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            SpokeAgentClient(config).register_agent("bot", deadline=0.2)
+        assert time.monotonic() - started < 1
+        assert register.call_count == 0
+
+
+def test_partial_store_subclass_fails_at_construction():
+    class PartialStore(TokenStore):
+        def get_agent(self, name, metadata=None):
+            return None
+
+    with pytest.raises(TypeError):
+        PartialStore()
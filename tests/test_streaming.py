@@ -0,0 +1,76 @@
+import asyncio
+import io
+
+import httpx
+import pytest
+import requests_mock
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.async_client import AsyncSpokeAgentClient
+from spokeagent_sdk.errors import APIRequestError
+
+NDJSON_BODY = b'{"id": 1}\n{"id": 2}\n\n{"id": 3}\n'
+
+
+@pytest.fixture
+def mock_config():
+    return SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key")
+
+
+@pytest.fixture
+def client(mock_config):
+    client = SpokeAgentClient(mock_config)
+    client.token = "abc123"
+    return client
+
+
+def test_stream_chunks(client):
+    with requests_mock.Mocker() as m:
+        m.get("http://localhost:8000/api/export", body=io.BytesIO(b"x" * 10))
+        chunks = list(client.stream_api("/api/export", chunk_size=4))
+
+    assert chunks == [b"xxxx", b"xxxx", b"xx"]
+
+
+def test_stream_lines_and_ndjson(client):
+    with requests_mock.Mocker() as m:
+        m.get("http://localhost:8000/api/export", body=io.BytesIO(NDJSON_BODY))
+        assert list(client.stream_api("/api/export", mode="ndjson")) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+        m.get("http://localhost:8000/api/export", body=io.BytesIO(b"first\nsecond\n"))
+        assert list(client.stream_api("/api/export", mode="lines")) == ["first", "second"]
+
+
+def test_stream_is_lazy_and_raises_on_first_next(client):
+    with requests_mock.Mocker() as m:
+        m.get("http://localhost:8000/api/export", status_code=404)
+
+        stream = client.stream_api("/api/export")
+        assert m.call_count == 0
+        with pytest.raises(APIRequestError):
+            next(stream)
+
+
+def test_stream_rejects_unknown_mode(client):
+    with pytest.raises(ValueError):
+        client.stream_api("/api/export", mode="xml")
+
+
+def test_stream_bad_ndjson_raises(client):
+    with requests_mock.Mocker() as m:
+        m.get("http://localhost:8000/api/export", body=io.BytesIO(b'{"id": 1}\nnot json\n'))
+        stream = client.stream_api("/api/export", mode="ndjson")
+        assert next(stream) == {"id": 1}
+        with pytest.raises(APIRequestError):
+            next(stream)
+
+
+def test_async_stream_ndjson(mock_config):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=NDJSON_BODY))
+
+    async def flow():
+        async with AsyncSpokeAgentClient(mock_config, transport=transport) as client:
+            client.token = "abc123"
+            return [record async for record in client.stream_api("/api/export", mode="ndjson")]
+
+    assert asyncio.run(flow()) == [{"id": 1}, {"id": 2}, {"id": 3}]
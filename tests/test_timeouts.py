@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+import requests
+import requests_mock
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.errors import DeadlineExceededError, RequestTimeoutError
+from spokeagent_sdk.retry import RetryPolicy
+from spokeagent_sdk.timeouts import Deadline, resolve_timeout
+from tests.helpers import FakeClock
+
+
+def make_client(**config_kwargs):
+    config = SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key", **config_kwargs)
+    client = SpokeAgentClient(config)
+    client.token = "abc123"
+    return client
+
+
+def test_resolve_timeout_forms():
+    assert resolve_timeout(None, 2, 10) == (2, 10)
+    assert resolve_timeout(3, 2, 10) == (3.0, 3.0)
+    assert resolve_timeout((1, 4), 2, 10) == (1.0, 4.0)
+
+
+def test_deadline_clamps_and_expires():
+    clock = FakeClock()
+    deadline = Deadline(5, clock=clock)
+    assert deadline.clamp((2, 30)) == (2, 5)
+
+    clock.now = 6
+    assert deadline.expired
+    assert deadline.remaining() == 0
+    with pytest.raises(DeadlineExceededError):
+        deadline.check("API call failed")
+    with pytest.raises(DeadlineExceededError):
+        deadline.clamp((2, 30))
+
+
+def test_configured_and_per_call_timeouts_are_sent():
+    client = make_client(connect_timeout=1.5, read_timeout=7)
+    with requests_mock.Mocker() as m:
+        m.get("http://localhost:8000/secure/data", json={})
+
+        client.call_api("/secure/data")
+        client.call_api("/secure/data", timeout=(0.5, 2))
+
+        assert [r.timeout for r in m.request_history] == [(1.5, 7), (0.5, 2)]
+
+
+def test_read_timeout_raises_distinct_error():
+    client = make_client(retry_policy=None)
+    with requests_mock.Mocker() as m:
+        m.get("http://localhost:8000/secure/data", exc=requests.ReadTimeout("slow upstream"))
+
+        with pytest.raises(RequestTimeoutError) as excinfo:
+            client.call_api("/secure/data")
+
+    assert not isinstance(excinfo.value, DeadlineExceededError)
+
+
+def test_deadline_bounds_retries():
+    clock = FakeClock()
+    client = make_client(retry_policy=RetryPolicy(max_attempts=5, rng=lambda: 1.0))
+
+    def slow(request, context):
+        clock.now += 0.6
+        raise requests.ReadTimeout("slow upstream")
+
+    with requests_mock.Mocker() as m:
+        m.get("http://localhost:8000/secure/data", json=slow)
+
+        with pytest.raises(DeadlineExceededError) as excinfo:
+            client.call_api("/secure/data", deadline=Deadline(1.0, clock=clock))
+
+        # The second attempt runs out the budget; no further retries are made.
+        assert m.call_count == 2
+        assert [r.timeout for r in m.request_history] == [(1.0, 1.0), (pytest.approx(0.4), pytest.approx(0.4))]
+    assert excinfo.value.attempts == 2
+
+
+def test_expired_deadline_fails_before_sending():
+    clock = FakeClock()
+    deadline = Deadline(1.0, clock=clock)
+    clock.now = 2
+    client = make_client()
+    with requests_mock.Mocker() as m:
+        with pytest.raises(DeadlineExceededError):
+            client.call_api("/secure/data", deadline=deadline)
+        assert m.call_count == 0
+
+
+def test_coalesced_token_wait_respects_deadline():
+    client = make_client()
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_fetch(*args):
+        started.set()
+        release.wait()
+        return "opaque-token"
+
+    client._fetch_token = slow_fetch
+    leader = threading.Thread(target=client.get_token, args=("agent123", ["read:data"]))
+    leader.start()
+    started.wait()
+    try:
+        with pytest.raises(DeadlineExceededError):
+            client.get_token("agent123", ["read:data"], deadline=0.05)
+    finally:
+        release.set()
+        leader.join()
@@ -0,0 +1,67 @@
+import requests_mock
+
+from spokeagent_sdk import SpokeAgentClient, SpokeAgentConfig
+from spokeagent_sdk.token_cache import TokenCache
+from tests.helpers import FakeClock, generate_jwt
+
+
+def test_cache_hit_ignores_scope_order_and_duplicates():
+    cache = TokenCache(maxsize=4, skew=0, clock=FakeClock(1_000_000.0))
+    token = generate_jwt({"exp": 1_000_100})
+
+    assert cache.put("agent1", ["write:logs", "read:data"], token)
+    assert cache.get("agent1", ["read:data", "write:logs", "read:data"]) == token
+    assert cache.stats()["hits"] == 1
+
+
+def test_cache_expires_with_skew():
+    clock = FakeClock(1_000_000.0)
+    cache = TokenCache(maxsize=4, skew=30, clock=clock)
+    cache.put("agent1", ["read:data"], generate_jwt({"exp": 1_000_100}))
+
+    clock.now = 1_000_069
+    assert cache.get("agent1", ["read:data"]) is not None
+    clock.now = 1_000_070
+    assert cache.get("agent1", ["read:data"]) is None
+    assert cache.stats()["misses"] == 1
+    assert len(cache) == 0
+
+
+def test_cache_skips_tokens_without_expiry():
+    cache = TokenCache(maxsize=4, clock=FakeClock(1_000_000.0))
+    assert cache.put("agent1", ["read:data"], "opaque-token") is False
+    assert cache.get("agent1", ["read:data"]) is None
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TokenCache(maxsize=2, skew=0, clock=FakeClock(1_000_000.0))
+    token = generate_jwt({"exp": 1_000_100})
+    cache.put("agent1", ["a"], token)
+    cache.put("agent2", ["a"], token)
+    cache.get("agent1", ["a"])
+    cache.put("agent3", ["a"], token)
+
+    assert cache.get("agent2", ["a"]) is None
+    assert cache.get("agent1", ["a"]) == token
+    assert cache.stats()["evictions"] == 1
+
+
+def test_client_get_token_uses_cache():
+    client = SpokeAgentClient(SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key"))
+    token = generate_jwt({"exp": 9999999999})
+
+    with requests_mock.Mocker() as m:
+        m.post("http://localhost:8000/api/agents/token", json={"token": token})
+
+        assert client.get_token("agent123", ["read:data"]) == token
+        assert client.get_token("agent123", ["read:data"]) == token
+        assert m.call_count == 1
+
+        client.get_token("agent123", ["read:data"], force_refresh=True)
+        assert m.call_count == 2
+
+
+def test_client_cache_can_be_disabled():
+    config = SpokeAgentConfig(base_url="http://localhost:8000", api_key="fake-api-key", token_cache_size=0)
+    client = SpokeAgentClient(config)
+    assert client.token_cache is None
@@ -1,7 +1,11 @@
 import pytest
 import base64
 import json
-from spokeagent_sdk.utils import decode_jwt_segment, safe_get, redact_token
+from types import MappingProxyType
+
+from requests.structures import CaseInsensitiveDict
+
+from spokeagent_sdk.utils import compile_path, decode_jwt_segment, project, safe_get, redact_token
 
 
 def test_decode_jwt_segment_valid():
@@ -51,3 +55,43 @@ def test_redact_token_short_token():
     token = "123"
     redacted = redact_token(token)
     assert redacted == "****"
+
+
+def test_safe_get_list_indices_and_wildcards():
+    data = {"items": [{"id": 1, "tags": ["a"]}, {"id": 2, "tags": ["b", "c"]}], "meta": {"x": {"n": 1}, "y": {"n": 2}}}
+    assert safe_get(data, "items[0].id") == 1
+    assert safe_get(data, "items[-1].tags[1]") == "c"
+    assert safe_get(data, "items.1.id") == 2
+    assert safe_get(data, "items[5].id", default="none") == "none"
+    assert safe_get(data, "items[*].id") == [1, 2]
+    assert safe_get(data, "items[*].tags[*]") == ["a", "b", "c"]
+    assert safe_get(data, "meta.*.n") == [1, 2]
+    assert safe_get(data, "items[x]", default="bad") == "bad"
+
+
+def test_safe_get_supports_mapping_and_sequence_types():
+    headers = CaseInsensitiveDict({"X-Meta": {"Owner": "alice"}})
+    assert safe_get(headers, "x-meta.Owner") == "alice"
+    assert safe_get(MappingProxyType({"a": (10, 20)}), "a[1]") == 20
+    assert safe_get(MappingProxyType({"a": {"b": 1}, "c": {"b": 2}}), "*.b") == [1, 2]
+    assert safe_get({"name": "bob"}, "name[0]", default="none") == "none"
+
+
+def test_safe_get_prefers_literal_keys():
+    assert safe_get({"*": 1}, "*") == 1
+    assert safe_get({"tags[0]": "literal", "tags": ["indexed"]}, "tags[0]") == "literal"
+    assert safe_get({"tags": ["indexed"]}, "tags[0]") == "indexed"
+    assert safe_get({"a": {"[x]": 3}}, "a.[x]") == 3
+
+
+def test_compile_path_is_cached_and_validates():
+    assert compile_path("a.b[0]") is compile_path("a.b[0]")
+    assert compile_path("a.b[0][*]").segments == ("a", "b", 0, "*")
+    for bad in ("", ".a", "a..b", "a.", "a[x]"):
+        with pytest.raises(ValueError):
+            compile_path(bad)
+
+
+def test_project():
+    data = {"a": {"b": 1}, "c": [{"d": 2}]}
+    assert project(data, ["a.b", "c[*].d", "missing"]) == {"a.b": 1, "c[*].d": [2], "missing": None}
@@ -0,0 +1,161 @@
+import base64
+import hashlib
+import hmac
+import json
+
+import pytest
+
+from spokeagent_sdk.errors import TokenVerificationError
+from spokeagent_sdk.verify import JWTVerifier, KeySet, parse_jwk
+
+SECRET = b"top-secret"
+NOW = 1_700_000_000
+
+
+def b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def sign_hs256(claims: dict, secret: bytes = SECRET, kid=None, alg="HS256") -> str:
+    header = {"alg": alg, "typ": "JWT"}
+    if kid:
+        header["kid"] = kid
+    signing_input = f"{b64(json.dumps(header).encode())}.{b64(json.dumps(claims).encode())}"
+    signature = hmac.new(secret, signing_input.encode("ascii"), hashlib.sha256).digest()
+    return f"{signing_input}.{b64(signature)}"
+
+
+def make_verifier(**kwargs) -> JWTVerifier:
+    kwargs.setdefault("clock", lambda: NOW)
+    return JWTVerifier(KeySet.from_secret(SECRET), **kwargs)
+
+
+def test_valid_token_returns_claims():
+    claims = {"sub": "agent123", "exp": NOW + 60, "aud": ["reports-api"], "iss": "authspoke"}
+    verifier = make_verifier(audience="reports-api", issuer="authspoke")
+    assert verifier.verify(sign_hs256(claims)) == claims
+
+
+@pytest.mark.parametrize("claims, message", [
+    ({"exp": NOW - 1}, "expired"),
+    ({"exp": NOW + 60, "nbf": NOW + 30}, "not yet valid"),
+    ({"exp": NOW + 60, "iat": NOW + 30}, "future"),
+    ({"sub": "agent123"}, "Missing required claim: exp"),
+    ({"exp": NOW + 60, "aud": "other-api"}, "audience"),
+    ({"exp": NOW + 60, "aud": "reports-api", "iss": "someone-else"}, "issuer"),
+])
+def test_claim_checks(claims, message):
+    verifier = make_verifier(audience="reports-api" if "aud" in claims else None,
+                             issuer="authspoke" if "iss" in claims else None)
+    with pytest.raises(TokenVerificationError, match=message):
+        verifier.verify(sign_hs256(claims))
+
+
+def test_leeway_tolerates_clock_skew():
+    verifier = make_verifier(leeway=10)
+    verifier.verify(sign_hs256({"exp": NOW - 5, "nbf": NOW + 5}))
+
+
+def test_rejects_bad_signature_none_alg_and_malformed_tokens():
+    verifier = make_verifier()
+    with pytest.raises(TokenVerificationError, match="Invalid signature"):
+        verifier.verify(sign_hs256({"exp": NOW + 60}, secret=b"wrong"))
+    unsigned = f"{b64(json.dumps({'alg': 'none'}).encode())}.{b64(json.dumps({'exp': NOW + 60}).encode())}."
+    with pytest.raises(TokenVerificationError, match="not allowed"):
+        verifier.verify(unsigned)
+    with pytest.raises(TokenVerificationError, match="Malformed"):
+        verifier.verify("not-a-jwt")
+
+
+
+@pytest.mark.parametrize("header", [{"alg": ["HS256"]}, {"alg": {"x": 1}}, {"alg": "HS256", "kid": ["k1"]}])
+def test_rejects_non_string_alg_and_kid(header):
+    signing_input = f"{b64(json.dumps(header).encode())}.{b64(json.dumps({'exp': NOW + 60}).encode())}"
+    with pytest.raises(TokenVerificationError):
+        make_verifier().verify(f"{signing_input}.{b64(b'sig')}")
+
+
+@pytest.mark.parametrize("claims", [{"exp": None}, {"exp": NOW + 60, "nbf": None}, {"exp": NOW + 60, "iat": None}])
+def test_null_time_claims_are_rejected(claims):
+    with pytest.raises(TokenVerificationError, match="must be a number"):
+        make_verifier().verify(sign_hs256(claims))
+
+def test_successful_verifications_are_memoized_until_expiry():
+    clock = [NOW]
+    verifier = make_verifier(clock=lambda: clock[0])
+    token = sign_hs256({"exp": NOW + 60})
+
+    with pytest.MonkeyPatch.context() as mp:
+        calls = []
+        original = verifier._verify_uncached
+        mp.setattr(verifier, "_verify_uncached", lambda *args: calls.append(1) or original(*args))
+        verifier.verify(token)
+        verifier.verify(token)
+        assert len(calls) == 1
+
+        clock[0] = NOW + 60
+        with pytest.raises(TokenVerificationError, match="expired"):
+            verifier.verify(token)
+        assert len(calls) == 2
+
+
+def test_key_set_refreshes_on_unknown_kid_and_periodically():
+    clock = [0.0]
+    documents = [
+        {"keys": [{"kty": "oct", "kid": "v1", "k": b64(b"old-secret")}]},
+        {"keys": [{"kty": "oct", "kid": "v1", "k": b64(b"old-secret")},
+                  {"kty": "oct", "kid": "v2", "k": b64(SECRET)}]},
+    ]
+    key_set = KeySet(loader=lambda: documents[min(key_set.refreshes, 1)], refresh_interval=300,
+                     min_refresh_interval=30, clock=lambda: clock[0])
+    verifier = JWTVerifier(key_set, clock=lambda: NOW)
+    token = sign_hs256({"exp": NOW + 60}, kid="v2")
+
+    with pytest.raises(TokenVerificationError, match="No key found"):
+        verifier.verify(token)
+    assert key_set.refreshes == 1
+
+    clock[0] = 31
+    assert verifier.verify(token)["exp"] == NOW + 60
+    assert key_set.refreshes == 2
+
+    key_set.keys()
+    assert key_set.refreshes == 2
+    clock[0] = 400
+    key_set.keys()
+    assert key_set.refreshes == 3
+
+
+def test_failed_refresh_keeps_previous_keys():
+    def loader():
+        if key_set.refreshes:
+            raise ConnectionError("down")
+        return [{"kty": "oct", "k": b64(SECRET)}]
+
+    clock = [0.0]
+    key_set = KeySet(loader=loader, refresh_interval=10, clock=lambda: clock[0])
+    verifier = JWTVerifier(key_set, clock=lambda: NOW, cache_size=0)
+    verifier.verify(sign_hs256({"exp": NOW + 60}))
+    clock[0] = 100
+    verifier.verify(sign_hs256({"exp": NOW + 61}))
+    assert len(key_set.keys()) == 1
+
+
+def test_rs256_with_cryptography():
+    pytest.importorskip("cryptography")
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    numbers = private_key.public_key().public_numbers()
+    jwk = {
+        "kty": "RSA", "kid": "rsa1",
+        "n": b64(numbers.n.to_bytes((numbers.n.bit_length() + 7) // 8, "big")),
+        "e": b64(numbers.e.to_bytes(3, "big")),
+    }
+    header = b64(json.dumps({"alg": "RS256", "kid": "rsa1"}).encode())
+    payload = b64(json.dumps({"exp": NOW + 60}).encode())
+    signature = private_key.sign(f"{header}.{payload}".encode(), padding.PKCS1v15(), hashes.SHA256())
+
+    verifier = JWTVerifier(KeySet(keys=[parse_jwk(jwk)]), algorithms=["RS256"], clock=lambda: NOW)
+    assert verifier.verify(f"{header}.{payload}.{b64(signature)}") == {"exp": NOW + 60}